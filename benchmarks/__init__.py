@@ -0,0 +1,7 @@
+"""
+    Benchmarks Of The EDS Pipeline.
+
+    `synthetic` writes deterministic weather and plantings files in the schema of `notebook/info.csv`,
+    `run` times every stage on them and `golden` writes or checks the golden dataset of the reference
+    engine. Run `python -m benchmarks.run --help` from the repository root.
+"""
@@ -0,0 +1,99 @@
+"""
+    Golden Dataset Of The Reference Engine.
+
+    Writes a deterministic sample of the plantings of `notebook/info_selected.csv` (one per state),
+    synthetic weather for their locations and the reference results into `golden/`, or checks engines
+    against it:
+
+    python -m benchmarks.golden --write
+    python -m benchmarks.golden --engines reference array compiled batch
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from typing import List, Optional
+import pandas as pd
+import eds
+from .synthetic import weather_for_plantings
+
+
+GOLDEN_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "golden")
+
+SOURCE_PLANTINGS = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "notebook", "info_selected.csv"
+)
+
+
+def golden_plantings(
+    plantings_per_state: int = 1
+) -> pd.DataFrame:
+    """The First Plantings Of Every State Of `notebook/info_selected.csv`, In File Order."""
+
+    plantings = pd.read_csv(SOURCE_PLANTINGS)
+
+    return plantings.groupby("State", sort=False).head(plantings_per_state).reset_index(drop=True)
+
+
+def write_golden(
+    directory: str = GOLDEN_DIRECTORY,
+    seed: int = 0
+) -> pd.DataFrame:
+
+    plantings = golden_plantings()
+
+    with tempfile.TemporaryDirectory() as temporary:
+        weather_path = os.path.join(temporary, "weather.csv")
+        plantings_path = os.path.join(temporary, "plantings.csv")
+        weather_for_plantings(plantings, seed=seed).to_csv(weather_path, index=False)
+        plantings.to_csv(plantings_path, index=False)
+
+        return eds.write_golden_dataset(
+            directory,
+            weather_path,
+            plantings_path,
+            eds.CropParameters().crop_parameters_constant(),
+            eds.spray_application_parameters(),
+            eds.genetic_mechanistic_parameters(),
+        )
+
+
+def main(
+    argv: Optional[List[str]] = None
+) -> None:
+
+    parser = argparse.ArgumentParser(description="Write or check the golden dataset of the reference engine.")
+    parser.add_argument("--directory", default=GOLDEN_DIRECTORY)
+    parser.add_argument("--write", action="store_true", help="Regenerate the dataset with the reference engine.")
+    parser.add_argument("--engines", nargs="+", default=["reference"])
+    parser.add_argument("--atol", type=float, default=1e-12)
+    parser.add_argument("--rtol", type=float, default=1e-9)
+    args = parser.parse_args(argv)
+
+    if args.write:
+        results = write_golden(args.directory)
+        print(f"Wrote {len(results)} reference runs to {args.directory}.")
+        return
+
+    report = eds.check_golden_dataset(
+        args.directory,
+        eds.CropParameters().crop_parameters_constant(),
+        eds.spray_application_parameters(),
+        eds.genetic_mechanistic_parameters(),
+        engines=args.engines,
+        atol=args.atol,
+        rtol=args.rtol,
+        raise_on_failure=False,
+    )
+    summary = report.groupby("engine").agg(
+        comparisons=("locationId", "size"), max_abs=("max_abs", "max"), max_rel=("max_rel", "max"), passed=("passed", "all")
+    )
+    print(summary.to_string())
+
+    if not summary["passed"].all():
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,337 @@
+"""
+    Benchmark Runner.
+
+    Times every stage of the pipeline on synthetic inputs: data preparation, a single simulation per
+    engine, the full `calculation_crop_disease_severity` run per engine, and a scaling curve of the
+    full run over the number of locations. Each stage reports wall times over `repeat` runs and the
+    peak traced memory of one extra run. Results are written as JSON, and two result files can be
+    compared stage by stage. Memory tracing is slow; skip it with `--no-memory` for quick timings.
+
+    python -m benchmarks.run --locations 8 --output benchmark.json
+    python -m benchmarks.run --compare baseline.json benchmark.json
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+import numpy as np
+import pandas as pd
+import eds
+from eds.calculation_crop_disease_severity import ENGINES
+from .synthetic import write_synthetic_inputs
+
+
+RESULTS_VERSION = 1
+
+DRIVER_ENGINES = ["reference", "array", "compiled", "batch", "summary", "forked", "scenarios"]
+
+
+def measure(
+    function: Callable[[], object],
+    repeat: int = 3,
+    memory: bool = True
+) -> Dict:
+    """Wall Times Of `repeat` Calls Of `function`, And The Peak Traced Memory Of One More Call.
+
+    Memory Is Measured Separately Because Tracing Slows Allocations Down.
+
+    Returns:
+        Dict: `seconds` (Each Call), `best`, `median` And `peak_memory_bytes` (None Without `memory`).
+    """
+
+    seconds = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        seconds.append(time.perf_counter() - start)
+
+    peak = None
+    if memory:
+        tracemalloc.start()
+        try:
+            function()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "seconds": seconds,
+        "best": min(seconds),
+        "median": float(np.median(seconds)),
+        "peak_memory_bytes": peak,
+    }
+
+
+def _environment() -> Dict:
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "numba": eds.NUMBA_AVAILABLE,
+    }
+
+
+def _simulation_arguments(
+    weather_path: str,
+    plantings_path: str,
+    crop_parameters: Dict,
+    number_applications: int = 2,
+    genetic_mechanistic: str = "Susceptible"
+) -> Dict:
+    """Arguments Of One Simulation Of The First Planting, Built As `calculation_crop_disease_severity` Does."""
+
+    data = eds.field_data_preparation(weather_path, plantings_path, as_view=True, date_format=None)
+    df = data.planting(data.info_ids[0])
+    df = df[df["date"] >= pd.to_datetime(df["planting_date"].iloc[0]).normalize()].copy()
+    df["Day"] = (df["DOY"] - df["DOY"].iloc[0]).dt.days + 1
+
+    crop = df["Crop"].iloc[0]
+    spray_parameters = eds.spray_application_parameters()
+    genetic_mechanistic_parameters = eds.genetic_mechanistic_parameters()[genetic_mechanistic]
+
+    return dict(
+        weather_df=df,
+        ip_t_cof=crop_parameters[crop]["ip_t_cof"],
+        p_t_cof=crop_parameters[crop]["p_t_cof"],
+        rc_t_input=crop_parameters[crop]["rc_t_input"],
+        dvs_8_input=crop_parameters[crop]["dvs_8_input"],
+        rc_a_input=crop_parameters[crop]["rc_a_input"],
+        p_opt=genetic_mechanistic_parameters["p_opt"],
+        rrlex_par=genetic_mechanistic_parameters["rrlex_par"],
+        rc_opt_par=genetic_mechanistic_parameters["rc_opt_par"],
+        inocp=10,
+        ip_opt=14 if crop == "Corn" else 28,
+        GDU_treshhold=10 if crop == "Corn" else 14,
+        is_fungicide=number_applications > 0,
+        fungicide=spray_parameters[spray_parameters["spray_number"] <= number_applications],
+        fungicide_residual=crop_parameters[crop]["fungicide_residual"],
+        days_after_planting=df["obs_planting_delta"].iloc[0],
+    )
+
+
+def _driver(
+    weather_path: str,
+    plantings_path: str,
+    crop_parameters: Dict,
+    engine: str,
+    **kwargs
+) -> Callable[[], pd.DataFrame]:
+
+    return lambda: eds.calculation_crop_disease_severity(
+        weather_path,
+        plantings_path,
+        crop_parameters,
+        eds.spray_application_parameters(),
+        eds.genetic_mechanistic_parameters(),
+        engine=engine,
+        **kwargs
+    )
+
+
+def run_benchmarks(
+    directory: str,
+    n_locations: int = 8,
+    n_years: int = 1,
+    season_length: int = 120,
+    seed: int = 0,
+    engines: List[str] = DRIVER_ENGINES,
+    scaling: List[int] = [1, 2, 4, 8, 16],
+    scaling_engine: str = "array",
+    repeat: int = 3,
+    memory: bool = True
+) -> Dict:
+    """Run Every Benchmark Stage.
+
+    Args:
+        directory (str): Directory Of The Synthetic Inputs.
+        n_locations (int, optional): Locations Of The Stage Benchmarks. Defaults to 8.
+        n_years (int, optional): Planting Years Per Location. Defaults to 1.
+        season_length (int, optional): Mean Season Length (Days). Defaults to 120.
+        seed (int, optional): Seed Of The Synthetic Inputs. Defaults to 0.
+        engines (List[str], optional): Engines Of The Full Runs. Defaults to `DRIVER_ENGINES`.
+        scaling (List[int], optional): Location Counts Of The Scaling Curve. Defaults to [1, 2, 4, 8, 16].
+        scaling_engine (str, optional): Engine Of The Scaling Curve. Defaults to "array".
+        repeat (int, optional): Timed Runs Per Stage. Defaults to 3.
+        memory (bool, optional): Measure Peak Memory. Defaults to True.
+
+    Returns:
+        Dict: JSON-serializable Results.
+    """
+
+    crop_parameters = eds.CropParameters().crop_parameters_constant()
+    weather_path, plantings_path = write_synthetic_inputs(
+        os.path.join(directory, f"locations-{n_locations}"),
+        n_locations=n_locations, n_years=n_years, season_length=season_length, seed=seed
+    )
+    stages = {}
+
+    stages["prep"] = measure(
+        lambda: eds.field_data_preparation(weather_path, plantings_path), repeat=repeat, memory=memory
+    )
+    stages["prep/view"] = measure(
+        lambda: eds.field_data_preparation(weather_path, plantings_path, as_view=True, date_format=None),
+        repeat=repeat, memory=memory
+    )
+
+    arguments = _simulation_arguments(weather_path, plantings_path, crop_parameters)
+    for engine, estimate in ENGINES.items():
+        stages[f"simulation/{engine}"] = measure(lambda: estimate(**arguments), repeat=repeat, memory=memory)
+
+    for engine in engines:
+        stages[f"driver/{engine}"] = measure(
+            _driver(weather_path, plantings_path, crop_parameters, engine), repeat=repeat, memory=memory
+        )
+
+    curve = []
+    for size in scaling:
+        sized_weather, sized_plantings = write_synthetic_inputs(
+            os.path.join(directory, f"locations-{size}"),
+            n_locations=size, n_years=n_years, season_length=season_length, seed=seed
+        )
+        curve.append(
+            {
+                "locations": size,
+                **measure(
+                    _driver(sized_weather, sized_plantings, crop_parameters, scaling_engine),
+                    repeat=repeat, memory=memory
+                ),
+            }
+        )
+
+    # Slope of log(time) over log(locations); 1 is linear scaling.
+    exponent = None
+    if len(curve) > 1:
+        exponent = float(np.polyfit(
+            np.log([point["locations"] for point in curve]), np.log([point["best"] for point in curve]), 1
+        )[0])
+
+    return {
+        "version": RESULTS_VERSION,
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "environment": _environment(),
+        "config": {
+            "n_locations": n_locations,
+            "n_years": n_years,
+            "season_length": season_length,
+            "seed": seed,
+            "repeat": repeat,
+        },
+        "stages": stages,
+        "scaling": {"engine": scaling_engine, "curve": curve, "exponent": exponent},
+    }
+
+
+def compare_results(
+    baseline: Dict,
+    current: Dict
+) -> pd.DataFrame:
+    """Best Times And Peak Memory Of The Stages Of Two Result Files.
+
+    Returns:
+        pd.DataFrame: One Row Per Stage, With `speedup` = Baseline Time / Current Time.
+    """
+
+    rows = []
+
+    for stage in sorted(set(baseline["stages"]) | set(current["stages"])):
+        before = baseline["stages"].get(stage, {})
+        after = current["stages"].get(stage, {})
+        rows.append(
+            {
+                "stage": stage,
+                "baseline_seconds": before.get("best"),
+                "current_seconds": after.get("best"),
+                "baseline_peak_memory_bytes": before.get("peak_memory_bytes"),
+                "current_peak_memory_bytes": after.get("peak_memory_bytes"),
+            }
+        )
+
+    table = pd.DataFrame(rows)
+    table["speedup"] = table["baseline_seconds"] / table["current_seconds"]
+
+    return table
+
+
+def _summary(
+    results: Dict
+) -> pd.DataFrame:
+
+    table = pd.DataFrame.from_dict(results["stages"], orient="index")[["best", "median", "peak_memory_bytes"]]
+    table["peak_memory_mib"] = table.pop("peak_memory_bytes") / 2**20
+
+    return table
+
+
+def main(
+    argv: Optional[List[str]] = None
+) -> None:
+
+    parser = argparse.ArgumentParser(description="Benchmark the EDS pipeline on synthetic inputs.")
+    parser.add_argument("--locations", type=int, default=8)
+    parser.add_argument("--years", type=int, default=1)
+    parser.add_argument("--season-length", type=int, default=120)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--engines", nargs="+", default=DRIVER_ENGINES)
+    parser.add_argument("--scaling", nargs="*", type=int, default=[1, 2, 4, 8, 16])
+    parser.add_argument("--scaling-engine", default="array")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-memory", action="store_true", help="Skip the peak memory runs.")
+    parser.add_argument("--directory", help="Directory of the synthetic inputs. Defaults to a temporary one.")
+    parser.add_argument("--output", help="JSON results file.")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CURRENT"), help="Compare two results files.")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        results = []
+        for path in args.compare:
+            with open(path, encoding="utf-8") as f:
+                results.append(json.load(f))
+        print(compare_results(*results).to_string(index=False))
+        return
+
+    with tempfile.TemporaryDirectory() as temporary:
+        results = run_benchmarks(
+            args.directory or temporary,
+            n_locations=args.locations,
+            n_years=args.years,
+            season_length=args.season_length,
+            seed=args.seed,
+            engines=args.engines,
+            scaling=args.scaling,
+            scaling_engine=args.scaling_engine,
+            repeat=args.repeat,
+            memory=not args.no_memory,
+        )
+
+    print(_summary(results).to_string())
+    print("scaling exponent ({}): {}".format(results["scaling"]["engine"], results["scaling"]["exponent"]))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
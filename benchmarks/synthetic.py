@@ -0,0 +1,208 @@
+"""
+    Synthetic Benchmark Inputs.
+
+    Weather and plantings files in the schema the pipeline reads, generated from a seed. Every
+    location draws from its own generator seeded with (seed, location), so growing `n_locations`
+    keeps the data of the existing locations unchanged and scaling runs compare like with like.
+"""
+
+import datetime
+import os
+from typing import Tuple
+import numpy as np
+import pandas as pd
+
+
+# Grid of the locations, 0.25 degrees apart as in `notebook/info.csv`.
+_LATITUDE_START = 36.0
+_LONGITUDE_START = -96.0
+_GRID_STEP = 0.25
+_GRID_WIDTH = 48
+
+_PLANTING_DOY = (105, 140)
+_RAIN_PROBABILITY = 0.35
+
+
+def _location(
+    i: int
+) -> Tuple[str, float, float]:
+    """ID, Latitude And Longitude Of The `i`-th Location."""
+
+    latitude = _LATITUDE_START + _GRID_STEP * (i // _GRID_WIDTH)
+    longitude = _LONGITUDE_START + _GRID_STEP * (i % _GRID_WIDTH)
+
+    return f"ID_{latitude}_{longitude}", latitude, longitude
+
+
+def synthetic_plantings(
+    n_locations: int = 10,
+    n_years: int = 1,
+    season_length: int = 120,
+    seed: int = 0,
+    start_year: int = 2021
+) -> pd.DataFrame:
+    """One Planting Per Location And Year, In The Schema Of `notebook/info.csv`.
+
+    Args:
+        n_locations (int, optional): Number Of Locations. Defaults to 10.
+        n_years (int, optional): Planting Years Per Location, From `start_year`. Defaults to 1.
+        season_length (int, optional): Mean `obs_planting_delta` (Days). Defaults to 120.
+        seed (int, optional): Seed. Defaults to 0.
+        start_year (int, optional): First Planting Year. Defaults to 2021.
+
+    Returns:
+        pd.DataFrame: Plantings.
+    """
+
+    rows = []
+
+    for i in range(n_locations):
+        id, latitude, longitude = _location(i)
+        rng = np.random.default_rng([seed, i, 1])
+
+        for year in range(start_year, start_year + n_years):
+            doy = int(rng.integers(_PLANTING_DOY[0], _PLANTING_DOY[1] + 1))
+            date = datetime.date(year, 1, 1) + datetime.timedelta(days=doy - 1)
+            rows.append(
+                {
+                    "ID": id,
+                    "Field": id.replace("ID_", "Field_", 1),
+                    "latitude": latitude,
+                    "longitude": longitude,
+                    "year": year,
+                    "Crop": "Corn" if rng.random() < 0.5 else "Soy",
+                    "planting_date": f"{date.month}/{date.day}/{date.year}",
+                    "obs_planting_delta": max(1, season_length + int(rng.integers(-5, 6))),
+                }
+            )
+
+    return pd.DataFrame(
+        rows,
+        columns=["ID", "Field", "latitude", "longitude", "year", "Crop", "planting_date", "obs_planting_delta"]
+    )
+
+
+def _location_weather(
+    id: str,
+    latitude: float,
+    longitude: float,
+    n_days: int,
+    rng: np.random.Generator
+) -> pd.DataFrame:
+    """Daily Weather Of One Location, `DOY` 1 To `n_days`."""
+
+    doy = np.arange(1, n_days + 1)
+    mean_temperature = (
+        14 - 0.6 * (latitude - _LATITUDE_START)
+        + 12 * np.sin(2 * np.pi * (doy - 105) / 365)
+        + rng.normal(0, 2.5, n_days)
+    )
+    daily_range = rng.uniform(8, 14, n_days)
+    rain = rng.random(n_days) < _RAIN_PROBABILITY
+
+    return pd.DataFrame(
+        {
+            "ID": id,
+            "latitude": latitude,
+            "longitude": longitude,
+            "DOY": doy,
+            "precipitation": np.where(rain, rng.gamma(0.8, 8, n_days), 0).round(2),
+            "maximum_temperature": (mean_temperature + daily_range / 2).round(2),
+            "minimum_temperature": (mean_temperature - daily_range / 2).round(2),
+            "wind_speed": rng.uniform(0, 8, n_days).round(2),
+        }
+    )
+
+
+def synthetic_weather(
+    n_locations: int = 10,
+    season_length: int = 120,
+    seed: int = 0
+) -> pd.DataFrame:
+    """Daily Weather Of Every Location, In The Schema Of The Weather File.
+
+    Temperatures Follow An Annual Cycle That Cools With Latitude, Plus Daily Noise; Rain Falls On About
+    A Third Of The Days. `DOY` Runs From 1 Over A Year, Or Longer If The Latest Season Needs It.
+
+    Args:
+        n_locations (int, optional): Number Of Locations. Defaults to 10.
+        season_length (int, optional): Mean Season Length (Days), See `synthetic_plantings`. Defaults to 120.
+        seed (int, optional): Seed. Defaults to 0.
+
+    Returns:
+        pd.DataFrame: Weather.
+    """
+
+    # Latest planting, longest season and the 3 days the model reads ahead.
+    n_days = max(365, _PLANTING_DOY[1] + season_length + 5 + 3)
+
+    return pd.concat(
+        [
+            _location_weather(*_location(i), n_days=n_days, rng=np.random.default_rng([seed, i, 0]))
+            for i in range(n_locations)
+        ],
+        ignore_index=True
+    )
+
+
+def weather_for_plantings(
+    plantings: pd.DataFrame,
+    seed: int = 0
+) -> pd.DataFrame:
+    """Synthetic Weather For The Locations Of An Existing Plantings File, E.g. `notebook/info_selected.csv`.
+
+    Args:
+        plantings (pd.DataFrame): Plantings, With `ID`, `latitude`, `longitude`, `planting_date` And
+            `obs_planting_delta` Columns.
+        seed (int, optional): Seed. Defaults to 0.
+
+    Returns:
+        pd.DataFrame: Weather Covering Every Season, Locations In Order Of First Appearance.
+    """
+
+    planting_doy = pd.to_datetime(plantings["planting_date"]).dt.dayofyear
+    n_days = max(365, int((planting_doy + plantings["obs_planting_delta"]).max()) + 3)
+    locations = plantings.drop_duplicates("ID")
+
+    return pd.concat(
+        [
+            _location_weather(
+                location.ID, location.latitude, location.longitude,
+                n_days=n_days, rng=np.random.default_rng([seed, i, 0])
+            )
+            for i, location in enumerate(locations.itertuples(index=False))
+        ],
+        ignore_index=True
+    )
+
+
+def write_synthetic_inputs(
+    directory: str,
+    n_locations: int = 10,
+    n_years: int = 1,
+    season_length: int = 120,
+    seed: int = 0
+) -> Tuple[str, str]:
+    """Write `weather.csv` And `plantings.csv` Into `directory`.
+
+    Args:
+        directory (str): Output Directory. Created If Missing.
+        n_locations (int, optional): Number Of Locations. Defaults to 10.
+        n_years (int, optional): Planting Years Per Location. Defaults to 1.
+        season_length (int, optional): Mean Season Length (Days). Defaults to 120.
+        seed (int, optional): Seed. Defaults to 0.
+
+    Returns:
+        Tuple[str, str]: Paths Of The Weather And Plantings Files.
+    """
+
+    os.makedirs(directory, exist_ok=True)
+    weather_path = os.path.join(directory, "weather.csv")
+    plantings_path = os.path.join(directory, "plantings.csv")
+
+    synthetic_weather(n_locations, season_length=season_length, seed=seed).to_csv(weather_path, index=False)
+    synthetic_plantings(
+        n_locations, n_years=n_years, season_length=season_length, seed=seed
+    ).to_csv(plantings_path, index=False)
+
+    return weather_path, plantings_path
@@ -1,6 +1,16 @@
 from .utils import *
+from .parameter_registry import *
 from .estimate_disease_severity import *
+from .estimate_disease_severity_array import *
+from .estimate_disease_severity_compiled import *
+from .estimate_disease_severity_vectorized import *
+from .instrumentation import *
 from .field_data_preparation import *
 from .calculation_crop_disease_severity import *
+from .conformance import *
+from .calibration import *
+from .result_sinks import *
+from .reducers import *
+from .trajectory_store import *
 
 __version__ = "0.1"
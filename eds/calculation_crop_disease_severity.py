@@ -4,39 +4,394 @@
 
 import itertools
 import math
-from typing import Dict, List, Optional, Tuple, Union
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 import numpy as np
 import pandas as pd
+from .columnar import ColumnarFrame, write_columnar
 from .estimate_disease_severity import estimate_disease_severity
-from .field_data_preparation import field_data_preparation
+from .estimate_disease_severity_array import (
+    estimate_disease_severity_array, estimate_disease_severity_forked, estimate_disease_severity_summary
+)
+from .estimate_disease_severity_compiled import estimate_disease_severity_compiled
+from .estimate_disease_severity_vectorized import (
+    estimate_disease_severity_scenarios, planting_weather_matrix,
+    scenario_parameters, season_metrics, simulate_disease_severity_batch
+)
+from .field_data_preparation import RepeatedYears, field_data_preparation
+from .incremental import IncrementalStore, planting_fingerprints
+from .instrumentation import Instrumentation, _instrumentation
+from .reducers import default_reducers
+from .trajectory_store import TrajectoryStore
+from . import utils
 
 
-def calculation_crop_disease_severity(
-    weather_df_path: str,
-    plantings_df_path: str,
+ENGINES = {
+    "reference": estimate_disease_severity,
+    "array": estimate_disease_severity_array,
+    "compiled": estimate_disease_severity_compiled,
+}
+
+
+def _result_location(
+    id: str,
+    df: pd.DataFrame,
+    sev: Optional[np.ndarray],
+    n_day: int,
+    number_applications: int,
+    genetic_mechanistic: str,
+    metrics: Optional[Dict[str, float]] = None
+) -> Dict:
+    """Summary Row Of One Simulation.
+
+    Args:
+        id (str): Planting `info_id`.
+        df (pd.DataFrame): Weather Dataset The Simulation Ran On, With A datetime64 `date` Column.
+        sev (np.ndarray): Daily Disease Severity. Not Used With `metrics`.
+        n_day (int): Final Day After Planting Of Model.
+        number_applications (int): Number Of Fungicide Applications.
+        genetic_mechanistic (str): Resistance Class.
+        metrics (Dict[str, float], optional): Precomputed Metrics, E.g. From
+            `estimate_disease_severity_summary`, Instead Of Reducing `sev`. Defaults to None.
+
+    Returns:
+        Dict: Output information.
+    """
+
+    start_date = df["date"].iloc[0]
+    end_date = df["date"].iloc[n_day - 1]
+    result_location = {}
+    result_location["locationId"] = id
+    result_location["Date1"] = start_date.strftime("%Y%m%d")
+    result_location["Date2"] = end_date.strftime("%Y%m%d")
+    result_location["N_Days"] = (end_date - start_date).days
+    result_location["latitude"] = df["latitude"].iloc[0]
+    result_location["longitude"] = df["longitude"].iloc[0]
+
+    if metrics is not None:
+        result_location.update(metrics)
+    else:
+        result_location["Sev50%"] = np.nanmedian(sev)
+        result_location["SevMAX"] = np.nanmax(sev)
+        nonzero_sev = sev[sev != 0]
+
+        if len(nonzero_sev):
+            result_location["AUC"] = np.trapz(nonzero_sev)
+        else:
+            result_location["AUC"] = 0
+
+    result_location["number_applications"] = number_applications
+    result_location["genetic_mechanistic"] = genetic_mechanistic
+    result_location["crop"] = df["Crop"].unique()[0]
+
+    return result_location
+
+
+def _iter_batch_results(
+    data: Union[pd.DataFrame, RepeatedYears],
     crop_parameters: Dict,
     spray_parameters: pd.DataFrame,
     genetic_mechanistic_parameters: Dict,
-    number_of_repeat_years: int = 1,
-    daily_precip_threshold: float = 2,
-    number_applications_list: List[int] = [0, 1, 2, 3],
-    genetic_mechanistic_list: List[str] = ["Susceptible", "Moderate", "Resistant"],
-    output_columns: List[str] = ["Sev50%", "SevMAX", "AUC"]
-):
+    number_applications_list: List[int],
+    genetic_mechanistic_list: List[str],
+    batch_size: int = 2048,
+    instrumentation: Optional[Instrumentation] = None
+) -> Iterator[Tuple[int, Dict]]:
+    """Simulate Every Planting And Scenario In Lockstep Over (runs, days) Arrays.
 
-    all_results = []
+    Args:
+        data (Union[pd.DataFrame, RepeatedYears]): Location Data, See `field_data_preparation`.
+        crop_parameters (Dict): Crop Parameters Keyed By Crop Name.
+        spray_parameters (pd.DataFrame): Spray Application Parameters.
+        genetic_mechanistic_parameters (Dict): Genetic Mechanistic Parameters.
+        number_applications_list (List[int]): Numbers Of Fungicide Applications.
+        genetic_mechanistic_list (List[str]): Resistance Classes.
+        batch_size (int, optional): Plantings Advanced Together. Defaults to 2048.
+        instrumentation (Instrumentation, optional): Records The "driver/simulation" Stage And The
+            `scenarios_run`, `simulated_days` And `plantings_skipped` Counters. Defaults to None.
 
-    data = field_data_preparation(
-        weather_df_path=weather_df_path,
-        plantings_df_path=plantings_df_path,
-        number_of_repeat_years=number_of_repeat_years,
-        daily_precip_threshold=daily_precip_threshold
+    Yields:
+        Tuple[int, Dict]: Planting Number And Output information, One Batch At A Time.
+    """
+
+    instrumentation = _instrumentation(instrumentation)
+
+    plantings, weather = planting_weather_matrix(data)
+    scenarios, vectors = scenario_parameters(
+        spray_parameters=spray_parameters,
+        genetic_mechanistic_parameters=genetic_mechanistic_parameters,
+        number_applications_list=number_applications_list,
+        genetic_mechanistic_list=genetic_mechanistic_list,
     )
+    n_scenarios = len(scenarios)
+    rc_w = utils.calculate_antecedent_precipitation_conditions_scores(weather["precip_occur"])
+
+    for i in np.flatnonzero(plantings["total_days"].to_numpy() == 0):
+        instrumentation.event("plantings_skipped", info_id=plantings["info_id"].iloc[i], reason="No dates in range.")
+
+    for crop, group in plantings[plantings["total_days"] > 0].groupby("Crop", sort=False):
+
+        tables = utils.CropLookupTables.from_crop_parameters(crop_parameters[crop])
+        ip_opt = 14 if crop == "Corn" else 28
+
+        for start in range(0, len(group), batch_size):
+
+            chunk = group.iloc[start:start + batch_size]
+            rows = chunk.index.to_numpy()
+            n_runs = len(rows) * n_scenarios
+            width = int(chunk["n_day"].max()) + 3
+
+            def runs(values: np.ndarray) -> np.ndarray:
+                return np.repeat(values[rows, :width], n_scenarios, axis=0)
+
+            def tiled(values: np.ndarray) -> np.ndarray:
+                return np.tile(values, (len(rows),) + (1,) * (values.ndim - 1))
+
+            temperature = runs(weather["Temperature"])
+            p_opt = tiled(vectors["p_opt"])
+            coefficients = tables.temperature_coefficients(temperature, ip_opt=ip_opt, p_opt=p_opt[:, None])
+
+            with instrumentation.stage("driver/simulation"):
+                field_results, _, n_day = simulate_disease_severity_batch(
+                    temperature=temperature,
+                    rc_w=runs(rc_w),
+                    precip=runs(weather["precip"]),
+                    ip_series=coefficients["ip"],
+                    p_series=coefficients["p"],
+                    rc_t_series=coefficients["RcT"],
+                    dvs_8_input=tables.dvs_8_input.table,
+                    rc_a_input=tables.rc_a_input.table,
+                    fungicide_residual=tables.fungicide_residual.table,
+                    p_opt=p_opt,
+                    inocp=np.full(n_runs, 10),
+                    rrlex_par=tiled(vectors["rrlex_par"]),
+                    rc_opt_par=tiled(vectors["rc_opt_par"]),
+                    ip_opt=np.full(n_runs, ip_opt),
+                    GDU_treshhold=np.full(n_runs, 10 if crop == "Corn" else 14),
+                    is_fungicide=tiled(vectors["is_fungicide"]),
+                    spray_moment=tiled(vectors["spray_moment"]),
+                    spray_end=tiled(vectors["spray_end"]),
+                    spray_eff=tiled(vectors["spray_eff"]),
+                    days_after_planting=np.repeat(chunk["obs_planting_delta"].to_numpy(), n_scenarios),
+                    variables=["Sev"],
+                    total_days=np.repeat(chunk["total_days"].to_numpy(), n_scenarios),
+                )
+
+            instrumentation.count("scenarios_run", n_runs)
+            instrumentation.count("simulated_days", n_day.sum())
+
+            sev = field_results[:, :, 0]
+            valid = np.arange(width) < n_day[:, None]
+            metrics = season_metrics(np.where(valid, sev, np.nan))
+
+            planting = np.repeat(np.arange(len(rows)), n_scenarios)
+            scenario = np.tile(np.arange(n_scenarios), len(rows))
+            columns = {
+                "locationId": chunk["info_id"].to_numpy()[planting],
+                "Date1": chunk["Date1"].to_numpy()[planting],
+                "Date2": chunk["Date2"].to_numpy()[planting],
+                "N_Days": chunk["N_Days"].to_numpy(dtype=np.int64)[planting],
+                "latitude": chunk["latitude"].to_numpy()[planting],
+                "longitude": chunk["longitude"].to_numpy()[planting],
+                "Sev50%": metrics["Sev50%"],
+                "SevMAX": metrics["SevMAX"],
+                "AUC": metrics["AUC"],
+                "number_applications": scenarios["number_applications"].to_numpy()[scenario],
+                "genetic_mechanistic": scenarios["genetic_mechanistic"].to_numpy()[scenario],
+            }
+            names = list(columns)
+
+            for row, values in zip(rows[planting].tolist(), zip(*(columns[name].tolist() for name in names))):
+                result = dict(zip(names, values))
+                result["crop"] = crop
+                yield row, result
+
+
+def _batch_results(
+    data: Union[pd.DataFrame, RepeatedYears],
+    **kwargs
+) -> List[Dict]:
+    """Output information Of `_iter_batch_results`, In The Same Order As The Per-planting Engines."""
+
+    location_results = {}
+
+    for row, result in _iter_batch_results(data, **kwargs):
+        location_results.setdefault(row, []).append(result)
+
+    return [result for row in sorted(location_results) for result in location_results[row]]
+
 
-    for id in data["info_id"].unique():
-        df = data[data["info_id"] == id]
-        planting_date_list = [pd.to_datetime(dt).strftime(
-            "%Y%m%d") for dt in df["planting_date"].unique()]
+def _iter_location_results(
+    data: Union[pd.DataFrame, RepeatedYears],
+    crop_parameters: Dict,
+    spray_parameters: pd.DataFrame,
+    genetic_mechanistic_parameters: Dict,
+    number_applications_list: List[int],
+    genetic_mechanistic_list: List[str],
+    engine: str = "reference",
+    batch_size: int = 2048,
+    trajectories: Optional[TrajectoryStore] = None,
+    instrumentation: Optional[Instrumentation] = None
+) -> Iterator[Dict]:
+    """Simulate Every Planting Of The Location Data With One Engine, Yielding Results As They Finish.
+
+    Args:
+        data (Union[pd.DataFrame, RepeatedYears]): Location Data, See `field_data_preparation`.
+        crop_parameters (Dict): Crop Parameters Keyed By Crop Name.
+        spray_parameters (pd.DataFrame): Spray Application Parameters.
+        genetic_mechanistic_parameters (Dict): Genetic Mechanistic Parameters.
+        number_applications_list (List[int]): Numbers Of Fungicide Applications.
+        genetic_mechanistic_list (List[str]): Resistance Classes.
+        engine (str, optional): Simulation Engine. Defaults to "reference".
+        batch_size (int, optional): Plantings Advanced Together By The "batch" Engine. Defaults to 2048.
+        trajectories (TrajectoryStore, optional): Store Receiving The Daily Trajectories Of The
+            Engines In `ENGINES`, Keyed By (info_id, number_applications,
+            genetic_mechanistic). Defaults to None.
+        instrumentation (Instrumentation, optional): Records The "driver/simulation" Stage And The
+            `scenarios_run`, `simulated_days` And `plantings_skipped` Counters. Defaults to None.
+
+    Yields:
+        Dict: Output information, One Entry Per Simulation. The "batch" Engine Yields Whole Batches
+        Of Plantings Grouped By Crop.
+    """
+
+    instrumentation = _instrumentation(instrumentation)
+    estimate = ENGINES.get(engine)
+    reducers = default_reducers()
+
+    if engine == "batch":
+        for _, result in _iter_batch_results(
+            data=data,
+            crop_parameters=crop_parameters,
+            spray_parameters=spray_parameters,
+            genetic_mechanistic_parameters=genetic_mechanistic_parameters,
+            number_applications_list=number_applications_list,
+            genetic_mechanistic_list=genetic_mechanistic_list,
+            batch_size=batch_size,
+            instrumentation=instrumentation
+        ):
+            yield result
+        return
+
+    info_ids = data.info_ids if isinstance(data, RepeatedYears) else data["info_id"].unique()
+
+    for id in info_ids:
+        df = data.planting(id) if isinstance(data, RepeatedYears) else data[data["info_id"] == id]
+        planting_date_list = [pd.to_datetime(dt).normalize() for dt in df["planting_date"].unique()]
+
+        if engine == "forked":
+
+            for date in planting_date_list:
+
+                crop = df["Crop"].unique()[0]
+                crop_parameters_selected = crop_parameters[crop]
+
+                df = df[df["date"] >= date].copy()
+
+                if len(df) == 0:
+                    instrumentation.event("plantings_skipped", info_id=id, reason="No dates in range.")
+                    continue
+
+                df["Day"] = (
+                    df["DOY"] - df["DOY"].iloc[0]
+                ).dt.days + 1
+
+                fungicides = [
+                    spray_parameters[spray_parameters["spray_number"] <= number_applications]
+                    if number_applications > 0 else None
+                    for number_applications in number_applications_list
+                ]
+                forked = {}
+
+                for genetic_mechanistic in genetic_mechanistic_list:
+                    with instrumentation.stage("driver/simulation"):
+                        forked[genetic_mechanistic] = estimate_disease_severity_forked(
+                            weather_df=df,
+                            ip_t_cof=crop_parameters_selected["ip_t_cof"],
+                            p_t_cof=crop_parameters_selected["p_t_cof"],
+                            rc_t_input=crop_parameters_selected["rc_t_input"],
+                            dvs_8_input=crop_parameters_selected["dvs_8_input"],
+                            rc_a_input=crop_parameters_selected["rc_a_input"],
+                            p_opt=genetic_mechanistic_parameters[genetic_mechanistic]["p_opt"],
+                            rrlex_par=genetic_mechanistic_parameters[genetic_mechanistic]["rrlex_par"],
+                            rc_opt_par=genetic_mechanistic_parameters[genetic_mechanistic]["rc_opt_par"],
+                            inocp=10,
+                            ip_opt=14 if crop == "Corn" else 28,
+                            GDU_treshhold=10 if crop == "Corn" else 14,
+                            fungicides=fungicides,
+                            fungicide_residual=crop_parameters_selected["fungicide_residual"],
+                            days_after_planting=df["obs_planting_delta"].unique()[0],
+                        )
+
+                for (i, number_applications), genetic_mechanistic in itertools.product(enumerate(number_applications_list), genetic_mechanistic_list):
+                    field_results, n_day = forked[genetic_mechanistic][i]
+                    instrumentation.count("scenarios_run")
+                    instrumentation.count("simulated_days", n_day)
+                    yield _result_location(
+                        id=id,
+                        df=df,
+                        sev=field_results["Sev"].to_numpy(),
+                        n_day=n_day,
+                        number_applications=number_applications,
+                        genetic_mechanistic=genetic_mechanistic
+                    )
+
+            continue
+
+        if engine == "scenarios":
+
+            for date in planting_date_list:
+
+                crop = df["Crop"].unique()[0]
+                crop_parameters_selected = crop_parameters[crop]
+
+                df = df[df["date"] >= date].copy()
+
+                if len(df) == 0:
+                    instrumentation.event("plantings_skipped", info_id=id, reason="No dates in range.")
+                    continue
+
+                df["Day"] = (
+                    df["DOY"] - df["DOY"].iloc[0]
+                ).dt.days + 1
+
+                with instrumentation.stage("driver/simulation"):
+                    scenarios, field_results, _, n_day = estimate_disease_severity_scenarios(
+                        weather_df=df,
+                        ip_t_cof=crop_parameters_selected["ip_t_cof"],
+                        p_t_cof=crop_parameters_selected["p_t_cof"],
+                        rc_t_input=crop_parameters_selected["rc_t_input"],
+                        dvs_8_input=crop_parameters_selected["dvs_8_input"],
+                        rc_a_input=crop_parameters_selected["rc_a_input"],
+                        spray_parameters=spray_parameters,
+                        genetic_mechanistic_parameters=genetic_mechanistic_parameters,
+                        number_applications_list=number_applications_list,
+                        genetic_mechanistic_list=genetic_mechanistic_list,
+                        inocp=10,
+                        ip_opt=14 if crop == "Corn" else 28,
+                        GDU_treshhold=10 if crop == "Corn" else 14,
+                        fungicide_residual=crop_parameters_selected["fungicide_residual"],
+                        days_after_planting=df["obs_planting_delta"].unique()[0],
+                        variables=["Sev"],
+                    )
+
+                instrumentation.count("scenarios_run", len(scenarios))
+                instrumentation.count("simulated_days", n_day * len(scenarios))
+
+                for i, scenario in enumerate(scenarios.itertuples(index=False)):
+                    yield _result_location(
+                        id=id,
+                        df=df,
+                        sev=field_results[i, :, 0],
+                        n_day=n_day,
+                        number_applications=scenario.number_applications,
+                        genetic_mechanistic=scenario.genetic_mechanistic
+                    )
+
+            continue
+
+        skipped = False
 
         for number_applications, genetic_mechanistic, date in itertools.product(number_applications_list, genetic_mechanistic_list, planting_date_list):
 
@@ -48,19 +403,22 @@ def calculation_crop_disease_severity(
                 using_fungicide = False
                 fungicide_inputs = pd.DataFrame()
 
-            crop_parameters_selected = crop_parameters[df["Crop"].unique()[0]]
-
             df = df[df["date"] >= date].copy()
 
             if len(df) == 0:
-                print(f"Location {id} NOT USED. No dates in range.")
+                # Every scenario of the planting is skipped; count the planting once.
+                if not skipped:
+                    instrumentation.event("plantings_skipped", info_id=id, reason="No dates in range.")
+                skipped = True
                 continue
 
+            crop_parameters_selected = crop_parameters[df["Crop"].unique()[0]]
+
             df["Day"] = (
                 df["DOY"] - df["DOY"].iloc[0]
             ).dt.days + 1
 
-            field_results, n_day = estimate_disease_severity(
+            arguments = dict(
                 weather_df=df,
                 ip_t_cof=crop_parameters_selected["ip_t_cof"],
                 p_t_cof=crop_parameters_selected["p_t_cof"],
@@ -79,42 +437,367 @@ def calculation_crop_disease_severity(
                 days_after_planting=df["obs_planting_delta"].unique()[0],
             )
 
-            # Output information
-            start_date = df["date"].iloc[0]
-            end_date = df["date"].iloc[n_day - 1]
-            result_location = {}
-            result_location["locationId"] = id
-            result_location["Date1"] = start_date
-            result_location["Date2"] = end_date
-            result_location["N_Days"] = (
-                pd.to_datetime(end_date) - pd.to_datetime(start_date)
-            ).days
-            result_location["latitude"] = df["latitude"].iloc[0]
-            result_location["longitude"] = df["longitude"].iloc[0]
-            result_location["Sev50%"] = field_results["Sev"].median()
-            result_location["SevMAX"] = field_results["Sev"].max()
-            nonzero_sev = field_results[field_results["Sev"] != 0]["Sev"]
-
-            if len(nonzero_sev):
-                result_location["AUC"] = np.trapz(nonzero_sev)
+            if engine == "reference" and instrumentation.enabled:
+                arguments["instrumentation"] = instrumentation
+
+            if engine == "summary":
+                with instrumentation.stage("driver/simulation"):
+                    metrics, n_day = estimate_disease_severity_summary(**arguments, reducers=reducers)
+                sev = None
             else:
-                result_location["AUC"] = 0
+                with instrumentation.stage("driver/simulation"):
+                    field_results, n_day = estimate(**arguments)
+                metrics, sev = None, field_results["Sev"].to_numpy()
+
+                if trajectories is not None:
+                    trajectories.append((id, int(number_applications), genetic_mechanistic), field_results)
+
+            instrumentation.count("scenarios_run")
+            instrumentation.count("simulated_days", n_day)
+
+            yield _result_location(
+                id=id,
+                df=df,
+                sev=sev,
+                n_day=n_day,
+                number_applications=number_applications,
+                genetic_mechanistic=genetic_mechanistic,
+                metrics=metrics
+            )
+
+
+def _location_results(
+    data: Union[pd.DataFrame, RepeatedYears],
+    engine: str = "reference",
+    batch_size: int = 2048,
+    **kwargs
+) -> List[Dict]:
+    """Output information Of `_iter_location_results`, With "batch" Results In Planting Order."""
+
+    if engine == "batch":
+        return _batch_results(data, batch_size=batch_size, **kwargs)
+
+    return list(_iter_location_results(data, engine=engine, batch_size=batch_size, **kwargs))
+
 
-            result_location["number_applications"] = number_applications
-            result_location["genetic_mechanistic"] = genetic_mechanistic
-            result_location["crop"] = df["Crop"].unique()[0]
+_WORKER = {}
 
-            all_results.append(result_location)
 
-    all_results = pd.DataFrame.from_dict(all_results)
+def _init_worker(
+    path: str,
+    kwargs: Dict,
+    instrumented: bool = False
+) -> None:
+    """Open The Shared Location Data Once Per Worker Process."""
 
-    all_results.sort_values(
-        by=["locationId", "crop", "Date1",
-            "number_applications", "genetic_mechanistic"],
-        inplace=True
+    _WORKER["data"] = ColumnarFrame(path)
+    _WORKER["kwargs"] = kwargs
+    _WORKER["instrumented"] = instrumented
+
+
+def _run_chunk(
+    bounds: Tuple[int, int]
+) -> Tuple[List[Dict], Optional[Dict]]:
+    """Simulate The Plantings Stored In Rows `bounds` Of The Shared Location Data.
+
+    Returns:
+        Tuple[List[Dict], Optional[Dict]]: Output information And, If Instrumented, The Chunk's
+        `Instrumentation.report()`.
+    """
+
+    instrumentation = Instrumentation() if _WORKER["instrumented"] else None
+    results = _location_results(
+        _WORKER["data"].slice(*bounds), instrumentation=instrumentation, **_WORKER["kwargs"]
+    )
+
+    return results, None if instrumentation is None else instrumentation.report()
+
+
+def _iter_parallel_results(
+    data: Union[pd.DataFrame, RepeatedYears],
+    n_workers: int,
+    chunk_size: int = 64,
+    **kwargs
+) -> Iterator[Dict]:
+    """Simulate Chunks Of Plantings On A Process Pool.
+
+    The Location Data Is Written Once As Memory-mapped Columns, So Tasks Only Carry Row Bounds.
+    Chunks Are Collected In Submission Order, Which Keeps The Output Identical To The Serial Path.
+
+    Args:
+        data (Union[pd.DataFrame, RepeatedYears]): Location Data, See `field_data_preparation`.
+        n_workers (int): Number Of Worker Processes.
+        chunk_size (int, optional): Plantings Per Task. Defaults to 64.
+        **kwargs: Passed To `_location_results`.
+
+    Yields:
+        Dict: Output information, One Entry Per Simulation, A Chunk At A Time.
+    """
+
+    # Callbacks need not be picklable: workers record their own reports, merged here.
+    instrumentation = _instrumentation(kwargs.pop("instrumentation", None))
+
+    if isinstance(data, RepeatedYears):
+        data = data.to_frame()
+
+    codes, _ = pd.factorize(data["info_id"])
+
+    # Each planting must occupy one contiguous block of rows.
+    if len(codes) and np.count_nonzero(np.diff(codes)) + 1 != codes.max() + 1:
+        order = np.argsort(codes, kind="stable")
+        data, codes = data.iloc[order], codes[order]
+
+    starts = np.flatnonzero(np.r_[True, np.diff(codes) != 0])
+    bounds = [
+        (int(starts[i]), int(starts[i + chunk_size]) if i + chunk_size < len(starts) else len(data))
+        for i in range(0, len(starts), chunk_size)
+    ]
+
+    with tempfile.TemporaryDirectory(prefix="eds-") as path:
+
+        write_columnar(data, path)
+
+        with ProcessPoolExecutor(
+            max_workers=n_workers, initializer=_init_worker, initargs=(path, kwargs, instrumentation.enabled)
+        ) as executor:
+            for results, report in executor.map(_run_chunk, bounds):
+                if report is not None:
+                    instrumentation.merge(report)
+                yield from results
+
+
+def _parallel_results(
+    data: Union[pd.DataFrame, RepeatedYears],
+    n_workers: int,
+    chunk_size: int = 64,
+    **kwargs
+) -> List[Dict]:
+    """Output information Of `_iter_parallel_results`."""
+
+    return list(_iter_parallel_results(data, n_workers=n_workers, chunk_size=chunk_size, **kwargs))
+
+
+def _incremental_results(
+    data: Union[pd.DataFrame, RepeatedYears],
+    incremental_dir: str,
+    n_workers: int = 1,
+    chunk_size: int = 64,
+    **kwargs
+) -> pd.DataFrame:
+    """Simulate Only The Plantings Whose Fingerprint Changed Since The Run Stored In `incremental_dir`.
+
+    Args:
+        data (Union[pd.DataFrame, RepeatedYears]): Location Data, See `field_data_preparation`.
+        incremental_dir (str): Directory Of An `IncrementalStore`. Updated With This Run's Results.
+        n_workers (int, optional): Number Of Worker Processes. Defaults to 1.
+        chunk_size (int, optional): Plantings Per Task. Defaults to 64.
+        **kwargs: Passed To `_location_results`.
+
+    Returns:
+        pd.DataFrame: Reused And New Output information, With A `fingerprint` Column.
+    """
+
+    if not isinstance(data, RepeatedYears):
+        return pd.DataFrame.from_dict(_location_results(data, **kwargs))
+
+    store = IncrementalStore(incremental_dir)
+    fingerprints = planting_fingerprints(
+        data,
+        crop_parameters=kwargs["crop_parameters"],
+        spray_parameters=kwargs["spray_parameters"],
+        genetic_mechanistic_parameters=kwargs["genetic_mechanistic_parameters"],
+        number_applications_list=kwargs["number_applications_list"],
+        genetic_mechanistic_list=kwargs["genetic_mechanistic_list"],
     )
+    reused = store.reusable(fingerprints)
+    reused_ids = set(reused["locationId"]) if len(reused) else set()
+    _instrumentation(kwargs.get("instrumentation")).count("plantings_reused", len(reused_ids))
+    changed = [info_id for info_id in data.info_ids if info_id not in reused_ids]
+
+    if len(changed) == len(data.info_ids):
+        subset = data
+    else:
+        subset = data.plantings(changed)
+
+    if len(changed) == 0:
+        new_results = []
+    elif n_workers > 1:
+        new_results = _parallel_results(subset, n_workers=n_workers, chunk_size=chunk_size, **kwargs)
+    else:
+        new_results = _location_results(subset, **kwargs)
+
+    new_results = pd.DataFrame.from_dict(new_results)
+
+    if len(new_results):
+        new_results["fingerprint"] = new_results["locationId"].map(fingerprints)
+
+    all_results = pd.concat([reused, new_results], ignore_index=True)
+    store.save(all_results)
+
+    return all_results
+
+
+def _check_engine(
+    engine: str
+) -> None:
+
+    if engine not in ENGINES and engine not in ["scenarios", "batch", "forked", "summary"]:
+        raise ValueError(
+            f"Unknown engine {engine!r}, expected one of {sorted(ENGINES) + ['batch', 'forked', 'scenarios', 'summary']}."
+        )
+
+
+def iter_crop_disease_severity(
+    weather_df_path: str,
+    plantings_df_path: str,
+    crop_parameters: Dict,
+    spray_parameters: pd.DataFrame,
+    genetic_mechanistic_parameters: Dict,
+    number_of_repeat_years: int = 1,
+    daily_precip_threshold: float = 2,
+    number_applications_list: List[int] = [0, 1, 2, 3],
+    genetic_mechanistic_list: List[str] = ["Susceptible", "Moderate", "Resistant"],
+    engine: str = "reference",
+    batch_size: int = 2048,
+    n_workers: int = 1,
+    chunk_size: int = 64,
+    cache_dir: Optional[str] = None,
+    cache_max_bytes: int = 1 << 30,
+    chunksize: Optional[int] = None,
+    instrumentation: Optional[Instrumentation] = None
+) -> Iterator[Dict]:
+    """Yield One Result Record Per Simulation As Soon As It Finishes.
+
+    Takes The Arguments Of `calculation_crop_disease_severity`. Records Come In Completion Order
+    (Unsorted) And Carry Every Output Column; Pass Them To A `CSVSink` Or `ColumnarSink` To Write
+    Large Runs With Constant Memory.
+
+    Yields:
+        Dict: Output information Of One Simulation.
+    """
+
+    _check_engine(engine)
+
+    data = field_data_preparation(
+        weather_df_path=weather_df_path,
+        plantings_df_path=plantings_df_path,
+        number_of_repeat_years=number_of_repeat_years,
+        daily_precip_threshold=daily_precip_threshold,
+        as_view=True,
+        date_format=None,
+        cache_dir=cache_dir,
+        cache_max_bytes=cache_max_bytes,
+        chunksize=chunksize,
+        instrumentation=instrumentation
+    )
+
+    kwargs = dict(
+        crop_parameters=crop_parameters,
+        spray_parameters=spray_parameters,
+        genetic_mechanistic_parameters=genetic_mechanistic_parameters,
+        number_applications_list=number_applications_list,
+        genetic_mechanistic_list=genetic_mechanistic_list,
+        engine=engine,
+        batch_size=batch_size,
+        instrumentation=instrumentation
+    )
+
+    if n_workers > 1:
+        yield from _iter_parallel_results(data, n_workers=n_workers, chunk_size=chunk_size, **kwargs)
+    else:
+        yield from _iter_location_results(data, **kwargs)
+
+
+def calculation_crop_disease_severity(
+    weather_df_path: str,
+    plantings_df_path: str,
+    crop_parameters: Dict,
+    spray_parameters: pd.DataFrame,
+    genetic_mechanistic_parameters: Dict,
+    number_of_repeat_years: int = 1,
+    daily_precip_threshold: float = 2,
+    number_applications_list: List[int] = [0, 1, 2, 3],
+    genetic_mechanistic_list: List[str] = ["Susceptible", "Moderate", "Resistant"],
+    output_columns: List[str] = ["Sev50%", "SevMAX", "AUC"],
+    engine: str = "reference",
+    batch_size: int = 2048,
+    n_workers: int = 1,
+    chunk_size: int = 64,
+    cache_dir: Optional[str] = None,
+    cache_max_bytes: int = 1 << 30,
+    chunksize: Optional[int] = None,
+    incremental_dir: Optional[str] = None,
+    trajectory_path: Optional[str] = None,
+    trajectory_columns: List[str] = ["Sev"],
+    trajectory_sample_fraction: float = 1.0,
+    instrumentation: Optional[Instrumentation] = None
+):
+
+    _check_engine(engine)
+    instrumentation = _instrumentation(instrumentation)
+
+    if trajectory_path is not None and (engine not in ENGINES or n_workers > 1 or incremental_dir is not None):
+        raise ValueError(
+            f"Trajectories are recorded by the {sorted(ENGINES)} engines in a single, non-incremental process."
+        )
+
+    data = field_data_preparation(
+        weather_df_path=weather_df_path,
+        plantings_df_path=plantings_df_path,
+        number_of_repeat_years=number_of_repeat_years,
+        daily_precip_threshold=daily_precip_threshold,
+        as_view=True,
+        date_format=None,
+        cache_dir=cache_dir,
+        cache_max_bytes=cache_max_bytes,
+        chunksize=chunksize,
+        instrumentation=instrumentation
+    )
+
+    kwargs = dict(
+        crop_parameters=crop_parameters,
+        spray_parameters=spray_parameters,
+        genetic_mechanistic_parameters=genetic_mechanistic_parameters,
+        number_applications_list=number_applications_list,
+        genetic_mechanistic_list=genetic_mechanistic_list,
+        engine=engine,
+        batch_size=batch_size,
+        instrumentation=instrumentation
+    )
+
+    if trajectory_path is not None and isinstance(data, RepeatedYears):
+        # A run writes at most one row per day up to `obs_planting_delta`, plus the terminal row.
+        n_days = min(
+            int(data.column("info_id").value_counts().max()),
+            int(data.column("obs_planting_delta").max()) + 1
+        )
+        with TrajectoryStore(
+            trajectory_path,
+            n_runs=len(data.info_ids) * len(number_applications_list) * len(genetic_mechanistic_list),
+            n_days=n_days,
+            variables=trajectory_columns,
+            sample_fraction=trajectory_sample_fraction,
+        ) as trajectories:
+            results = _location_results(data, trajectories=trajectories, **kwargs)
+    elif incremental_dir is not None:
+        results = _incremental_results(
+            data, incremental_dir=incremental_dir, n_workers=n_workers, chunk_size=chunk_size, **kwargs
+        )
+    elif n_workers > 1:
+        results = _parallel_results(data, n_workers=n_workers, chunk_size=chunk_size, **kwargs)
+    else:
+        results = _location_results(data, **kwargs)
+
+    with instrumentation.stage("driver/result_assembly"):
+        all_results = results if isinstance(results, pd.DataFrame) else pd.DataFrame.from_dict(results)
+
+        all_results.sort_values(
+            by=["locationId", "crop", "Date1",
+                "number_applications", "genetic_mechanistic"],
+            inplace=True
+        )
 
-    all_results = all_results[["locationId", "Date1", "Date2", "N_Days", "latitude",
-                               "longitude", "number_applications", "genetic_mechanistic", "crop"] + output_columns]
+        all_results = all_results[["locationId", "Date1", "Date2", "N_Days", "latitude",
+                                   "longitude", "number_applications", "genetic_mechanistic", "crop"] + output_columns]
 
     return all_results
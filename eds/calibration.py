@@ -0,0 +1,609 @@
+"""
+    Calibration Of Model Parameters To Observed Severity.
+
+    A `CalibrationProblem` lays the weather of the observed plantings out once and simulates whole
+    batches of candidate parameter vectors in lockstep with `simulate_disease_severity_batch`.
+    `calibrate` minimizes the error to the observations with a gradient-free optimizer, either
+    Nelder-Mead or CMA-ES, handing each iteration's candidates to the problem as one batch, split over
+    a process pool when `n_workers` > 1.
+
+    Calibrated parameters are `p_opt`, `rc_opt_par`, `rrlex_par`, `inocp`, `ip_opt` and single values
+    of the temperature lookup tables, named `<table>[<breakpoint number>]`, e.g. `rc_t_input[1]`.
+"""
+
+import math
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Optional, Tuple
+import numpy as np
+import pandas as pd
+from .estimate_disease_severity_vectorized import planting_weather_matrix, simulate_disease_severity_batch
+from .field_data_preparation import RepeatedYears, field_data_preparation
+from . import utils
+
+
+SCALAR_PARAMETERS = ["p_opt", "rc_opt_par", "rrlex_par", "inocp", "ip_opt"]
+
+TABLE_PARAMETERS = ["ip_t_cof", "p_t_cof", "rc_t_input"]
+
+_TABLE_PARAMETER = re.compile(r"^(\w+)\[(\d+)\]$")
+
+
+class CalibrationProblem():
+    """Observed Plantings Of One Crop And The Error Of Candidate Parameter Vectors.
+
+    Everything Not Depending On The Candidates Is Computed Once: The (plantings, days) Weather,
+    Antecedent Precipitation Scores, The Temperature Lookups Of Uncalibrated Tables And The Position Of
+    Every Observation. All Plantings Are Simulated With `number_applications` Fungicide Applications
+    And The Parameters Of `genetic_mechanistic`, Except Those Calibrated.
+
+    Args:
+        weather_df_path (str): Path To The Data File.
+        plantings_df_path (str): Path To The Info File.
+        observations (pd.DataFrame): Observed Severity. Necessary Columns:
+            `info_id`: Observed Planting
+            `date`: Observation Date, datetime64 Or "%Y%m%d"
+            `Sev`: Observed Severity
+            `weight` (Optional): Weight In The Error, Defaults To 1
+        crop_parameters (Dict): Crop Parameters Keyed By Crop Name.
+        parameters (Dict[str, Tuple[float, float]]): (Lower, Upper) Bound Of Every Calibrated Parameter,
+            In The Order Of The Parameter Vector.
+        crop (str, optional): Crop Of The Observed Plantings. Defaults to "Corn".
+        genetic_mechanistic_parameters (Dict, optional): Genetic Mechanistic Parameters.
+            Defaults to `utils.genetic_mechanistic_parameters()`.
+        genetic_mechanistic (str, optional): Resistance Class Of The Uncalibrated Parameters.
+            Defaults to "Susceptible".
+        spray_parameters (pd.DataFrame, optional): Spray Application Parameters.
+            Defaults to `utils.spray_application_parameters()`.
+        number_applications (int, optional): Number Of Fungicide Applications. Defaults to 0.
+        number_of_repeat_years (int, optional): Number Of Repeat Data. Defaults to 1.
+        daily_precip_threshold (float, optional): Daily Precipitation Threshold (mm). Defaults to 2 mm.
+        cache_dir (str, optional): Prepared Data Cache, See `field_data_preparation`. Defaults to None.
+        batch_size (int, optional): Runs (Candidates × Plantings) Simulated Together. Defaults to 8192.
+    """
+
+    def __init__(
+        self,
+        weather_df_path: str,
+        plantings_df_path: str,
+        observations: pd.DataFrame,
+        crop_parameters: Dict,
+        parameters: Dict[str, Tuple[float, float]],
+        crop: str = "Corn",
+        genetic_mechanistic_parameters: Optional[Dict] = None,
+        genetic_mechanistic: str = "Susceptible",
+        spray_parameters: Optional[pd.DataFrame] = None,
+        number_applications: int = 0,
+        number_of_repeat_years: int = 1,
+        daily_precip_threshold: float = 2,
+        cache_dir: Optional[str] = None,
+        batch_size: int = 8192,
+    ) -> None:
+
+        if genetic_mechanistic_parameters is None:
+            genetic_mechanistic_parameters = utils.genetic_mechanistic_parameters()
+
+        if spray_parameters is None:
+            spray_parameters = utils.spray_application_parameters()
+
+        self.crop = crop
+        self.names = list(parameters)
+        self.bounds = np.array([parameters[name] for name in self.names], dtype=np.float64).reshape(-1, 2)
+        self.batch_size = batch_size
+
+        if np.any(self.bounds[:, 0] > self.bounds[:, 1]):
+            raise ValueError("Every lower bound must not exceed its upper bound.")
+
+        self.tables = utils.CropLookupTables.from_crop_parameters(crop_parameters[crop])
+        self.defaults = dict(genetic_mechanistic_parameters[genetic_mechanistic])
+        self.defaults["inocp"] = 10
+        self.defaults["ip_opt"] = 14 if crop == "Corn" else 28
+        self.GDU_treshhold = 10 if crop == "Corn" else 14
+
+        self.table_parameters = {}
+        for i, name in enumerate(self.names):
+            match = _TABLE_PARAMETER.match(name)
+            if match and match.group(1) in TABLE_PARAMETERS:
+                table, position = match.group(1), int(match.group(2))
+                if position >= len(getattr(self.tables, table).values):
+                    raise ValueError(f"{name}: {table} has {len(getattr(self.tables, table).values)} breakpoints.")
+                self.table_parameters.setdefault(table, []).append((i, position))
+            elif name not in SCALAR_PARAMETERS:
+                raise ValueError(
+                    f"Unknown parameter {name!r}, expected one of {SCALAR_PARAMETERS} or "
+                    f"<table>[<breakpoint number>] with a table of {TABLE_PARAMETERS}."
+                )
+
+        observations = observations.reset_index(drop=True)
+        info_ids = list(pd.unique(observations["info_id"]))
+
+        data = field_data_preparation(
+            weather_df_path=weather_df_path,
+            plantings_df_path=plantings_df_path,
+            number_of_repeat_years=number_of_repeat_years,
+            daily_precip_threshold=daily_precip_threshold,
+            as_view=True,
+            date_format=None,
+            cache_dir=cache_dir,
+        )
+
+        if isinstance(data, RepeatedYears):
+            available = set(data.info_ids)
+            data = data.plantings([info_id for info_id in info_ids if info_id in available])
+        else:
+            data = data[data["info_id"].isin(info_ids)]
+
+        plantings, weather = planting_weather_matrix(data)
+        plantings = plantings[(plantings["Crop"] == crop) & (plantings["total_days"] > 0)]
+        missing = sorted(set(info_ids) - set(plantings["info_id"]), key=str)
+
+        if missing:
+            raise ValueError(f"No {crop} weather for the observed plantings {missing[:10]}.")
+
+        rows = plantings.index.to_numpy()
+        self.plantings = plantings.reset_index(drop=True)
+        self.temperature = weather["Temperature"][rows]
+        self.rc_w = utils.calculate_antecedent_precipitation_conditions_scores(weather["precip_occur"][rows])
+        self.precip = weather["precip"][rows] if number_applications > 0 else np.zeros(self.temperature.shape)
+        self.total_days = self.plantings["total_days"].to_numpy()
+        self.days_after_planting = self.plantings["obs_planting_delta"].fillna(0).to_numpy(dtype=np.int64)
+
+        # Only the lookups of calibrated tables are repeated per candidate.
+        self.lookups = {
+            table: getattr(self.tables, table)(self.temperature)
+            for table in TABLE_PARAMETERS if table not in self.table_parameters
+        }
+
+        fungicide = spray_parameters[spray_parameters["spray_number"] <= number_applications] \
+            if number_applications > 0 else pd.DataFrame()
+        self.is_fungicide = number_applications > 0
+        self.sprays = [s[None, :] for s in utils.fungicide_spray_arrays(fungicide)]
+
+        dates = observations["date"]
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            dates = pd.to_datetime(dates.astype(str), format="%Y%m%d")
+
+        planting = pd.Index(self.plantings["info_id"]).get_indexer(observations["info_id"])
+        first = pd.to_datetime(self.plantings["Date1"], format="%Y%m%d").to_numpy()[planting]
+        position = ((dates.to_numpy() - first) // np.timedelta64(1, "D")).astype(np.int64)
+        outside = (position < 0) | (position >= self.plantings["n_day"].to_numpy()[planting])
+
+        if outside.any():
+            raise ValueError(
+                f"{int(outside.sum())} observations fall outside the simulated seasons, e.g.\n"
+                + observations[outside].head().to_string()
+            )
+
+        self.observations = observations
+        self.observation_planting = planting
+        self.observation_position = position
+        self.observed = observations["Sev"].to_numpy(dtype=np.float64)
+        self.weight = observations["weight"].to_numpy(dtype=np.float64) if "weight" in observations \
+            else np.ones(len(observations))
+
+    def initial(
+        self
+    ) -> np.ndarray:
+        """The Uncalibrated Values Of The Parameters, Clipped To Their Bounds."""
+
+        values = []
+        for name in self.names:
+            match = _TABLE_PARAMETER.match(name)
+            if match:
+                values.append(getattr(self.tables, match.group(1)).values[int(match.group(2))])
+            else:
+                values.append(self.defaults[name])
+
+        return np.clip(np.array(values, dtype=np.float64), self.bounds[:, 0], self.bounds[:, 1])
+
+    def _table_lookups(
+        self,
+        table: str,
+        candidates: np.ndarray
+    ) -> np.ndarray:
+        """(candidates, plantings, days) Lookup Of `table` With The Candidates' Values."""
+
+        base = getattr(self.tables, table)
+
+        if table not in self.table_parameters:
+            return np.broadcast_to(self.lookups[table], (len(candidates),) + self.temperature.shape)
+
+        lookups = np.empty((len(candidates),) + self.temperature.shape)
+        for k, candidate in enumerate(candidates):
+            values = base.values.copy()
+            for i, position in self.table_parameters[table]:
+                values[position] = candidate[i]
+            lookups[k] = np.interp(self.temperature, base.breakpoints, values)
+
+        return lookups
+
+    def simulate(
+        self,
+        candidates: np.ndarray
+    ) -> np.ndarray:
+        """Simulated Severity At The Observations.
+
+        Args:
+            candidates (np.ndarray): (candidates, parameters) Parameter Vectors.
+
+        Returns:
+            np.ndarray: (candidates, observations) Simulated Severity.
+        """
+
+        candidates = np.atleast_2d(np.asarray(candidates, dtype=np.float64))
+        n_plantings, width = self.temperature.shape
+        simulated = np.empty((len(candidates), len(self.observed)))
+        step = max(1, self.batch_size // n_plantings)
+
+        for start in range(0, len(candidates), step):
+
+            batch = candidates[start:start + step]
+            n_runs = len(batch) * n_plantings
+
+            scalar = {}
+            for name in SCALAR_PARAMETERS:
+                values = batch[:, self.names.index(name)] if name in self.names \
+                    else np.full(len(batch), self.defaults[name], dtype=np.float64)
+                scalar[name] = np.repeat(values, n_plantings)
+
+            def runs(values: np.ndarray) -> np.ndarray:
+                return np.broadcast_to(values, (len(batch),) + values.shape).reshape(n_runs, -1)
+
+            def lookup(table: str) -> np.ndarray:
+                return self._table_lookups(table, batch).reshape(n_runs, width)
+
+            with np.errstate(divide="ignore"):
+                p_series = scalar["p_opt"][:, None] / lookup("p_t_cof")
+
+            out, _, _ = simulate_disease_severity_batch(
+                temperature=runs(self.temperature),
+                rc_w=runs(self.rc_w),
+                precip=runs(self.precip),
+                ip_series=scalar["ip_opt"][:, None] * lookup("ip_t_cof"),
+                p_series=p_series,
+                rc_t_series=lookup("rc_t_input"),
+                dvs_8_input=self.tables.dvs_8_input.table,
+                rc_a_input=self.tables.rc_a_input.table,
+                fungicide_residual=self.tables.fungicide_residual.table,
+                p_opt=scalar["p_opt"],
+                inocp=scalar["inocp"],
+                rrlex_par=scalar["rrlex_par"],
+                rc_opt_par=scalar["rc_opt_par"],
+                ip_opt=scalar["ip_opt"],
+                GDU_treshhold=np.full(n_runs, self.GDU_treshhold),
+                is_fungicide=np.full(n_runs, self.is_fungicide),
+                spray_moment=np.broadcast_to(self.sprays[0], (n_runs, self.sprays[0].shape[1])),
+                spray_end=np.broadcast_to(self.sprays[1], (n_runs, self.sprays[1].shape[1])),
+                spray_eff=np.broadcast_to(self.sprays[2], (n_runs, self.sprays[2].shape[1])),
+                days_after_planting=np.tile(self.days_after_planting, len(batch)),
+                variables=["Sev"],
+                total_days=np.tile(self.total_days, len(batch)),
+            )
+
+            sev = out[:, :, 0].reshape(len(batch), n_plantings, width)
+            simulated[start:start + len(batch)] = sev[:, self.observation_planting, self.observation_position]
+
+        return simulated
+
+    def loss(
+        self,
+        candidates: np.ndarray
+    ) -> np.ndarray:
+        """Weighted Root Mean Squared Error Of Every Candidate, Infinite Where The Model Breaks Down."""
+
+        error = self.simulate(candidates) - self.observed
+        loss = np.sqrt((self.weight * error ** 2).sum(axis=1) / self.weight.sum())
+
+        return np.where(np.isnan(loss), np.inf, loss)
+
+    def parameter_sets(
+        self,
+        values: np.ndarray,
+        crop_parameters: Dict,
+        genetic_mechanistic_parameters: Dict,
+        genetic_mechanistic: str = "Susceptible"
+    ) -> Tuple[Dict, Dict]:
+        """Copies Of `crop_parameters` And `genetic_mechanistic_parameters` With The Calibrated `values`.
+
+        `inocp` And `ip_opt` Are Not Part Of Either And Are Left Out.
+
+        Returns:
+            Tuple[Dict, Dict]: Crop Parameters And Genetic Mechanistic Parameters For `calculation_crop_disease_severity`.
+        """
+
+        crop_parameters = {crop: dict(tables) for crop, tables in crop_parameters.items()}
+        genetic_mechanistic_parameters = {g: dict(p) for g, p in genetic_mechanistic_parameters.items()}
+
+        for name, value in zip(self.names, values):
+            match = _TABLE_PARAMETER.match(name)
+            if match:
+                table = crop_parameters[self.crop][match.group(1)].copy()
+                table.iloc[int(match.group(2)), 1] = value
+                crop_parameters[self.crop][match.group(1)] = table
+            elif name in genetic_mechanistic_parameters[genetic_mechanistic]:
+                genetic_mechanistic_parameters[genetic_mechanistic][name] = value
+
+        return crop_parameters, genetic_mechanistic_parameters
+
+
+_WORKER = {}
+
+
+def _init_worker(
+    problem: CalibrationProblem
+) -> None:
+    """Keep The Problem, Pickled Once Per Worker Process."""
+
+    _WORKER["problem"] = problem
+
+
+def _worker_loss(
+    candidates: np.ndarray
+) -> np.ndarray:
+
+    return _WORKER["problem"].loss(candidates)
+
+
+def nelder_mead(
+    function: Callable[[np.ndarray], np.ndarray],
+    x0: np.ndarray,
+    step: float = 0.1,
+    max_evaluations: int = 1000,
+    xtol: float = 1e-6,
+    ftol: float = 1e-10,
+    callback: Optional[Callable[[Dict], None]] = None
+) -> Dict:
+    """Nelder-Mead Minimization In The Unit Box.
+
+    `function` Takes A (points, dimensions) Array. Every Iteration Evaluates Its Reflection, Expansion
+    And Both Contractions As One Batch, And A Shrink As Another, So They Can Run In Parallel. Points
+    Are Clipped To [0, 1].
+
+    Args:
+        function (Callable[[np.ndarray], np.ndarray]): Batched Objective.
+        x0 (np.ndarray): Starting Point.
+        step (float, optional): Initial Simplex Edge. Defaults to 0.1.
+        max_evaluations (int, optional): Evaluation Budget. Defaults to 1000.
+        xtol (float, optional): Stop When All Vertices Are Within `xtol` Of The Best One... Defaults to 1e-6.
+        ftol (float, optional): ...And All Values Within `ftol` Of The Best One. Defaults to 1e-10.
+        callback (Callable[[Dict], None], optional): Called With The Progress Of Every Iteration. Defaults to None.
+
+    Returns:
+        Dict: `x`, `loss`, `evaluations`, `iterations` And `history`.
+    """
+
+    x0 = np.clip(np.asarray(x0, dtype=np.float64), 0, 1)
+    n = len(x0)
+
+    # Step away from the nearer bound.
+    simplex = np.tile(x0, (n + 1, 1))
+    simplex[1:] += np.diag(np.where(x0 + step <= 1, step, -step))
+    values = function(simplex)
+    evaluations = n + 1
+    iterations = 0
+    history = []
+
+    while evaluations < max_evaluations:
+
+        order = np.argsort(values, kind="stable")
+        simplex, values = simplex[order], values[order]
+
+        iterations += 1
+        progress = {"iteration": iterations, "evaluations": evaluations, "loss": float(values[0])}
+        history.append(progress)
+        if callback is not None:
+            callback(progress)
+
+        if np.max(np.abs(simplex[1:] - simplex[0])) <= xtol and values[-1] - values[0] <= ftol:
+            break
+
+        centroid = simplex[:-1].mean(axis=0)
+        worst = simplex[-1]
+        trials = np.clip(
+            np.array([
+                centroid + (centroid - worst),
+                centroid + 2 * (centroid - worst),
+                centroid + 0.5 * (centroid - worst),
+                centroid - 0.5 * (centroid - worst),
+            ]), 0, 1
+        )
+        reflected, expanded, outside, inside = function(trials)
+        evaluations += len(trials)
+
+        if reflected < values[0]:
+            accepted = (trials[1], expanded) if expanded < reflected else (trials[0], reflected)
+        elif reflected < values[-2]:
+            accepted = (trials[0], reflected)
+        elif reflected < values[-1] and outside <= reflected:
+            accepted = (trials[2], outside)
+        elif reflected >= values[-1] and inside < values[-1]:
+            accepted = (trials[3], inside)
+        else:
+            accepted = None
+
+        if accepted is not None:
+            simplex[-1], values[-1] = accepted
+        else:
+            simplex[1:] = simplex[0] + 0.5 * (simplex[1:] - simplex[0])
+            values[1:] = function(simplex[1:])
+            evaluations += n
+
+    best = int(np.argmin(values))
+
+    return {
+        "x": simplex[best],
+        "loss": float(values[best]),
+        "evaluations": evaluations,
+        "iterations": iterations,
+        "history": pd.DataFrame(history, columns=["iteration", "evaluations", "loss"]),
+    }
+
+
+def cma_es(
+    function: Callable[[np.ndarray], np.ndarray],
+    x0: np.ndarray,
+    sigma: float = 0.3,
+    population_size: Optional[int] = None,
+    max_evaluations: int = 1000,
+    xtol: float = 1e-6,
+    seed: int = 0,
+    callback: Optional[Callable[[Dict], None]] = None
+) -> Dict:
+    """CMA-ES Minimization In The Unit Box.
+
+    `function` Takes A (points, dimensions) Array And Evaluates A Whole Generation At Once. Samples
+    Are Clipped To [0, 1] And Enter The Update Where They Were Evaluated.
+
+    Args:
+        function (Callable[[np.ndarray], np.ndarray]): Batched Objective.
+        x0 (np.ndarray): Initial Mean.
+        sigma (float, optional): Initial Step Size. Defaults to 0.3.
+        population_size (int, optional): Samples Per Generation. Defaults to 4 + 3 ln(dimensions).
+        max_evaluations (int, optional): Evaluation Budget. Defaults to 1000.
+        xtol (float, optional): Stop When The Step Size Along Every Axis Is Below It. Defaults to 1e-6.
+        seed (int, optional): Sampling Seed. Defaults to 0.
+        callback (Callable[[Dict], None], optional): Called With The Progress Of Every Generation. Defaults to None.
+
+    Returns:
+        Dict: `x`, `loss`, `evaluations`, `iterations` And `history`.
+    """
+
+    mean = np.clip(np.asarray(x0, dtype=np.float64), 0, 1)
+    n = len(mean)
+    rng = np.random.default_rng(seed)
+
+    population_size = population_size or 4 + int(3 * math.log(n))
+    mu = population_size // 2
+    weights = np.log(mu + 0.5) - np.log(np.arange(1, mu + 1))
+    weights /= weights.sum()
+    mueff = 1 / np.sum(weights ** 2)
+
+    cc = (4 + mueff / n) / (n + 4 + 2 * mueff / n)
+    cs = (mueff + 2) / (n + mueff + 5)
+    c1 = 2 / ((n + 1.3) ** 2 + mueff)
+    cmu = min(1 - c1, 2 * (mueff - 2 + 1 / mueff) / ((n + 2) ** 2 + mueff))
+    damps = 1 + 2 * max(0, math.sqrt((mueff - 1) / (n + 1)) - 1) + cs
+    chi_n = math.sqrt(n) * (1 - 1 / (4 * n) + 1 / (21 * n ** 2))
+
+    covariance = np.eye(n)
+    pc = np.zeros(n)
+    ps = np.zeros(n)
+    best_x, best_loss = mean, np.inf
+    evaluations = 0
+    iterations = 0
+    history = []
+
+    while evaluations < max_evaluations:
+
+        eigenvalues, basis = np.linalg.eigh(covariance)
+        scale = np.sqrt(np.maximum(eigenvalues, 1e-20))
+
+        y = (rng.standard_normal((population_size, n)) * scale) @ basis.T
+        x = np.clip(mean + sigma * y, 0, 1)
+        y = (x - mean) / sigma
+        values = function(x)
+        evaluations += population_size
+        iterations += 1
+
+        order = np.argsort(values, kind="stable")
+        if values[order[0]] < best_loss:
+            best_x, best_loss = x[order[0]], float(values[order[0]])
+
+        selected = y[order[:mu]]
+        step = weights @ selected
+        mean = mean + sigma * step
+
+        ps = (1 - cs) * ps + math.sqrt(cs * (2 - cs) * mueff) * (basis @ ((basis.T @ step) / scale))
+        hsig = np.linalg.norm(ps) / math.sqrt(1 - (1 - cs) ** (2 * iterations)) / chi_n < 1.4 + 2 / (n + 1)
+        pc = (1 - cc) * pc + hsig * math.sqrt(cc * (2 - cc) * mueff) * step
+        covariance = (
+            (1 - c1 - cmu) * covariance
+            + c1 * (np.outer(pc, pc) + (1 - hsig) * cc * (2 - cc) * covariance)
+            + cmu * (selected.T * weights) @ selected
+        )
+        covariance = (covariance + covariance.T) / 2
+        sigma *= math.exp((cs / damps) * (np.linalg.norm(ps) / chi_n - 1))
+
+        progress = {"iteration": iterations, "evaluations": evaluations, "loss": best_loss}
+        history.append(progress)
+        if callback is not None:
+            callback(progress)
+
+        if sigma * np.sqrt(np.max(np.diag(covariance))) < xtol:
+            break
+
+    return {
+        "x": best_x,
+        "loss": best_loss,
+        "evaluations": evaluations,
+        "iterations": iterations,
+        "history": pd.DataFrame(history, columns=["iteration", "evaluations", "loss"]),
+    }
+
+
+OPTIMIZERS = {
+    "nelder-mead": nelder_mead,
+    "cma-es": cma_es,
+}
+
+
+def calibrate(
+    problem: CalibrationProblem,
+    method: str = "cma-es",
+    x0: Optional[np.ndarray] = None,
+    n_workers: int = 1,
+    max_evaluations: int = 1000,
+    callback: Optional[Callable[[Dict], None]] = None,
+    **options
+) -> Dict:
+    """Fit The Parameters Of `problem` To Its Observations.
+
+    The Optimizer Works In The Unit Box Spanned By The Bounds. With `n_workers` > 1 Every Batch Of
+    Candidates Is Split Over A Process Pool; The Problem Is Sent To Each Worker Once.
+
+    Args:
+        problem (CalibrationProblem): Observations And Calibrated Parameters.
+        method (str, optional): Optimizer Of `OPTIMIZERS`. Defaults to "cma-es".
+        x0 (np.ndarray, optional): Starting Parameter Vector. Defaults to `problem.initial()`.
+        n_workers (int, optional): Number Of Worker Processes. Defaults to 1.
+        max_evaluations (int, optional): Evaluation Budget. Defaults to 1000.
+        callback (Callable[[Dict], None], optional): Called With The Progress Of Every Iteration. Defaults to None.
+        **options: Passed To The Optimizer, E.g. `population_size` Or `seed` Of `cma_es`.
+
+    Returns:
+        Dict: `parameters` (Name: Value), `x` (Parameter Vector), `loss`, `evaluations`, `iterations`
+        And `history` (Best Loss Per Iteration).
+    """
+
+    if method not in OPTIMIZERS:
+        raise ValueError(f"Unknown method {method!r}, expected one of {sorted(OPTIMIZERS)}.")
+
+    lower, upper = problem.bounds[:, 0], problem.bounds[:, 1]
+    span = np.where(upper > lower, upper - lower, 1.0)
+    x0 = problem.initial() if x0 is None else np.asarray(x0, dtype=np.float64)
+
+    def parameters(z: np.ndarray) -> np.ndarray:
+        return lower + z * (upper - lower)
+
+    executor = None
+    if n_workers > 1:
+        executor = ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker, initargs=(problem,))
+
+    def function(z: np.ndarray) -> np.ndarray:
+        candidates = parameters(z)
+        if executor is None or len(candidates) < 2:
+            return problem.loss(candidates)
+        chunks = np.array_split(candidates, min(n_workers, len(candidates)))
+        return np.concatenate(list(executor.map(_worker_loss, chunks)))
+
+    try:
+        result = OPTIMIZERS[method](
+            function, (x0 - lower) / span, max_evaluations=max_evaluations, callback=callback, **options
+        )
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    x = parameters(result.pop("x"))
+
+    return {"parameters": dict(zip(problem.names, x.tolist())), "x": x, **result}
@@ -0,0 +1,159 @@
+"""
+    Columnar Storage Of Dataframes As Memory-mapped NumPy Arrays.
+
+    Every column is written to its own `.npy` file; object (string) columns are stored as integer
+    codes plus a JSON list of categories. Readers memory-map the files, so several processes can
+    share one copy of the data through the page cache.
+"""
+
+import json
+import os
+from typing import List, Optional
+import numpy as np
+import pandas as pd
+
+
+_SCHEMA = "schema.json"
+
+
+def write_columnar(
+    df: pd.DataFrame,
+    path: str
+) -> str:
+    """Write A Dataframe As One `.npy` File Per Column.
+
+    Args:
+        df (pd.DataFrame): Dataframe With Numeric, Boolean, Datetime, Timedelta Or String Columns.
+        path (str): Directory To Write To. Created If Missing.
+
+    Returns:
+        str: The Directory Written.
+    """
+
+    os.makedirs(path, exist_ok=True)
+
+    schema = {"columns": [], "categories": {}, "index": None}
+
+    for i, column in enumerate(df.columns):
+        values = df[column].to_numpy()
+
+        if values.dtype == object:
+            codes, categories = pd.factorize(df[column])
+            values = codes.astype(np.int32)
+            schema["categories"][str(i)] = categories.tolist()
+
+        np.save(os.path.join(path, f"{i}.npy"), values, allow_pickle=False)
+        schema["columns"].append(column)
+
+    if not isinstance(df.index, pd.RangeIndex) or df.index.start != 0 or df.index.step != 1:
+        np.save(os.path.join(path, "index.npy"), df.index.to_numpy(), allow_pickle=False)
+        schema["index"] = "index.npy"
+
+    with open(os.path.join(path, _SCHEMA), "w", encoding="utf-8") as f:
+        json.dump(schema, f)
+
+    return path
+
+
+class ColumnarFrame():
+    """Read-only, Memory-mapped View Of A Dataframe Written By `write_columnar`."""
+
+    def __init__(
+        self,
+        path: str,
+        mmap_mode: Optional[str] = "r"
+    ) -> None:
+
+        with open(os.path.join(path, _SCHEMA), encoding="utf-8") as f:
+            schema = json.load(f)
+
+        self.path = path
+        self.columns = schema["columns"]
+        self.arrays = [
+            np.load(os.path.join(path, f"{i}.npy"), mmap_mode=mmap_mode, allow_pickle=False)
+            for i in range(len(self.columns))
+        ]
+        self.categories = {
+            int(i): np.array(categories, dtype=object) for i, categories in schema["categories"].items()
+        }
+        self.index = (
+            np.load(os.path.join(path, schema["index"]), mmap_mode=mmap_mode, allow_pickle=False)
+            if schema["index"] is not None else None
+        )
+
+    def __len__(
+        self
+    ) -> int:
+
+        return len(self.arrays[0]) if self.arrays else 0
+
+    def column(
+        self,
+        name: str,
+        start: int = 0,
+        stop: Optional[int] = None
+    ) -> np.ndarray:
+        """Values Of One Column Between Rows `start` And `stop`, Decoding String Columns."""
+
+        i = self.columns.index(name)
+
+        return self._decoded(i, self.arrays[i][start:stop])
+
+    def take_column(
+        self,
+        name: str,
+        rows: np.ndarray
+    ) -> np.ndarray:
+        """Values Of One Column At Row Positions `rows`, Copying Only Those Rows Out Of The Map."""
+
+        i = self.columns.index(name)
+
+        return self._decoded(i, self.arrays[i][rows])
+
+    def take(
+        self,
+        rows: np.ndarray,
+        columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """Materialize The Rows At Positions `rows`, Optionally Only Some `columns`.
+
+        The Result Has A Fresh `RangeIndex`; The Stored Index Is Not Applied.
+        """
+
+        columns = self.columns if columns is None else columns
+
+        return pd.DataFrame({name: self.take_column(name, rows) for name in columns}, columns=columns)
+
+    def _decoded(
+        self,
+        i: int,
+        values: np.ndarray
+    ) -> np.ndarray:
+
+        if i in self.categories:
+            decoded = self.categories[i].take(np.maximum(values, 0))
+            decoded[values < 0] = np.nan
+            return decoded
+
+        return values
+
+    def slice(
+        self,
+        start: int = 0,
+        stop: Optional[int] = None
+    ) -> pd.DataFrame:
+        """Materialize Rows `start` To `stop` As A Dataframe."""
+
+        stop = len(self) if stop is None else stop
+
+        return pd.DataFrame(
+            {name: self.column(name, start, stop) for name in self.columns},
+            index=self.index[start:stop] if self.index is not None else pd.RangeIndex(start, stop)
+        )
+
+    def to_frame(
+        self
+    ) -> pd.DataFrame:
+        """Materialize The Whole Dataframe."""
+
+        return self.slice(0, len(self))
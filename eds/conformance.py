@@ -0,0 +1,421 @@
+"""
+    Conformance Of Alternative Engines To The Reference Engine.
+
+    `check_conformance` runs `estimate_disease_severity` ("reference") alongside other engines on all
+    or a sample of the plantings of a batch and reports, per run and variable, the largest absolute
+    and relative divergence of the daily trajectories and of the `Sev50%`, `SevMAX` and `AUC` metrics.
+    A golden dataset (`write_golden_dataset`) freezes reference results for fixed inputs, so later
+    changes to the reference engine itself are caught by `check_golden_dataset`.
+"""
+
+import hashlib
+import os
+import shutil
+from typing import Dict, Hashable, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from .calculation_crop_disease_severity import ENGINES, _check_engine, _location_results
+from .field_data_preparation import RepeatedYears, field_data_preparation
+
+
+METRICS = ["Sev50%", "SevMAX", "AUC"]
+
+_KEY = ["locationId", "number_applications", "genetic_mechanistic"]
+
+_GOLDEN_WEATHER = "weather.csv"
+_GOLDEN_PLANTINGS = "plantings.csv"
+_GOLDEN_RESULTS = "results.csv"
+_GOLDEN_TRAJECTORIES = "trajectories.csv.gz"
+
+
+class ConformanceError(AssertionError):
+    """An Engine Diverged From The Reference Beyond Tolerance."""
+
+
+class _TrajectoryCollector():
+    """Keep The Full Daily Frames Handed Over As `trajectories` By The Driver."""
+
+    def __init__(
+        self
+    ) -> None:
+
+        self.frames = {}
+
+    def append(
+        self,
+        key: Hashable,
+        trajectory: pd.DataFrame
+    ) -> bool:
+
+        self.frames[key] = trajectory
+
+        return True
+
+
+def _sampled(
+    key: Hashable,
+    sample_fraction: float,
+    seed: int
+) -> bool:
+
+    if sample_fraction >= 1:
+        return True
+
+    digest = hashlib.blake2b(repr((seed, key)).encode(), digest_size=8).digest()
+
+    return int.from_bytes(digest, "little") < sample_fraction * 2**64
+
+
+def divergence(
+    reference: np.ndarray,
+    candidate: np.ndarray,
+    atol: float = 1e-12,
+    rtol: float = 1e-9
+) -> Tuple[float, float, bool]:
+    """Largest Divergence Of `candidate` From `reference`.
+
+    Values Match Where |candidate - reference| <= atol + rtol * |reference|, As In `np.isclose`; NaN
+    Matches NaN. Arrays Of Different Lengths Diverge Infinitely.
+
+    Returns:
+        Tuple[float, float, bool]: Max Absolute Divergence, Max Relative Divergence (To The Larger
+        Magnitude) And Whether All Values Match.
+    """
+
+    reference = np.asarray(reference, dtype=np.float64)
+    candidate = np.asarray(candidate, dtype=np.float64)
+
+    if reference.shape != candidate.shape:
+        return np.inf, np.inf, False
+
+    both_nan = np.isnan(reference) & np.isnan(candidate)
+    difference = np.where(both_nan, 0.0, np.abs(candidate - reference))
+    difference = np.where(np.isnan(difference), np.inf, difference)
+
+    scale = np.maximum(np.abs(reference), np.abs(candidate))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        relative = np.where(difference == 0, 0.0, difference / scale)
+
+    passed = bool(np.all(difference <= atol + rtol * np.abs(np.nan_to_num(reference))))
+
+    if difference.size == 0:
+        return 0.0, 0.0, passed
+
+    return float(difference.max()), float(np.nanmax(relative)), passed
+
+
+def _compare(
+    engine: str,
+    reference: Dict,
+    candidate: Dict,
+    reference_frames: Dict,
+    candidate_frames: Optional[Dict],
+    atol: float,
+    rtol: float
+) -> List[Dict]:
+    """Divergence Rows Of One Engine, Matching Runs On `_KEY`."""
+
+    rows = []
+
+    for key, expected in reference.items():
+
+        actual = candidate.get(key)
+        variables = {}
+
+        if actual is None:
+            variables["missing"] = (np.inf, np.inf, False)
+        else:
+            for name in METRICS:
+                variables[name] = divergence([expected[name]], [actual[name]], atol=atol, rtol=rtol)
+
+            frame_key = (key[0], int(key[1]), key[2])
+            if candidate_frames is not None and frame_key in reference_frames:
+                expected_frame = reference_frames[frame_key]
+                actual_frame = candidate_frames[frame_key]
+                for name in expected_frame.columns:
+                    if name in actual_frame.columns:
+                        variables[name] = divergence(
+                            expected_frame[name].to_numpy(), actual_frame[name].to_numpy(), atol=atol, rtol=rtol
+                        )
+
+        for name, (max_abs, max_rel, passed) in variables.items():
+            rows.append(
+                {
+                    "engine": engine,
+                    "locationId": key[0],
+                    "number_applications": key[1],
+                    "genetic_mechanistic": key[2],
+                    "variable": name,
+                    "max_abs": max_abs,
+                    "max_rel": max_rel,
+                    "passed": passed,
+                }
+            )
+
+    return rows
+
+
+def _raise_failures(
+    report: pd.DataFrame
+) -> None:
+
+    failures = report[~report["passed"]]
+
+    if len(failures):
+        worst = failures.sort_values("max_rel", ascending=False).head(10)
+        raise ConformanceError(
+            f"{len(failures)} of {len(report)} (run, variable) pairs exceed the tolerance:\n"
+            + worst.to_string(index=False)
+        )
+
+
+def _keyed(
+    records: List[Dict]
+) -> Dict[Tuple, Dict]:
+
+    return {tuple(record[k] for k in _KEY): record for record in records}
+
+
+def check_conformance(
+    weather_df_path: str,
+    plantings_df_path: str,
+    crop_parameters: Dict,
+    spray_parameters: pd.DataFrame,
+    genetic_mechanistic_parameters: Dict,
+    engines: List[str] = ["array"],
+    number_of_repeat_years: int = 1,
+    daily_precip_threshold: float = 2,
+    number_applications_list: List[int] = [0, 1, 2, 3],
+    genetic_mechanistic_list: List[str] = ["Susceptible", "Moderate", "Resistant"],
+    sample_fraction: float = 1.0,
+    seed: int = 0,
+    atol: float = 1e-12,
+    rtol: float = 1e-9,
+    raise_on_failure: bool = True
+) -> pd.DataFrame:
+    """Run The Reference Engine Alongside `engines` And Compare Every Run.
+
+    Engines In `ENGINES` Are Compared On Every Trajectory Column And The Metrics; The Other Driver
+    Engines ("batch", "forked", "scenarios", "summary") Only On The Metrics.
+
+    Args:
+        weather_df_path (str): Path To The Data File.
+        plantings_df_path (str): Path To The Info File.
+        crop_parameters (Dict): Crop Parameters Keyed By Crop Name.
+        spray_parameters (pd.DataFrame): Spray Application Parameters.
+        genetic_mechanistic_parameters (Dict): Genetic Mechanistic Parameters.
+        engines (List[str], optional): Compared Engines. Defaults to ["array"].
+        number_of_repeat_years (int, optional): Number Of Repeat Data. Defaults to 1.
+        daily_precip_threshold (float, optional): Daily Precipitation Threshold (mm). Defaults to 2 mm.
+        number_applications_list (List[int], optional): Numbers Of Fungicide Applications. Defaults to [0, 1, 2, 3].
+        genetic_mechanistic_list (List[str], optional): Resistance Classes. Defaults to ["Susceptible", "Moderate", "Resistant"].
+        sample_fraction (float, optional): Fraction Of Plantings Checked, Chosen By A Hash Of `info_id`.
+            Defaults to 1.0 (All).
+        seed (int, optional): Sampling Seed. Defaults to 0.
+        atol (float, optional): Absolute Tolerance. Defaults to 1e-12.
+        rtol (float, optional): Relative Tolerance. Defaults to 1e-9.
+        raise_on_failure (bool, optional): Raise `ConformanceError` When A Tolerance Is Exceeded.
+            Defaults to True.
+
+    Returns:
+        pd.DataFrame: One Row Per (engine, run, variable) With `max_abs`, `max_rel` And `passed`.
+    """
+
+    for engine in engines:
+        _check_engine(engine)
+
+    data = field_data_preparation(
+        weather_df_path=weather_df_path,
+        plantings_df_path=plantings_df_path,
+        number_of_repeat_years=number_of_repeat_years,
+        daily_precip_threshold=daily_precip_threshold,
+        as_view=True,
+        date_format=None,
+    )
+
+    if isinstance(data, RepeatedYears):
+        sampled = [info_id for info_id in data.info_ids if _sampled(info_id, sample_fraction, seed)]
+        data = data.plantings(sampled)
+
+    kwargs = dict(
+        crop_parameters=crop_parameters,
+        spray_parameters=spray_parameters,
+        genetic_mechanistic_parameters=genetic_mechanistic_parameters,
+        number_applications_list=number_applications_list,
+        genetic_mechanistic_list=genetic_mechanistic_list,
+    )
+
+    reference_frames = _TrajectoryCollector()
+    reference = _keyed(_location_results(data, engine="reference", trajectories=reference_frames, **kwargs))
+    rows = []
+
+    for engine in engines:
+        if engine in ENGINES:
+            frames = _TrajectoryCollector()
+            candidate = _keyed(_location_results(data, engine=engine, trajectories=frames, **kwargs))
+            frames = frames.frames
+        else:
+            candidate = _keyed(_location_results(data, engine=engine, **kwargs))
+            frames = None
+
+        rows += _compare(engine, reference, candidate, reference_frames.frames, frames, atol=atol, rtol=rtol)
+
+    report = pd.DataFrame(
+        rows, columns=["engine"] + _KEY + ["variable", "max_abs", "max_rel", "passed"]
+    )
+
+    if raise_on_failure:
+        _raise_failures(report)
+
+    return report
+
+
+def write_golden_dataset(
+    directory: str,
+    weather_df_path: str,
+    plantings_df_path: str,
+    crop_parameters: Dict,
+    spray_parameters: pd.DataFrame,
+    genetic_mechanistic_parameters: Dict,
+    number_applications_list: List[int] = [0, 1, 2, 3],
+    genetic_mechanistic_list: List[str] = ["Susceptible", "Moderate", "Resistant"],
+    variables: List[str] = ["Sev", "I", "L", "RI"]
+) -> pd.DataFrame:
+    """Store Inputs And Reference Results As A Golden Dataset.
+
+    The Directory Holds Copies Of Both Input Files, The Reference Metrics (`results.csv`) And The Daily
+    `variables` Of Every Run (`trajectories.csv.gz`), Written With Full float64 Precision.
+
+    Args:
+        directory (str): Output Directory. Created If Missing.
+        weather_df_path (str): Path To The Data File.
+        plantings_df_path (str): Path To The Info File.
+        crop_parameters (Dict): Crop Parameters Keyed By Crop Name.
+        spray_parameters (pd.DataFrame): Spray Application Parameters.
+        genetic_mechanistic_parameters (Dict): Genetic Mechanistic Parameters.
+        number_applications_list (List[int], optional): Numbers Of Fungicide Applications. Defaults to [0, 1, 2, 3].
+        genetic_mechanistic_list (List[str], optional): Resistance Classes. Defaults to ["Susceptible", "Moderate", "Resistant"].
+        variables (List[str], optional): Stored Trajectory Columns. Defaults to ["Sev", "I", "L", "RI"].
+
+    Returns:
+        pd.DataFrame: Reference Metrics.
+    """
+
+    os.makedirs(directory, exist_ok=True)
+    shutil.copyfile(weather_df_path, os.path.join(directory, _GOLDEN_WEATHER))
+    shutil.copyfile(plantings_df_path, os.path.join(directory, _GOLDEN_PLANTINGS))
+
+    data = field_data_preparation(
+        os.path.join(directory, _GOLDEN_WEATHER), os.path.join(directory, _GOLDEN_PLANTINGS),
+        as_view=True, date_format=None
+    )
+    frames = _TrajectoryCollector()
+    results = pd.DataFrame.from_dict(
+        _location_results(
+            data,
+            crop_parameters=crop_parameters,
+            spray_parameters=spray_parameters,
+            genetic_mechanistic_parameters=genetic_mechanistic_parameters,
+            number_applications_list=number_applications_list,
+            genetic_mechanistic_list=genetic_mechanistic_list,
+            engine="reference",
+            trajectories=frames,
+        )
+    )
+
+    trajectories = pd.concat(
+        [
+            frame[variables].assign(
+                locationId=key[0], number_applications=key[1], genetic_mechanistic=key[2], day=np.arange(1, len(frame) + 1)
+            )
+            for key, frame in frames.frames.items()
+        ],
+        ignore_index=True
+    )[_KEY + ["day"] + variables]
+
+    results.to_csv(os.path.join(directory, _GOLDEN_RESULTS), index=False, float_format="%.17g")
+    trajectories.to_csv(
+        os.path.join(directory, _GOLDEN_TRAJECTORIES), index=False, float_format="%.17g",
+        compression={"method": "gzip", "mtime": 0}
+    )
+
+    return results
+
+
+def check_golden_dataset(
+    directory: str,
+    crop_parameters: Dict,
+    spray_parameters: pd.DataFrame,
+    genetic_mechanistic_parameters: Dict,
+    engines: List[str] = ["reference"],
+    atol: float = 1e-12,
+    rtol: float = 1e-9,
+    raise_on_failure: bool = True
+) -> pd.DataFrame:
+    """Compare `engines` On The Inputs Of A Golden Dataset With Its Stored Reference Results.
+
+    The Scenarios Are Those Stored In The Dataset. Engines In `ENGINES` Are Also Compared On The Stored
+    Trajectory Columns.
+
+    Args:
+        directory (str): Golden Dataset Directory, See `write_golden_dataset`.
+        crop_parameters (Dict): Crop Parameters Keyed By Crop Name.
+        spray_parameters (pd.DataFrame): Spray Application Parameters.
+        genetic_mechanistic_parameters (Dict): Genetic Mechanistic Parameters.
+        engines (List[str], optional): Checked Engines. Defaults to ["reference"].
+        atol (float, optional): Absolute Tolerance. Defaults to 1e-12.
+        rtol (float, optional): Relative Tolerance. Defaults to 1e-9.
+        raise_on_failure (bool, optional): Raise `ConformanceError` When A Tolerance Is Exceeded.
+            Defaults to True.
+
+    Returns:
+        pd.DataFrame: One Row Per (engine, run, variable), See `check_conformance`.
+    """
+
+    for engine in engines:
+        _check_engine(engine)
+
+    # Round-trip parsing, so the stored 17 digits give back the exact float64 values.
+    expected = pd.read_csv(
+        os.path.join(directory, _GOLDEN_RESULTS), dtype={"Date1": str, "Date2": str}, float_precision="round_trip"
+    )
+    stored = pd.read_csv(os.path.join(directory, _GOLDEN_TRAJECTORIES), float_precision="round_trip")
+    variables = [c for c in stored.columns if c not in _KEY + ["day"]]
+    reference_frames = {
+        (key[0], int(key[1]), key[2]): frame[variables].reset_index(drop=True)
+        for key, frame in stored.groupby(_KEY, sort=False)
+    }
+
+    data = field_data_preparation(
+        os.path.join(directory, _GOLDEN_WEATHER), os.path.join(directory, _GOLDEN_PLANTINGS),
+        as_view=True, date_format=None
+    )
+    kwargs = dict(
+        crop_parameters=crop_parameters,
+        spray_parameters=spray_parameters,
+        genetic_mechanistic_parameters=genetic_mechanistic_parameters,
+        number_applications_list=list(pd.unique(expected["number_applications"])),
+        genetic_mechanistic_list=list(pd.unique(expected["genetic_mechanistic"])),
+    )
+    reference = _keyed(expected.to_dict("records"))
+    rows = []
+
+    for engine in engines:
+        if engine in ENGINES:
+            frames = _TrajectoryCollector()
+            candidate = _keyed(_location_results(data, engine=engine, trajectories=frames, **kwargs))
+            frames = {key: frame[variables] for key, frame in frames.frames.items()}
+        else:
+            candidate = _keyed(_location_results(data, engine=engine, **kwargs))
+            frames = None
+
+        rows += _compare(engine, reference, candidate, reference_frames, frames, atol=atol, rtol=rtol)
+
+    report = pd.DataFrame(
+        rows, columns=["engine"] + _KEY + ["variable", "max_abs", "max_rel", "passed"]
+    )
+
+    if raise_on_failure:
+        _raise_failures(report)
+
+    return report
@@ -7,6 +7,7 @@ from typing import Dict, List, Optional, Tuple, Union
 import numpy as np
 import pandas as pd
 from . import utils
+from .instrumentation import Instrumentation, _instrumentation
 
 
 def estimate_disease_severity_day_one(
@@ -25,6 +26,9 @@ def estimate_disease_severity_day_one(
     ri_series: pd.Series,
     is_fungicide: bool = False,
     fungicide: pd.DataFrame = pd.DataFrame(),
+    rc_w: Optional[np.ndarray] = None,
+    coefficients: Optional[Dict[str, np.ndarray]] = None,
+    fungicide_schedule: Optional[utils.FungicideSchedule] = None,
 ) -> Tuple[pd.DataFrame, pd.Series]:
     """E stimate Disease Severity From Weather Data And Crop-specific Tuning Parameters For Day One.
 
@@ -50,6 +54,12 @@ def estimate_disease_severity_day_one(
             `spray_number`
             `spray_moment`
             `spray_eff`
+        rc_w (np.ndarray, optional): Precomputed Antecedent Precipitation Conditions Scores, See
+            `utils.calculate_antecedent_precipitation_conditions_scores`. Defaults to None.
+        coefficients (Dict[str, np.ndarray], optional): Precomputed Daily `ip`, `p` And `RcT`, See
+            `utils.CropLookupTables.temperature_coefficients`. Defaults to None.
+        fungicide_schedule (utils.FungicideSchedule, optional): Precomputed Daily Fungicide State,
+            Used Instead Of Filtering `fungicide`. Defaults to None.
 
     Returns:
         Tuple[pd.DataFrame, pd.Series]: Dataframe and Series.
@@ -63,12 +73,18 @@ def estimate_disease_severity_day_one(
     results_day["p_opt"] = p_opt
     results_day["ip_opt"] = ip_opt
     results_day["Temp"] = weather_df["Temperature"].iloc[0]
-    results_day["ip"] = ip_opt * np.interp(
-        results_day["Temp"], ip_t_cof[0], ip_t_cof[1]
-    )
+    if coefficients is not None:
+        results_day["ip"] = coefficients["ip"][simulation_day - 1]
+    else:
+        results_day["ip"] = ip_opt * np.interp(
+            results_day["Temp"], ip_t_cof[0], ip_t_cof[1]
+        )
     results_day["RRDD"] = 0.0001
     results_day["I"] = results_day["ip"]
-    results_day["p"] = p_opt / np.interp(results_day["Temp"], p_t_cof[0], p_t_cof[1])
+    if coefficients is not None:
+        results_day["p"] = coefficients["p"][simulation_day - 1]
+    else:
+        results_day["p"] = p_opt / np.interp(results_day["Temp"], p_t_cof[0], p_t_cof[1])
     results_day["L"] = 0
     results_day["AUDPC"] = 0
     results_day["GDUsum"] = 0
@@ -106,14 +122,20 @@ def estimate_disease_severity_day_one(
         * results_day["H"]
         * (1 - (results_day["TOTSITES"] / results_day["SITEmax"]))
     )
-    results_day["Rc_W"] = utils.calculate_antecedent_precipitation_conditions_score(
-        days_after_planting=simulation_day,
-        precipitation_occur=weather_df["precip_occur"]
-    )
+    if rc_w is not None:
+        results_day["Rc_W"] = rc_w[simulation_day - 1]
+    else:
+        results_day["Rc_W"] = utils.calculate_antecedent_precipitation_conditions_score(
+            days_after_planting=simulation_day,
+            precipitation_occur=weather_df["precip_occur"]
+        )
     results_day["RRLEX"] = rrlex_par
     results_day["inocp"] = inocp
     results_day["RcOpt"] = rc_opt_par - results_day["RRLEX"]
-    results_day["RcT"] = np.interp(results_day["Temp"], rc_t_input[0], rc_t_input[1])
+    if coefficients is not None:
+        results_day["RcT"] = coefficients["RcT"][simulation_day - 1]
+    else:
+        results_day["RcT"] = np.interp(results_day["Temp"], rc_t_input[0], rc_t_input[1])
     results_day["RcA"] = np.interp(results_day["DVS8"], rc_a_input[0], rc_a_input[1])
 
     if is_fungicide:
@@ -121,12 +143,19 @@ def estimate_disease_severity_day_one(
         results_day["RcFCur"] = 1
         results_day["FungEffcCur"] = 1
         results_day["EffRes"] = 1
-        results_day["FungEffecRes"] = utils.calculate_fungicide_effective_residual(
-            days_after_planting=simulation_day,
-            fungicide=fungicide,
-            residual=results_day["Residual"],
-            spray_interval=7
-        )
+        if fungicide_schedule is not None:
+            results_day["FungEffecRes"] = (
+                results_day["Residual"] * fungicide_schedule.active_efficacy[simulation_day - 1]
+                if fungicide_schedule.spray_active[simulation_day - 1]
+                else 1.0
+            )
+        else:
+            results_day["FungEffecRes"] = utils.calculate_fungicide_effective_residual(
+                days_after_planting=simulation_day,
+                fungicide=fungicide,
+                residual=results_day["Residual"],
+                spray_interval=7
+            )
         results_day["RcRes"] = 1
         fung_prod = results_day["RcFCur"] * results_day["FungEffecRes"]
     else:
@@ -157,7 +186,9 @@ def estimate_disease_severity_day_one(
     results_day["RDI"] = 0.000100004821661
     results_day["REM"] = 0.999948211789
 
-    if is_fungicide:
+    if is_fungicide and fungicide_schedule is not None:
+        results_day["FlowRes"] = fungicide_schedule.flow_residual[simulation_day - 1]
+    elif is_fungicide:
         daily_precip = weather_df["precip"].iloc[simulation_day - 1]
         results_day["FlowRes"] = utils.calculate_flow_residual(
             days_after_planting=simulation_day,
@@ -187,10 +218,13 @@ def estimate_disease_severity_day_n(
     results_day: Dict,
     ri_series: pd.Series,
     results_list: List,
-    rt_count: np.array,
+    rt_schedule: utils.RTReleaseSchedule,
     is_fungicide: bool = False,
     fungicide: pd.DataFrame = pd.DataFrame(),
     fungicide_residual: pd.DataFrame = pd.DataFrame(),
+    rc_w: Optional[np.ndarray] = None,
+    coefficients: Optional[Dict[str, np.ndarray]] = None,
+    fungicide_schedule: Optional[utils.FungicideSchedule] = None,
 ) -> Tuple[pd.DataFrame, pd.Series]:
     """Estimate Disease Severity From Weather Data And Crop-specific Tuning Parameters For Day N.
 
@@ -212,13 +246,19 @@ def estimate_disease_severity_day_n(
         results_day (Dict): _description_
         ri_series (pd.Series): _description_
         results_list (List): _description_
-        rt_count (np.array): _description_
+        rt_schedule (utils.RTReleaseSchedule): Infections Waiting Out Their Latent Period.
         is_fungicide (bool, optional): Whether Or Not Fungicide Was Applied. Defaults to False.
         fungicide (pd.DataFrame, optional): _description_. Defaults to pd.DataFrame(). Necessary Columns:
             `spray_number`
             `spray_moment`
             `spray_eff`
         fungicide_residual (pd.DataFrame, optional): _description_. Defaults to pd.DataFrame().
+        rc_w (np.ndarray, optional): Precomputed Antecedent Precipitation Conditions Scores, See
+            `utils.calculate_antecedent_precipitation_conditions_scores`. Defaults to None.
+        coefficients (Dict[str, np.ndarray], optional): Precomputed Daily `ip`, `p` And `RcT`, See
+            `utils.CropLookupTables.temperature_coefficients`. Defaults to None.
+        fungicide_schedule (utils.FungicideSchedule, optional): Precomputed Daily Fungicide State,
+            Used Instead Of Filtering `fungicide`. Defaults to None.
 
     Returns:
         Tuple[pd.DataFrame, pd.Series]: Dataframe and Series.
@@ -243,13 +283,17 @@ def estimate_disease_severity_day_n(
 
     results_day["Temp"] = weather_df["Temperature"].iloc[simulation_day - 1]
 
-    results_day["ip"] = ip_opt * np.interp(
-        results_day["Temp"], ip_t_cof[0], ip_t_cof[1]
-    )
+    if coefficients is not None:
+        results_day["ip"] = coefficients["ip"][simulation_day - 1]
+        results_day["p"] = coefficients["p"][simulation_day - 1]
+    else:
+        results_day["ip"] = ip_opt * np.interp(
+            results_day["Temp"], ip_t_cof[0], ip_t_cof[1]
+        )
 
-    results_day["p"] = p_opt / np.interp(
-        results_day["Temp"], p_t_cof[0].values, p_t_cof[1].values
-    )
+        results_day["p"] = p_opt / np.interp(
+            results_day["Temp"], p_t_cof[0].values, p_t_cof[1].values
+        )
 
     results_day["CumuLeak"] = results_day["LeakL"] + results_day["LeakI"]
 
@@ -282,26 +326,39 @@ def estimate_disease_severity_day_n(
         * (1 - (results_day["TOTSITES"] / results_day["SITEmax"]))
     )
 
-    results_day["Rc_W"] = utils.calculate_antecedent_precipitation_conditions_score(
-        days_after_planting=simulation_day,
-        precipitation_occur=weather_df["precip_occur"]
-    )
+    if rc_w is not None:
+        results_day["Rc_W"] = rc_w[simulation_day - 1]
+    else:
+        results_day["Rc_W"] = utils.calculate_antecedent_precipitation_conditions_score(
+            days_after_planting=simulation_day,
+            precipitation_occur=weather_df["precip_occur"]
+        )
 
-    results_day["RcT"] = np.interp(
-        results_day["Temp"], rc_t_input[0], rc_t_input[1]
-    )
+    if coefficients is not None:
+        results_day["RcT"] = coefficients["RcT"][simulation_day - 1]
+    else:
+        results_day["RcT"] = np.interp(
+            results_day["Temp"], rc_t_input[0], rc_t_input[1]
+        )
 
     results_day["RcA"] = np.interp(
         results_day["DVS8"], rc_a_input[0], rc_a_input[1]
     )
 
     if is_fungicide:
-        try:
-            results_day["FungEffcCur"] = fungicide[
-                (fungicide["spray_moment"] <= simulation_day) & (simulation_day <= fungicide["V4"])
-            ]["spray_eff"].iloc[0]
-        except IndexError:
-            results_day["FungEffcCur"] = 1
+        if fungicide_schedule is not None:
+            results_day["FungEffcCur"] = (
+                fungicide_schedule.current_efficacy[simulation_day - 1]
+                if fungicide_schedule.spray_current[simulation_day - 1]
+                else 1
+            )
+        else:
+            try:
+                results_day["FungEffcCur"] = fungicide[
+                    (fungicide["spray_moment"] <= simulation_day) & (simulation_day <= fungicide["V4"])
+                ]["spray_eff"].iloc[0]
+            except IndexError:
+                results_day["FungEffcCur"] = 1
 
         results_day["RcFCur"] = (
             results_day["FungEffcCur"]
@@ -360,12 +417,18 @@ def estimate_disease_severity_day_n(
 
     if simulation_day > results_day["ip"]:
 
-        if (simulation_day - 1) == len(results_list):
-            results_day["REM"] = results_list[math.ceil(simulation_day - results_day["ip"]) - 2]["RT"]
-        else:
-            results_day["REM"] = results_list[math.ceil(simulation_day - results_day["ip"]) - 1]["RT"]
+        # RT Of Day ceil(day - ip) - 1; Day 0 Wraps To The Previous Day.
+        rem_day = math.ceil(simulation_day - results_day["ip"]) - 1
 
-    if is_fungicide:
+        if rem_day < 1:
+            rem_day += simulation_day - 1
+
+        results_day["REM"] = rt_schedule.released[rem_day]
+
+    if is_fungicide and fungicide_schedule is not None:
+        results_day["FlowRes"] = fungicide_schedule.flow_residual[simulation_day - 1]
+
+    elif is_fungicide:
         daily_precip = weather_df["precip"].iloc[simulation_day - 1]
 
         results_day["FlowRes"] = utils.calculate_flow_residual(
@@ -375,12 +438,13 @@ def estimate_disease_severity_day_n(
             spray_interval=7
         )
 
-    rt_count[simulation_day - 1] = round(results_day["p"])
-
-    results_day["RT"] = ri_series[rt_count == 0].sum()
+    rt_schedule.schedule(
+        simulation_day=simulation_day,
+        release_day=simulation_day + round(results_day["p"]),
+        infections=ri_series.iloc[simulation_day - 1]
+    )
 
-    # Counting
-    rt_count -= 1
+    results_day["RT"] = rt_schedule.release(simulation_day)
 
     results_list.append(results_day)
 
@@ -404,6 +468,8 @@ def estimate_disease_severity(
     fungicide: pd.DataFrame = pd.DataFrame(),
     fungicide_residual: pd.DataFrame = pd.DataFrame(),
     days_after_planting: int = 140,
+    record_columns: Optional[List[str]] = None,
+    instrumentation: Optional[Instrumentation] = None,
 ) -> Tuple[pd.DataFrame, int]:
     """Disease Severity Estimate From Weather Data And Crop-specific Tuning Parameters.
 
@@ -427,23 +493,50 @@ def estimate_disease_severity(
         fungicide (pd.DataFrame, optional): _description_. Defaults to pd.DataFrame(). Necessary Columns:
             `spray_number`
             `spray_moment`
-            `spray_eff`
+            `spray_eff` (Or `spray_efficiency`)
+            `V4` (Optional, Defaults To `spray_moment` + 7)
         fungicide_residual (pd.DataFrame, optional): Crop-specific Lookup Table. Defaults to pd.DataFrame().
         days_after_planting (int, optional): _description_. Defaults to 140.
+        record_columns (List[str], optional): Return Only These Columns, As float32. Defaults to None (All).
+        instrumentation (Instrumentation, optional): Times The "estimate/setup", "estimate/daily_loop" And
+            "estimate/assembly" Stages. Defaults to None.
 
     Returns:
         Tuple[pd.DataFrame, int]: Dataframe and Final Day After Planting Of Model.
     """
 
+    instrumentation = _instrumentation(instrumentation)
+
     # Input Variables
 
-    weather_df = weather_df.set_index("Day", drop=True)
+    with instrumentation.stage("estimate/setup"):
+        weather_df = weather_df.set_index("Day", drop=True)
 
-    total_days = len(weather_df)
+        total_days = len(weather_df)
 
-    ri_series = pd.Series(np.zeros((total_days)))
+        ri_series = pd.Series(np.zeros((total_days)))
 
-    rt_count = np.array([0] * total_days)
+        rt_schedule = utils.RTReleaseSchedule(total_days)
+
+        rc_w = utils.calculate_antecedent_precipitation_conditions_scores(weather_df["precip_occur"])
+
+        fungicide_schedule = (
+            utils.FungicideSchedule(fungicide, precipitation=weather_df["precip"], spray_interval=7)
+            if is_fungicide else None
+        )
+
+        coefficients = utils.CropLookupTables(
+            ip_t_cof=ip_t_cof,
+            p_t_cof=p_t_cof,
+            rc_t_input=rc_t_input,
+            dvs_8_input=dvs_8_input,
+            rc_a_input=rc_a_input,
+            fungicide_residual=fungicide_residual,
+        ).temperature_coefficients(
+            temperature=weather_df["Temperature"].to_numpy(dtype=np.float64),
+            ip_opt=ip_opt,
+            p_opt=p_opt,
+        )
 
     results_list = []
 
@@ -494,79 +587,91 @@ def estimate_disease_severity(
         "RTinc",
     ]
 
-    for day in range(1, total_days - 2):
-
-        if day == 1:
-
-            results_day, ri_series = estimate_disease_severity_day_one(
-                weather_df=weather_df,
-                ip_t_cof=ip_t_cof,
-                p_t_cof=p_t_cof,
-                rc_t_input=rc_t_input,
-                dvs_8_input=dvs_8_input,
-                rc_a_input=rc_a_input,
-                p_opt=p_opt,
-                inocp=inocp,
-                rrlex_par=rrlex_par,
-                rc_opt_par=rc_opt_par,
-                ip_opt=ip_opt,
-                GDU_treshhold=GDU_treshhold,
-                ri_series=ri_series,
-                is_fungicide=is_fungicide,
-                fungicide=fungicide,
-            )
-
-            results_list = [results_day]
-
-        else:
-
-            results_day = results_day.copy()
-
-            results_day["I"] += (
-                results_day["RT"] + results_day["RLEX"] - results_day["REM"] - results_day["RDI"]
-            )
-
-            results_day["L"] += ri_series.loc[day - 2] - results_day["RT"] - results_day["RDL"]
-
-            results_day["AUDPC"] += results_day["RAUPC"]
-
-            results_day["GDUsum"] += results_day["RTinc"]
-
-            if day > days_after_planting:
-
-                for col in set(output_columns) - {"I", "L", "AUDPC", "GDUsum"}:
-
-                    results_day[col] = 0
-
-                results_list.append(results_day)
-
-                rt_count = rt_count[: len(results_list) + 1]
-
-                break
-
-            results_list, ri_series = estimate_disease_severity_day_n(
-                weather_df=weather_df,
-                ip_t_cof=ip_t_cof,
-                p_t_cof=p_t_cof,
-                rc_t_input=rc_t_input,
-                dvs_8_input=dvs_8_input,
-                rc_a_input=rc_a_input,
-                p_opt=p_opt,
-                inocp=inocp,
-                ip_opt=ip_opt,
-                GDU_treshhold=GDU_treshhold,
-                simulation_day=day,
-                results_day=results_day,
-                ri_series=ri_series,
-                results_list=results_list,
-                rt_count=rt_count,
-                is_fungicide=is_fungicide,
-                fungicide=fungicide,
-                fungicide_residual=fungicide_residual,
-            )
-
-    results = pd.DataFrame.from_dict(results_list)
-
-    results["RI"] = ri_series
+    with instrumentation.stage("estimate/daily_loop"):
+        for day in range(1, total_days - 2):
+
+            if day == 1:
+
+                results_day, ri_series = estimate_disease_severity_day_one(
+                    weather_df=weather_df,
+                    ip_t_cof=ip_t_cof,
+                    p_t_cof=p_t_cof,
+                    rc_t_input=rc_t_input,
+                    dvs_8_input=dvs_8_input,
+                    rc_a_input=rc_a_input,
+                    p_opt=p_opt,
+                    inocp=inocp,
+                    rrlex_par=rrlex_par,
+                    rc_opt_par=rc_opt_par,
+                    ip_opt=ip_opt,
+                    GDU_treshhold=GDU_treshhold,
+                    ri_series=ri_series,
+                    is_fungicide=is_fungicide,
+                    fungicide=fungicide,
+                    rc_w=rc_w,
+                    coefficients=coefficients,
+                    fungicide_schedule=fungicide_schedule,
+                )
+
+                # Day One Infections Are Released On Day Two.
+                rt_schedule.schedule(simulation_day=1, release_day=2, infections=ri_series.iloc[0])
+
+                results_list = [results_day]
+
+            else:
+
+                results_day = results_day.copy()
+
+                results_day["I"] += (
+                    results_day["RT"] + results_day["RLEX"] - results_day["REM"] - results_day["RDI"]
+                )
+
+                results_day["L"] += ri_series.loc[day - 2] - results_day["RT"] - results_day["RDL"]
+
+                results_day["AUDPC"] += results_day["RAUPC"]
+
+                results_day["GDUsum"] += results_day["RTinc"]
+
+                if day > days_after_planting:
+
+                    for col in set(output_columns) - {"I", "L", "AUDPC", "GDUsum"}:
+
+                        results_day[col] = 0
+
+                    results_list.append(results_day)
+
+                    break
+
+                results_list, ri_series = estimate_disease_severity_day_n(
+                    weather_df=weather_df,
+                    ip_t_cof=ip_t_cof,
+                    p_t_cof=p_t_cof,
+                    rc_t_input=rc_t_input,
+                    dvs_8_input=dvs_8_input,
+                    rc_a_input=rc_a_input,
+                    p_opt=p_opt,
+                    inocp=inocp,
+                    ip_opt=ip_opt,
+                    GDU_treshhold=GDU_treshhold,
+                    simulation_day=day,
+                    results_day=results_day,
+                    ri_series=ri_series,
+                    results_list=results_list,
+                    rt_schedule=rt_schedule,
+                    is_fungicide=is_fungicide,
+                    fungicide=fungicide,
+                    fungicide_residual=fungicide_residual,
+                    rc_w=rc_w,
+                    coefficients=coefficients,
+                    fungicide_schedule=fungicide_schedule,
+                )
+
+    with instrumentation.stage("estimate/assembly"):
+        results = pd.DataFrame.from_dict(results_list)
+
+        results["RI"] = ri_series
+
+        if record_columns is not None:
+            results = results[list(record_columns)].astype(np.float32)
 
     return results, day
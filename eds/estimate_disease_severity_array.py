@@ -0,0 +1,861 @@
+"""
+    Array-backed Disease Severity Estimate From Weather Data And Crop Specific Tuning Parameters.
+
+    Runs the same day-one / day-n recurrence as `estimate_disease_severity`, but keeps every state
+    variable in a preallocated NumPy array and reads the weather columns once. Results match the
+    reference engine to within `ARRAY_ENGINE_TOLERANCE` (relative); since both engines release
+    latent infections through the same day-indexed buckets, they are identical in practice.
+"""
+
+import math
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from . import utils
+
+
+ARRAY_ENGINE_TOLERANCE = 1e-12
+
+# Column order of the reference engine output.
+VARIABLES = (
+    "p_opt", "ip_opt", "Temp", "ip", "RRDD", "I", "p", "L", "AUDPC", "GDUsum", "H", "HSEN",
+    "LeakI", "LeakL", "R", "LAT", "ResSpray", "CumuLeak", "DIS", "TOTSITES", "Sev", "DVS8",
+    "RAUPC", "GDU", "RTinc", "SITEmax", "RRG", "RG", "Rc_W", "RRLEX", "inocp", "RcOpt", "RcT",
+    "RcA", "Residual", "RcFCur", "FungEffcCur", "EffRes", "FungEffecRes", "RcRes", "Rc", "COFR",
+    "Agg", "RRSEN", "RSEN", "RLEX", "RDI", "REM", "FlowRes", "RT", "RDL",
+)
+
+FUNGICIDE_VARIABLES = (
+    "ResSpray", "Residual", "RcFCur", "FungEffcCur", "EffRes", "FungEffecRes", "RcRes", "FlowRes",
+)
+
+(
+    _P_OPT, _IP_OPT, _TEMP, _IP, _RRDD, _I, _P, _L, _AUDPC, _GDUSUM, _H, _HSEN,
+    _LEAKI, _LEAKL, _R, _LAT, _RESSPRAY, _CUMULEAK, _DIS, _TOTSITES, _SEV, _DVS8,
+    _RAUPC, _GDU, _RTINC, _SITEMAX, _RRG, _RG, _RC_W, _RRLEX, _INOCP, _RCOPT, _RCT,
+    _RCA, _RESIDUAL, _RCFCUR, _FUNGEFFCCUR, _EFFRES, _FUNGEFFECRES, _RCRES, _RC, _COFR,
+    _AGG, _RRSEN, _RSEN, _RLEX, _RDI, _REM, _FLOWRES, _RT, _RDL,
+) = range(len(VARIABLES))
+
+_INTEGER_VARIABLES = ("Rc_W", "SITEmax", "Agg", "LAT")
+
+# Model Constants.
+_INIT_H = 2500000.0
+_CONST_SITEMAX = 10000000.0
+_CONST_RRDD = 0.0001
+_CONST_RRG = 0.173
+_CONST_RRSEN = 0.002307
+_INIT_RDI = 0.000100004821661
+_INIT_REM = 0.999948211789
+_CONST_AGG = 1
+
+
+class SimulationState():
+    """Everything The Season Loop Carries From One Day To The Next.
+
+    Filled By `simulate_disease_severity(..., stop_day=...)` And Passed Back To Resume The Run, Together
+    With Copies Of The `out` And `ri` Rows Written So Far. Resuming Copies `pending`, So One Snapshot
+    Can Seed Several Runs.
+    """
+
+    __slots__ = ("scalars", "pending")
+
+    def __init__(
+        self
+    ) -> None:
+
+        self.scalars = None
+        self.pending = None
+
+
+def simulate_disease_severity(
+    temperature: np.ndarray,
+    rc_w: np.ndarray,
+    ip_series: np.ndarray,
+    p_series: np.ndarray,
+    rc_t_series: np.ndarray,
+    dvs_8_input: np.ndarray,
+    rc_a_input: np.ndarray,
+    fungicide_residual: np.ndarray,
+    p_opt: float,
+    inocp: float,
+    rrlex_par: float,
+    rc_opt_par: float,
+    ip_opt: float,
+    GDU_treshhold: float,
+    is_fungicide: bool,
+    spray_active: np.ndarray,
+    active_efficacy: np.ndarray,
+    current_efficacy: np.ndarray,
+    flow_residual: np.ndarray,
+    days_after_planting: int,
+    out: np.ndarray,
+    ri: np.ndarray,
+    state: Optional[SimulationState] = None,
+    stop_day: Optional[int] = None,
+    summary_columns: Optional[np.ndarray] = None,
+    reducers: Optional[List] = None,
+) -> Tuple[int, int]:
+    """Run The Season Loop Over Preallocated Arrays.
+
+    `simulate_disease_severity_compiled` Mirrors This Loop Statement For Statement; A Change To One
+    Must Be Made To The Other, See `tests/test_compiled.py`.
+
+    Args:
+        temperature (np.ndarray): Daily Mean Temperature (Degrees C).
+        rc_w (np.ndarray): Daily Antecedent Precipitation Conditions Score, See
+            `utils.calculate_antecedent_precipitation_conditions_scores`.
+        ip_series, p_series, rc_t_series (np.ndarray): Daily `ip`, `p` And `RcT`, See
+            `utils.CropLookupTables.temperature_coefficients`.
+        dvs_8_input, rc_a_input, fungicide_residual (np.ndarray): Lookup Tables As (2, n) Arrays Of
+            Breakpoints And Values (`utils.LookupTable.table`).
+        spray_active, active_efficacy, current_efficacy, flow_residual (np.ndarray): Daily Fungicide
+            State, See `utils.FungicideSchedule`. Only Read When `is_fungicide`.
+        days_after_planting (int): Last Simulated Day After Planting.
+        out (np.ndarray): (total_days, len(VARIABLES)) Array Receiving One Row Per Simulated Day, Or
+            (total_days, len(summary_columns)) In Summary Mode.
+        ri (np.ndarray): Zeroed Array Of Length total_days Receiving The Daily Infection Rate.
+        state (SimulationState, optional): Snapshot To Resume From, Or To Fill When Stopping At
+            `stop_day`. Defaults to None.
+        stop_day (int, optional): Stop Before Simulating This Day, Saving The Loop State Into `state`.
+            Ignored When The Season Ends Earlier. Defaults to None.
+        summary_columns (np.ndarray, optional): Summary Mode: Positions In `VARIABLES` Of The Only
+            Columns Written To `out`. Cannot Be Combined With `state`. Defaults to None.
+        reducers (List[Reducer], optional): Summary Mode: Reducers Fed Every Full Row Through
+            `update`, See `eds.reducers`. Already `reset`. Defaults to None.
+
+    Returns:
+        Tuple[int, int]: Number Of Rows Written And Final Day After Planting Of Model (The Last Day
+        Simulated When Stopped At `stop_day`).
+    """
+
+    total_days = temperature.shape[0]
+    last_day = total_days - 3
+    keep_rows = summary_columns is None and reducers is None
+
+    if keep_rows:
+        rt_history = out[:, _RT]
+    elif state is not None:
+        raise ValueError("Snapshots need the trajectory, they cannot be combined with summary mode.")
+    else:
+        # `REM` reads `RT` of earlier days, the only part of the trajectory still needed.
+        rt_history = np.zeros(total_days)
+        scratch = np.empty(len(VARIABLES))
+        summary_columns = np.zeros(0, dtype=np.intp) if summary_columns is None else summary_columns
+        summary_positions = list(enumerate(int(column) for column in summary_columns))
+        reducers = [] if reducers is None else reducers
+
+    if state is not None and state.scalars is not None:
+        (
+            day, n_rows, temp, ip, I, p, L, AUDPC, GDUsum, H, HSEN, LeakI, LeakL, R, ResSpray,
+            CumuLeak, DIS, TOTSITES, Sev, DVS8, RAUPC, GDU, RTinc, RG, Rc_W, RcOpt, RcT, RcA,
+            Residual, RcFCur, FungEffcCur, EffRes, FungEffecRes, RcRes, FlowRes, fung_prod, Rc,
+            COFR, RSEN, RLEX, RDI, REM, RT, RDL,
+        ) = state.scalars
+        pending = state.pending.copy()
+    else:
+        # Infections bucketed by the day they leave the latent stage (`utils.RTReleaseSchedule`).
+        pending = np.zeros(total_days + 1)
+
+        # First Day initialization.
+        day = 1
+        temp = temperature[0]
+        ip = ip_series[0]
+        I = ip
+        p = p_series[0]
+        L = 0.0
+        AUDPC = 0.0
+        GDUsum = 0.0
+        H = _INIT_H
+        HSEN = 0.0
+        LeakI = 0.0
+        LeakL = 0.0
+        R = 0.0
+        ResSpray = 0.0
+        CumuLeak = LeakL + LeakI
+        DIS = R + I + CumuLeak + L
+        TOTSITES = HSEN + H + DIS
+        Sev = DIS / TOTSITES
+        DVS8 = np.interp(GDUsum, dvs_8_input[0], dvs_8_input[1])
+        RAUPC = Sev if DVS8 < 7 else 0.0
+        GDU = temp - GDU_treshhold
+        RTinc = GDU
+        RG = _CONST_RRG * H * (1 - (TOTSITES / _CONST_SITEMAX))
+        Rc_W = rc_w[day - 1]
+        RcOpt = rc_opt_par - rrlex_par
+        RcT = rc_t_series[0]
+        RcA = np.interp(DVS8, rc_a_input[0], rc_a_input[1])
+
+        Residual = 0.0
+        RcFCur = 1.0
+        FungEffcCur = 1.0
+        EffRes = 1.0
+        FungEffecRes = 1.0
+        RcRes = 1.0
+        FlowRes = 0.0
+        fung_prod = 1.0
+
+        if is_fungicide:
+            Residual = ResSpray
+            if spray_active[0]:
+                FungEffecRes = Residual * active_efficacy[0]
+            fung_prod = RcFCur * FungEffecRes
+
+        Rc = RcOpt * RcT * RcA * Rc_W * fung_prod
+        COFR = 1 - (DIS / (2 * H))
+        ri[0] = Rc * I * np.power(COFR, _CONST_AGG) + 1
+        pending[2] += ri[0]
+        RSEN = _CONST_RRDD + _CONST_RRSEN * H
+        RLEX = rrlex_par * I * COFR
+        RDI = _INIT_RDI
+        REM = _INIT_REM
+
+        if is_fungicide:
+            FlowRes = flow_residual[0]
+
+        RT = 0.0
+        RDL = 0.0
+
+        n_rows = 0
+
+    while True:
+
+        if day + 1 == stop_day:
+            state.scalars = (
+                day, n_rows, temp, ip, I, p, L, AUDPC, GDUsum, H, HSEN, LeakI, LeakL, R, ResSpray,
+                CumuLeak, DIS, TOTSITES, Sev, DVS8, RAUPC, GDU, RTinc, RG, Rc_W, RcOpt, RcT, RcA,
+                Residual, RcFCur, FungEffcCur, EffRes, FungEffecRes, RcRes, FlowRes, fung_prod, Rc,
+                COFR, RSEN, RLEX, RDI, REM, RT, RDL,
+            )
+            state.pending = pending.copy()
+            return n_rows, day
+
+        if keep_rows:
+            row = out[n_rows]
+            row[_P_OPT] = p_opt
+            row[_IP_OPT] = ip_opt
+            row[_TEMP] = temp
+            row[_IP] = ip
+            row[_RRDD] = _CONST_RRDD
+            row[_I] = I
+            row[_P] = p
+            row[_L] = L
+            row[_AUDPC] = AUDPC
+            row[_GDUSUM] = GDUsum
+            row[_H] = H
+            row[_HSEN] = HSEN
+            row[_LEAKI] = LeakI
+            row[_LEAKL] = LeakL
+            row[_R] = R
+            row[_LAT] = 0.0
+            row[_RESSPRAY] = ResSpray
+            row[_CUMULEAK] = CumuLeak
+            row[_DIS] = DIS
+            row[_TOTSITES] = TOTSITES
+            row[_SEV] = Sev
+            row[_DVS8] = DVS8
+            row[_RAUPC] = RAUPC
+            row[_GDU] = GDU
+            row[_RTINC] = RTinc
+            row[_SITEMAX] = _CONST_SITEMAX
+            row[_RRG] = _CONST_RRG
+            row[_RG] = RG
+            row[_RC_W] = Rc_W
+            row[_RRLEX] = rrlex_par
+            row[_INOCP] = inocp
+            row[_RCOPT] = RcOpt
+            row[_RCT] = RcT
+            row[_RCA] = RcA
+            row[_RESIDUAL] = Residual
+            row[_RCFCUR] = RcFCur
+            row[_FUNGEFFCCUR] = FungEffcCur
+            row[_EFFRES] = EffRes
+            row[_FUNGEFFECRES] = FungEffecRes
+            row[_RCRES] = RcRes
+            row[_RC] = Rc
+            row[_COFR] = COFR
+            row[_AGG] = _CONST_AGG
+            row[_RRSEN] = _CONST_RRSEN
+            row[_RSEN] = RSEN
+            row[_RLEX] = RLEX
+            row[_RDI] = RDI
+            row[_REM] = REM
+            row[_FLOWRES] = FlowRes
+            row[_RT] = RT
+            row[_RDL] = RDL
+        else:
+            # Only the reduced variables are kept; the full row is built for `reducers` alone.
+            values = (
+                p_opt, ip_opt, temp, ip, _CONST_RRDD, I, p, L, AUDPC, GDUsum, H, HSEN, LeakI, LeakL, R,
+                0.0, ResSpray, CumuLeak, DIS, TOTSITES, Sev, DVS8, RAUPC, GDU, RTinc, _CONST_SITEMAX,
+                _CONST_RRG, RG, Rc_W, rrlex_par, inocp, RcOpt, RcT, RcA, Residual, RcFCur, FungEffcCur,
+                EffRes, FungEffecRes, RcRes, Rc, COFR, _CONST_AGG, _CONST_RRSEN, RSEN, RLEX, RDI, REM,
+                FlowRes, RT, RDL,
+            )
+            rt_history[n_rows] = RT
+            summary = out[n_rows]
+            for i, column in summary_positions:
+                summary[i] = values[column]
+            if reducers:
+                scratch[:] = values
+                for reducer in reducers:
+                    reducer.update(scratch)
+
+        n_rows += 1
+
+        day += 1
+        if day > last_day:
+            return n_rows, day - 1
+
+        I += RT + RLEX - REM - RDI
+        L += ri[day - 2] - RT - RDL
+        AUDPC += RAUPC
+        GDUsum += RTinc
+
+        if day > days_after_planting:
+            # Past the season: keep the accumulators, zero everything else.
+            row = out[n_rows] if keep_rows else scratch
+            row[:] = 0.0
+            row[_I] = I
+            row[_L] = L
+            row[_AUDPC] = AUDPC
+            row[_GDUSUM] = GDUsum
+            row[_RESSPRAY] = ResSpray
+            row[_RESIDUAL] = Residual
+            row[_RCFCUR] = RcFCur
+            row[_FUNGEFFCCUR] = FungEffcCur
+            row[_EFFRES] = EffRes
+            row[_FUNGEFFECRES] = FungEffecRes
+            row[_RCRES] = RcRes
+            row[_FLOWRES] = FlowRes
+
+            if not keep_rows:
+                out[n_rows] = row[summary_columns]
+                for reducer in reducers:
+                    reducer.update(row)
+
+            return n_rows + 1, day
+
+        H += RG - ri[day - 2] - RSEN - RLEX
+        HSEN += RSEN
+        LeakI += RDI
+        LeakL += RDL
+        R += REM
+
+        if is_fungicide:
+            ResSpray += FlowRes
+
+        temp = temperature[day - 1]
+        ip = ip_series[day - 1]
+        p = p_series[day - 1]
+        CumuLeak = LeakL + LeakI
+        DIS = R + I + CumuLeak + L
+        TOTSITES = HSEN + H + DIS
+        Sev = DIS / TOTSITES
+        DVS8 = np.interp(GDUsum, dvs_8_input[0], dvs_8_input[1])
+        RAUPC = Sev if DVS8 < 7 else 0.0
+        GDU = temp - GDU_treshhold
+        RTinc = GDU
+        RG = _CONST_RRG * H * (1 - (TOTSITES / _CONST_SITEMAX))
+        Rc_W = rc_w[day - 1]
+        RcT = rc_t_series[day - 1]
+        RcA = np.interp(DVS8, rc_a_input[0], rc_a_input[1])
+
+        if is_fungicide:
+            FungEffcCur = current_efficacy[day - 1]
+            RcFCur = FungEffcCur if not np.isnan(FungEffcCur) else 1.0
+            Residual = np.interp(ResSpray, fungicide_residual[0], fungicide_residual[1])
+            RcRes = FungEffcCur * Residual
+            FungEffecRes = RcRes if not np.isnan(FungEffcCur) else 1.0
+            EffRes = FungEffcCur
+            fung_prod = RcFCur * FungEffecRes
+
+        Rc = RcOpt * RcT * RcA * Rc_W * fung_prod
+
+        start = inocp if day > 10 else 0
+
+        COFR = 1 - (DIS / (DIS + H))
+        ri[day - 1] = Rc * I * np.power(COFR, _CONST_AGG) + start
+        RSEN = _CONST_RRDD + _CONST_RRSEN * H
+        RLEX = rrlex_par * I * COFR
+        RDI = I * _CONST_RRDD
+        RDL = L * _CONST_RRDD
+
+        if day > ip:
+            # `results_list[...]` in the reference engine; -1 wraps to the previous day.
+            k = math.ceil(day - ip) - 2
+            if k < 0:
+                k += n_rows
+            REM = rt_history[k]
+
+        if is_fungicide:
+            FlowRes = flow_residual[day - 1]
+
+        release_day = day + round(p)
+        if day <= release_day <= total_days:
+            pending[release_day] += ri[day - 1]
+        RT = pending[day]
+
+
+def estimate_disease_severity_array(
+    weather_df: pd.DataFrame,
+    ip_t_cof: pd.DataFrame,
+    p_t_cof: pd.DataFrame,
+    rc_t_input: pd.DataFrame,
+    dvs_8_input: pd.DataFrame,
+    rc_a_input: pd.DataFrame,
+    p_opt: int,
+    inocp: int,
+    rrlex_par: float,
+    rc_opt_par: float,
+    ip_opt: int,
+    GDU_treshhold: int,
+    is_fungicide: bool = False,
+    fungicide: pd.DataFrame = pd.DataFrame(),
+    fungicide_residual: pd.DataFrame = pd.DataFrame(),
+    days_after_planting: int = 140,
+    record_columns: Optional[List[str]] = None,
+) -> Tuple[pd.DataFrame, int]:
+    """Disease Severity Estimate Using Preallocated NumPy Arrays.
+
+    Drop-in Replacement For `estimate_disease_severity` With The Same Arguments And Output Columns.
+    Values Match The Reference Engine Within `ARRAY_ENGINE_TOLERANCE`; Integer Bookkeeping Columns
+    Other Than `Rc_W`, `SITEmax`, `Agg`, `LAT`, `p_opt`, `ip_opt` And `inocp` Are Returned As float64.
+
+    Args:
+        weather_df (pd.DataFrame): Daily Weather Dataset For A Single Field. Necessary Columns:
+            `Temperature`: Degrees C
+            `precip_occur`: Boolean
+            `precip`: mm
+        ip_t_cof (pd.DataFrame): Crop-specific Lookup Table, Indexed On Temperature (Degrees C).
+        p_t_cof (pd.DataFrame): Crop-specific Lookup Table, Indexed On Temperature (Degrees C).
+        rc_t_input (pd.DataFrame): Crop-specific Lookup Table, Indexed On Temperature (Degrees C).
+        dvs_8_input (pd.DataFrame): Crop Specific Lookup Table, Indexed On Cumulative GDUs.
+        rc_a_input (pd.DataFrame): Crop-specific Lookup Table, Indexed On DVS 8.
+        p_opt (int): Optimal Latent Period.
+        inocp (int): Daily Inoculum Pressure After Day 10.
+        rrlex_par (float): Relative Rate Of Lesion Expansion.
+        rc_opt_par (float): Optimal Basic Infection Rate.
+        ip_opt (int): Optimal Infectious Period.
+        GDU_treshhold (int): Base Temperature For Growing Degree Units.
+        is_fungicide (bool, optional): Whether Or Not Fungicide Was Applied. Defaults to False.
+        fungicide (pd.DataFrame, optional): Defaults to pd.DataFrame(). Necessary Columns:
+            `spray_moment`
+            `spray_eff` (Or `spray_efficiency`)
+            `V4` (Optional, Defaults To `spray_moment` + 7)
+        fungicide_residual (pd.DataFrame, optional): Crop-specific Lookup Table. Defaults to pd.DataFrame().
+        days_after_planting (int, optional): Last Simulated Day After Planting. Defaults to 140.
+        record_columns (List[str], optional): Return Only These Columns, As float32. Defaults to None (All).
+
+    Returns:
+        Tuple[pd.DataFrame, int]: Dataframe and Final Day After Planting Of Model.
+    """
+
+    inputs = _simulation_inputs(
+        weather_df=weather_df,
+        ip_t_cof=ip_t_cof,
+        p_t_cof=p_t_cof,
+        rc_t_input=rc_t_input,
+        dvs_8_input=dvs_8_input,
+        rc_a_input=rc_a_input,
+        p_opt=p_opt,
+        ip_opt=ip_opt,
+        is_fungicide=is_fungicide,
+        fungicide=fungicide,
+        fungicide_residual=fungicide_residual,
+    )
+    total_days = len(inputs["temperature"])
+
+    out = np.empty((total_days, len(VARIABLES)))
+    ri = np.zeros(total_days)
+
+    n_rows, day = simulate_disease_severity(
+        **inputs,
+        p_opt=p_opt,
+        inocp=inocp,
+        rrlex_par=rrlex_par,
+        rc_opt_par=rc_opt_par,
+        ip_opt=ip_opt,
+        GDU_treshhold=GDU_treshhold,
+        is_fungicide=is_fungicide,
+        days_after_planting=days_after_planting,
+        out=out,
+        ri=ri,
+    )
+
+    if record_columns is not None:
+        return pd.DataFrame(
+            {
+                name: (ri if name == "RI" else out[:, VARIABLES.index(name)])[:n_rows].astype(np.float32)
+                for name in record_columns
+            }
+        ), day
+
+    return trajectory_frame(out[:n_rows], ri[:n_rows], p_opt, ip_opt, inocp, is_fungicide), day
+
+
+def estimate_disease_severity_summary(
+    weather_df: pd.DataFrame,
+    ip_t_cof: pd.DataFrame,
+    p_t_cof: pd.DataFrame,
+    rc_t_input: pd.DataFrame,
+    dvs_8_input: pd.DataFrame,
+    rc_a_input: pd.DataFrame,
+    p_opt: int,
+    inocp: int,
+    rrlex_par: float,
+    rc_opt_par: float,
+    ip_opt: int,
+    GDU_treshhold: int,
+    reducers: List,
+    is_fungicide: bool = False,
+    fungicide: pd.DataFrame = pd.DataFrame(),
+    fungicide_residual: pd.DataFrame = pd.DataFrame(),
+    days_after_planting: int = 140,
+) -> Tuple[Dict[str, float], int]:
+    """Summary Metrics Of One Run, Recording Only The Variables The Reducers Read.
+
+    Takes The Arguments Of `estimate_disease_severity_array` Plus The Reducers Of The Metrics. Only
+    The Reduced Columns Are Kept, In A (days, variables) Buffer Handed To Each Reducer's `reduce`;
+    Reducers Without `reduce` Are Fed Every Full Row Through `update` Instead.
+
+    Args:
+        reducers (List[Reducer]): Online Reducers, E.g. `eds.reducers.default_reducers()`. Reset
+            Here, So They Can Be Reused Across Runs.
+
+    Returns:
+        Tuple[Dict[str, float], int]: Metric Keyed By Reducer Name And Final Day After Planting Of Model.
+    """
+
+    inputs = _simulation_inputs(
+        weather_df=weather_df,
+        ip_t_cof=ip_t_cof,
+        p_t_cof=p_t_cof,
+        rc_t_input=rc_t_input,
+        dvs_8_input=dvs_8_input,
+        rc_a_input=rc_a_input,
+        p_opt=p_opt,
+        ip_opt=ip_opt,
+        is_fungicide=is_fungicide,
+        fungicide=fungicide,
+        fungicide_residual=fungicide_residual,
+    )
+    total_days = len(inputs["temperature"])
+
+    for reducer in reducers:
+        reducer.reset(total_days)
+
+    column_reducers = [reducer for reducer in reducers if reducer.reduces_columns()]
+    row_reducers = [reducer for reducer in reducers if not reducer.reduces_columns()]
+    variables = list(dict.fromkeys(v for reducer in column_reducers for v in reducer.variables))
+    summary = np.empty((total_days, len(variables)))
+
+    n_rows, day = simulate_disease_severity(
+        **inputs,
+        p_opt=p_opt,
+        inocp=inocp,
+        rrlex_par=rrlex_par,
+        rc_opt_par=rc_opt_par,
+        ip_opt=ip_opt,
+        GDU_treshhold=GDU_treshhold,
+        is_fungicide=is_fungicide,
+        days_after_planting=days_after_planting,
+        out=summary,
+        ri=np.zeros(total_days),
+        summary_columns=np.array([VARIABLES.index(v) for v in variables], dtype=np.intp),
+        reducers=row_reducers,
+    )
+
+    values = {v: summary[:n_rows, i] for i, v in enumerate(variables)}
+
+    for reducer in column_reducers:
+        reducer.reduce(values)
+
+    return {reducer.name: reducer.result() for reducer in reducers}, day
+
+
+def _simulation_inputs(
+    weather_df: pd.DataFrame,
+    ip_t_cof: pd.DataFrame,
+    p_t_cof: pd.DataFrame,
+    rc_t_input: pd.DataFrame,
+    dvs_8_input: pd.DataFrame,
+    rc_a_input: pd.DataFrame,
+    p_opt: int,
+    ip_opt: int,
+    is_fungicide: bool = False,
+    fungicide: pd.DataFrame = pd.DataFrame(),
+    fungicide_residual: pd.DataFrame = pd.DataFrame(),
+) -> Dict[str, np.ndarray]:
+    """Daily Series And Lookup Tables Of One Run, As `simulate_disease_severity` Arguments."""
+
+    total_days = len(weather_df)
+
+    if total_days < 4:
+        raise ValueError(f"At least 4 days of weather are required, got {total_days}.")
+
+    temperature = weather_df["Temperature"].to_numpy(dtype=np.float64)
+    rc_w = utils.calculate_antecedent_precipitation_conditions_scores(weather_df["precip_occur"])
+
+    if is_fungicide:
+        schedule = utils.FungicideSchedule(fungicide, precipitation=weather_df["precip"], spray_interval=7)
+        spray_active = schedule.spray_active
+        active_efficacy = schedule.active_efficacy
+        current_efficacy = schedule.current_efficacy
+        flow_residual = schedule.flow_residual
+    else:
+        spray_active = np.zeros(0, dtype=bool)
+        active_efficacy = current_efficacy = flow_residual = np.zeros(0)
+
+    tables = utils.CropLookupTables(
+        ip_t_cof=ip_t_cof,
+        p_t_cof=p_t_cof,
+        rc_t_input=rc_t_input,
+        dvs_8_input=dvs_8_input,
+        rc_a_input=rc_a_input,
+        fungicide_residual=fungicide_residual,
+    )
+    coefficients = tables.temperature_coefficients(temperature, ip_opt=ip_opt, p_opt=p_opt)
+
+    return {
+        "temperature": temperature,
+        "rc_w": rc_w,
+        "ip_series": coefficients["ip"],
+        "p_series": coefficients["p"],
+        "rc_t_series": coefficients["RcT"],
+        "dvs_8_input": tables.dvs_8_input.table,
+        "rc_a_input": tables.rc_a_input.table,
+        "fungicide_residual": tables.fungicide_residual.table,
+        "spray_active": spray_active,
+        "active_efficacy": active_efficacy,
+        "current_efficacy": current_efficacy,
+        "flow_residual": flow_residual,
+    }
+
+
+def _fork_inputs(
+    schedule: utils.FungicideSchedule,
+    is_fungicide: bool
+) -> np.ndarray:
+    """(total_days, 5) Fungicide Inputs Of A Schedule, Row `d - 1` Holding What Day `d` Reads.
+
+    `is_fungicide` Is Part Of Every Day's Inputs, So Runs With And Without Fungicide Diverge On Day 1.
+    """
+
+    inputs = np.zeros((len(schedule.flow_residual), 5))
+    inputs[1:, 0] = schedule.current_efficacy[1:]
+    inputs[:, 1] = schedule.flow_residual
+    inputs[0, 2] = schedule.spray_active[0]
+    inputs[0, 3] = schedule.active_efficacy[0]
+    inputs[:, 4] = is_fungicide
+
+    return inputs
+
+
+def _same_inputs(
+    a: np.ndarray,
+    b: np.ndarray
+) -> np.ndarray:
+    """Per-day Equality Of Two `_fork_inputs`, Counting NaN As Equal."""
+
+    return ((a == b) | (np.isnan(a) & np.isnan(b))).all(axis=1)
+
+
+def estimate_disease_severity_forked(
+    weather_df: pd.DataFrame,
+    ip_t_cof: pd.DataFrame,
+    p_t_cof: pd.DataFrame,
+    rc_t_input: pd.DataFrame,
+    dvs_8_input: pd.DataFrame,
+    rc_a_input: pd.DataFrame,
+    p_opt: int,
+    inocp: int,
+    rrlex_par: float,
+    rc_opt_par: float,
+    ip_opt: int,
+    GDU_treshhold: int,
+    fungicides: List[Optional[pd.DataFrame]] = [None],
+    fungicide_residual: pd.DataFrame = pd.DataFrame(),
+    days_after_planting: int = 140,
+) -> List[Tuple[pd.DataFrame, int]]:
+    """Disease Severity Of Several Fungicide Scenarios, Sharing The Days Before They Diverge.
+
+    Scenarios Are Simulated Once Up To The First Day Their Fungicide Inputs Differ; The Loop State
+    Is Then Snapshotted (`SimulationState`) And Each Group Of Scenarios Continues From It. Fungicide
+    Scenarios Share The Days Up To The Earliest `spray_moment`; Scenarios Without Fungicide Run As Their
+    Own Group From Day 1. Each Result Is Bit-identical To Calling `estimate_disease_severity_array`
+    With That Scenario Alone.
+
+    Args:
+        weather_df (pd.DataFrame): Daily Weather Dataset For A Single Field, See
+            `estimate_disease_severity_array`.
+        ip_t_cof, p_t_cof, rc_t_input, dvs_8_input, rc_a_input (pd.DataFrame): Crop-specific Lookup Tables.
+        p_opt (int): Optimal Latent Period.
+        inocp (int): Daily Inoculum Pressure After Day 10.
+        rrlex_par (float): Relative Rate Of Lesion Expansion.
+        rc_opt_par (float): Optimal Basic Infection Rate.
+        ip_opt (int): Optimal Infectious Period.
+        GDU_treshhold (int): Base Temperature For Growing Degree Units.
+        fungicides (List[Optional[pd.DataFrame]], optional): Fungicide Table Of Each Scenario, Or None
+            Without Fungicide. Defaults to [None].
+        fungicide_residual (pd.DataFrame, optional): Crop-specific Lookup Table. Defaults to pd.DataFrame().
+        days_after_planting (int, optional): Last Simulated Day After Planting. Defaults to 140.
+
+    Returns:
+        List[Tuple[pd.DataFrame, int]]: Dataframe and Final Day After Planting Of Model Per Scenario.
+    """
+
+    total_days = len(weather_df)
+
+    if total_days < 4:
+        raise ValueError(f"At least 4 days of weather are required, got {total_days}.")
+
+    temperature = weather_df["Temperature"].to_numpy(dtype=np.float64)
+    precipitation = weather_df["precip"].to_numpy(dtype=np.float64)
+    rc_w = utils.calculate_antecedent_precipitation_conditions_scores(weather_df["precip_occur"])
+
+    tables = utils.CropLookupTables(
+        ip_t_cof=ip_t_cof,
+        p_t_cof=p_t_cof,
+        rc_t_input=rc_t_input,
+        dvs_8_input=dvs_8_input,
+        rc_a_input=rc_a_input,
+        fungicide_residual=fungicide_residual,
+    )
+    coefficients = tables.temperature_coefficients(temperature, ip_opt=ip_opt, p_opt=p_opt)
+
+    # The schedule of a scenario without fungicide is never read.
+    schedules = [
+        utils.FungicideSchedule(
+            fungicide if fungicide is not None else pd.DataFrame(), precipitation=precipitation, spray_interval=7
+        )
+        for fungicide in fungicides
+    ]
+    inputs = [
+        _fork_inputs(schedule, fungicide is not None) for schedule, fungicide in zip(schedules, fungicides)
+    ]
+    results = [None] * len(fungicides)
+
+    def simulate(
+        member: int,
+        out: np.ndarray,
+        ri: np.ndarray,
+        state: SimulationState,
+        stop_day: Optional[int] = None
+    ) -> Tuple[int, int]:
+
+        schedule = schedules[member]
+
+        return simulate_disease_severity(
+            temperature=temperature,
+            rc_w=rc_w,
+            ip_series=coefficients["ip"],
+            p_series=coefficients["p"],
+            rc_t_series=coefficients["RcT"],
+            dvs_8_input=tables.dvs_8_input.table,
+            rc_a_input=tables.rc_a_input.table,
+            fungicide_residual=tables.fungicide_residual.table,
+            p_opt=p_opt,
+            inocp=inocp,
+            rrlex_par=rrlex_par,
+            rc_opt_par=rc_opt_par,
+            ip_opt=ip_opt,
+            GDU_treshhold=GDU_treshhold,
+            is_fungicide=fungicides[member] is not None,
+            spray_active=schedule.spray_active,
+            active_efficacy=schedule.active_efficacy,
+            current_efficacy=schedule.current_efficacy,
+            flow_residual=schedule.flow_residual,
+            days_after_planting=days_after_planting,
+            out=out,
+            ri=ri,
+            state=state,
+            stop_day=stop_day,
+        )
+
+    def finish(
+        members: List[int],
+        out: np.ndarray,
+        ri: np.ndarray,
+        n_rows: int,
+        day: int
+    ) -> None:
+
+        for member in members:
+            is_fungicide = fungicides[member] is not None
+            results[member] = (trajectory_frame(out[:n_rows], ri[:n_rows], p_opt, ip_opt, inocp, is_fungicide), day)
+
+    # Groups still to run: members that agree on every input before `state`'s next day.
+    pending_groups = [(list(range(len(fungicides))), np.empty((total_days, len(VARIABLES))), np.zeros(total_days), SimulationState())]
+
+    while pending_groups:
+
+        members, out, ri, parent = pending_groups.pop()
+        state = SimulationState()
+        state.scalars, state.pending = parent.scalars, parent.pending
+        out, ri = out.copy(), ri.copy()
+
+        agree = np.logical_and.reduce([_same_inputs(inputs[members[0]], inputs[m]) for m in members])
+        diverge = np.flatnonzero(~agree)
+
+        if len(diverge) == 0:
+            finish(members, out, ri, *simulate(members[0], out, ri, state))
+            continue
+
+        stop_day = int(diverge[0]) + 1
+
+        if stop_day > 1:
+            n_rows, day = simulate(members[0], out, ri, state, stop_day=stop_day)
+
+            if state.scalars is None:
+                # The season ended before the scenarios diverged.
+                finish(members, out, ri, n_rows, day)
+                continue
+
+        groups = {}
+        for member in members:
+            key = np.nan_to_num(inputs[member][stop_day - 1], nan=np.inf).tobytes()
+            groups.setdefault(key, []).append(member)
+
+        for group in groups.values():
+            pending_groups.append((group, out, ri, state))
+
+    return results
+
+
+def trajectory_frame(
+    out: np.ndarray,
+    ri: np.ndarray,
+    p_opt: float,
+    ip_opt: float,
+    inocp: float,
+    is_fungicide: bool = False
+) -> pd.DataFrame:
+    """Build The Reference-shaped Output Dataframe From Simulation Arrays.
+
+    Args:
+        out (np.ndarray): (n_days, len(VARIABLES)) Simulation Rows.
+        ri (np.ndarray): Daily Infection Rate, Length n_days.
+        p_opt, ip_opt, inocp (float): Model Parameters, Used To Restore The Column Dtypes.
+        is_fungicide (bool, optional): Whether The Fungicide Columns Are Included. Defaults to False.
+
+    Returns:
+        pd.DataFrame: One Row Per Simulated Day, Columns Ordered As The Reference Engine.
+    """
+
+    columns = [
+        (name, i) for i, name in enumerate(VARIABLES)
+        if is_fungicide or name not in FUNGICIDE_VARIABLES
+    ]
+
+    data = {name: out[:, i] for name, i in columns}
+
+    for name in _INTEGER_VARIABLES:
+        data[name] = data[name].astype(np.int64)
+
+    for name, value in (("p_opt", p_opt), ("ip_opt", ip_opt), ("inocp", inocp)):
+        data[name] = data[name].astype(np.asarray(value).dtype)
+
+    data["RI"] = ri
+
+    return pd.DataFrame(data)
@@ -0,0 +1,362 @@
+"""
+    Compiled Disease Severity Estimate.
+
+    The whole season loop of `estimate_disease_severity_array` (lookup-table interpolation, fungicide
+    state and the RT release buckets) as one kernel over plain arrays and scalars. With Numba
+    installed the kernel is compiled with `cache=True`, so the machine code is kept next to this module
+    and later processes skip the JIT; without Numba the same kernel runs as plain Python over NumPy
+    arrays and gives identical results. Compiled results agree with the array engine to
+    `ARRAY_ENGINE_TOLERANCE`, since the compiled `np.power` can differ from NumPy's in the last bit.
+"""
+
+import math
+from typing import List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from .estimate_disease_severity_array import (
+    VARIABLES, _AGG, _AUDPC, _COFR, _CONST_AGG, _CONST_RRDD, _CONST_RRG, _CONST_RRSEN,
+    _CONST_SITEMAX, _CUMULEAK, _DIS, _DVS8, _EFFRES, _FLOWRES, _FUNGEFFCCUR, _FUNGEFFECRES, _GDU,
+    _GDUSUM, _H, _HSEN, _I, _INIT_H, _INIT_RDI, _INIT_REM, _INOCP, _IP, _IP_OPT, _L, _LAT, _LEAKI,
+    _LEAKL, _P, _P_OPT, _R, _RAUPC, _RC, _RC_W, _RCA, _RCFCUR, _RCOPT, _RCRES, _RCT, _RDI, _RDL,
+    _REM, _RESIDUAL, _RESSPRAY, _RG, _RLEX, _RRDD, _RRG, _RRLEX, _RRSEN, _RSEN, _RT, _RTINC, _SEV,
+    _SITEMAX, _TEMP, _TOTSITES, _simulation_inputs, trajectory_frame,
+)
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+NUMBA_AVAILABLE = numba is not None
+
+
+def _compile(
+    function
+):
+    """`numba.njit` With An On-disk Cache, Or `function` Itself Without Numba."""
+
+    if numba is None:
+        return function
+
+    # NumPy semantics for float division by zero (inf/nan, as in the array engine).
+    return numba.njit(cache=True, error_model="numpy")(function)
+
+
+@_compile
+def simulate_disease_severity_compiled(
+    temperature: np.ndarray,
+    rc_w: np.ndarray,
+    ip_series: np.ndarray,
+    p_series: np.ndarray,
+    rc_t_series: np.ndarray,
+    dvs_8_input: np.ndarray,
+    rc_a_input: np.ndarray,
+    fungicide_residual: np.ndarray,
+    p_opt: float,
+    inocp: float,
+    rrlex_par: float,
+    rc_opt_par: float,
+    ip_opt: float,
+    GDU_treshhold: float,
+    is_fungicide: bool,
+    spray_active: np.ndarray,
+    active_efficacy: np.ndarray,
+    current_efficacy: np.ndarray,
+    flow_residual: np.ndarray,
+    days_after_planting: int,
+    out: np.ndarray,
+    ri: np.ndarray,
+) -> Tuple[int, int]:
+    """Season Loop Kernel, Same Arguments As `simulate_disease_severity` Without Snapshots Or Summaries.
+
+    The Body Mirrors `simulate_disease_severity` Statement For Statement; A Change To One Must Be Made
+    To The Other. `tests/test_compiled.py` Compares Both On Randomized Inputs, Day By Day.
+
+    Returns:
+        Tuple[int, int]: Number Of Rows Written And Final Day After Planting Of Model.
+    """
+
+    total_days = temperature.shape[0]
+    last_day = total_days - 3
+    pending = np.zeros(total_days + 1)
+
+    # First Day initialization.
+    day = 1
+    temp = temperature[0]
+    ip = ip_series[0]
+    I = ip
+    p = p_series[0]
+    L = 0.0
+    AUDPC = 0.0
+    GDUsum = 0.0
+    H = _INIT_H
+    HSEN = 0.0
+    LeakI = 0.0
+    LeakL = 0.0
+    R = 0.0
+    ResSpray = 0.0
+    CumuLeak = LeakL + LeakI
+    DIS = R + I + CumuLeak + L
+    TOTSITES = HSEN + H + DIS
+    Sev = DIS / TOTSITES
+    DVS8 = np.interp(GDUsum, dvs_8_input[0], dvs_8_input[1])
+    RAUPC = Sev if DVS8 < 7 else 0.0
+    GDU = temp - GDU_treshhold
+    RTinc = GDU
+    RG = _CONST_RRG * H * (1 - (TOTSITES / _CONST_SITEMAX))
+    Rc_W = rc_w[day - 1]
+    RcOpt = rc_opt_par - rrlex_par
+    RcT = rc_t_series[0]
+    RcA = np.interp(DVS8, rc_a_input[0], rc_a_input[1])
+
+    Residual = 0.0
+    RcFCur = 1.0
+    FungEffcCur = 1.0
+    EffRes = 1.0
+    FungEffecRes = 1.0
+    RcRes = 1.0
+    FlowRes = 0.0
+    fung_prod = 1.0
+
+    if is_fungicide:
+        Residual = ResSpray
+        if spray_active[0]:
+            FungEffecRes = Residual * active_efficacy[0]
+        fung_prod = RcFCur * FungEffecRes
+
+    Rc = RcOpt * RcT * RcA * Rc_W * fung_prod
+    COFR = 1 - (DIS / (2 * H))
+    ri[0] = Rc * I * np.power(COFR, _CONST_AGG) + 1
+    pending[2] += ri[0]
+    RSEN = _CONST_RRDD + _CONST_RRSEN * H
+    RLEX = rrlex_par * I * COFR
+    RDI = _INIT_RDI
+    REM = _INIT_REM
+
+    if is_fungicide:
+        FlowRes = flow_residual[0]
+
+    RT = 0.0
+    RDL = 0.0
+
+    n_rows = 0
+
+    while True:
+
+        row = out[n_rows]
+        row[_P_OPT] = p_opt
+        row[_IP_OPT] = ip_opt
+        row[_TEMP] = temp
+        row[_IP] = ip
+        row[_RRDD] = _CONST_RRDD
+        row[_I] = I
+        row[_P] = p
+        row[_L] = L
+        row[_AUDPC] = AUDPC
+        row[_GDUSUM] = GDUsum
+        row[_H] = H
+        row[_HSEN] = HSEN
+        row[_LEAKI] = LeakI
+        row[_LEAKL] = LeakL
+        row[_R] = R
+        row[_LAT] = 0.0
+        row[_RESSPRAY] = ResSpray
+        row[_CUMULEAK] = CumuLeak
+        row[_DIS] = DIS
+        row[_TOTSITES] = TOTSITES
+        row[_SEV] = Sev
+        row[_DVS8] = DVS8
+        row[_RAUPC] = RAUPC
+        row[_GDU] = GDU
+        row[_RTINC] = RTinc
+        row[_SITEMAX] = _CONST_SITEMAX
+        row[_RRG] = _CONST_RRG
+        row[_RG] = RG
+        row[_RC_W] = Rc_W
+        row[_RRLEX] = rrlex_par
+        row[_INOCP] = inocp
+        row[_RCOPT] = RcOpt
+        row[_RCT] = RcT
+        row[_RCA] = RcA
+        row[_RESIDUAL] = Residual
+        row[_RCFCUR] = RcFCur
+        row[_FUNGEFFCCUR] = FungEffcCur
+        row[_EFFRES] = EffRes
+        row[_FUNGEFFECRES] = FungEffecRes
+        row[_RCRES] = RcRes
+        row[_RC] = Rc
+        row[_COFR] = COFR
+        row[_AGG] = _CONST_AGG
+        row[_RRSEN] = _CONST_RRSEN
+        row[_RSEN] = RSEN
+        row[_RLEX] = RLEX
+        row[_RDI] = RDI
+        row[_REM] = REM
+        row[_FLOWRES] = FlowRes
+        row[_RT] = RT
+        row[_RDL] = RDL
+        n_rows += 1
+
+        day += 1
+        if day > last_day:
+            return n_rows, day - 1
+
+        I += RT + RLEX - REM - RDI
+        L += ri[day - 2] - RT - RDL
+        AUDPC += RAUPC
+        GDUsum += RTinc
+
+        if day > days_after_planting:
+            # Past the season: keep the accumulators, zero everything else.
+            row = out[n_rows]
+            row[:] = 0.0
+            row[_I] = I
+            row[_L] = L
+            row[_AUDPC] = AUDPC
+            row[_GDUSUM] = GDUsum
+            row[_RESSPRAY] = ResSpray
+            row[_RESIDUAL] = Residual
+            row[_RCFCUR] = RcFCur
+            row[_FUNGEFFCCUR] = FungEffcCur
+            row[_EFFRES] = EffRes
+            row[_FUNGEFFECRES] = FungEffecRes
+            row[_RCRES] = RcRes
+            row[_FLOWRES] = FlowRes
+            return n_rows + 1, day
+
+        H += RG - ri[day - 2] - RSEN - RLEX
+        HSEN += RSEN
+        LeakI += RDI
+        LeakL += RDL
+        R += REM
+
+        if is_fungicide:
+            ResSpray += FlowRes
+
+        temp = temperature[day - 1]
+        ip = ip_series[day - 1]
+        p = p_series[day - 1]
+        CumuLeak = LeakL + LeakI
+        DIS = R + I + CumuLeak + L
+        TOTSITES = HSEN + H + DIS
+        Sev = DIS / TOTSITES
+        DVS8 = np.interp(GDUsum, dvs_8_input[0], dvs_8_input[1])
+        RAUPC = Sev if DVS8 < 7 else 0.0
+        GDU = temp - GDU_treshhold
+        RTinc = GDU
+        RG = _CONST_RRG * H * (1 - (TOTSITES / _CONST_SITEMAX))
+        Rc_W = rc_w[day - 1]
+        RcT = rc_t_series[day - 1]
+        RcA = np.interp(DVS8, rc_a_input[0], rc_a_input[1])
+
+        if is_fungicide:
+            FungEffcCur = current_efficacy[day - 1]
+            RcFCur = FungEffcCur if not np.isnan(FungEffcCur) else 1.0
+            Residual = np.interp(ResSpray, fungicide_residual[0], fungicide_residual[1])
+            RcRes = FungEffcCur * Residual
+            FungEffecRes = RcRes if not np.isnan(FungEffcCur) else 1.0
+            EffRes = FungEffcCur
+            fung_prod = RcFCur * FungEffecRes
+
+        Rc = RcOpt * RcT * RcA * Rc_W * fung_prod
+
+        start = inocp if day > 10 else 0.0
+
+        COFR = 1 - (DIS / (DIS + H))
+        ri[day - 1] = Rc * I * np.power(COFR, _CONST_AGG) + start
+        RSEN = _CONST_RRDD + _CONST_RRSEN * H
+        RLEX = rrlex_par * I * COFR
+        RDI = I * _CONST_RRDD
+        RDL = L * _CONST_RRDD
+
+        if day > ip:
+            # `results_list[...]` in the reference engine; -1 wraps to the previous day.
+            k = math.ceil(day - ip) - 2
+            if k < 0:
+                k += n_rows
+            REM = out[k, _RT]
+
+        if is_fungicide:
+            FlowRes = flow_residual[day - 1]
+
+        # `round` raises on a non-finite `p` in Python but not under Numba; fail the same way in both.
+        if math.isinf(p):
+            raise OverflowError("cannot convert float infinity to integer")
+        if math.isnan(p):
+            raise ValueError("cannot convert float NaN to integer")
+        release_day = day + round(p)
+        if day <= release_day <= total_days:
+            pending[release_day] += ri[day - 1]
+        RT = pending[day]
+
+
+def estimate_disease_severity_compiled(
+    weather_df: pd.DataFrame,
+    ip_t_cof: pd.DataFrame,
+    p_t_cof: pd.DataFrame,
+    rc_t_input: pd.DataFrame,
+    dvs_8_input: pd.DataFrame,
+    rc_a_input: pd.DataFrame,
+    p_opt: int,
+    inocp: int,
+    rrlex_par: float,
+    rc_opt_par: float,
+    ip_opt: int,
+    GDU_treshhold: int,
+    is_fungicide: bool = False,
+    fungicide: pd.DataFrame = pd.DataFrame(),
+    fungicide_residual: pd.DataFrame = pd.DataFrame(),
+    days_after_planting: int = 140,
+    record_columns: Optional[List[str]] = None,
+) -> Tuple[pd.DataFrame, int]:
+    """Disease Severity Estimate With The Compiled Season Loop.
+
+    Drop-in Replacement For `estimate_disease_severity_array`, With The Same Arguments And Output.
+    Compiled When Numba Is Installed (`NUMBA_AVAILABLE`), Plain Python Otherwise.
+
+    Returns:
+        Tuple[pd.DataFrame, int]: Dataframe and Final Day After Planting Of Model.
+    """
+
+    inputs = _simulation_inputs(
+        weather_df=weather_df,
+        ip_t_cof=ip_t_cof,
+        p_t_cof=p_t_cof,
+        rc_t_input=rc_t_input,
+        dvs_8_input=dvs_8_input,
+        rc_a_input=rc_a_input,
+        p_opt=p_opt,
+        ip_opt=ip_opt,
+        is_fungicide=is_fungicide,
+        fungicide=fungicide,
+        fungicide_residual=fungicide_residual,
+    )
+    total_days = len(inputs["temperature"])
+
+    out = np.empty((total_days, len(VARIABLES)))
+    ri = np.zeros(total_days)
+
+    n_rows, day = simulate_disease_severity_compiled(
+        **inputs,
+        p_opt=float(p_opt),
+        inocp=float(inocp),
+        rrlex_par=float(rrlex_par),
+        rc_opt_par=float(rc_opt_par),
+        ip_opt=float(ip_opt),
+        GDU_treshhold=float(GDU_treshhold),
+        is_fungicide=bool(is_fungicide),
+        days_after_planting=int(days_after_planting),
+        out=out,
+        ri=ri,
+    )
+
+    if record_columns is not None:
+        return pd.DataFrame(
+            {
+                name: (ri if name == "RI" else out[:, VARIABLES.index(name)])[:n_rows].astype(np.float32)
+                for name in record_columns
+            }
+        ), day
+
+    return trajectory_frame(out[:n_rows], ri[:n_rows], p_opt, ip_opt, inocp, is_fungicide), day
@@ -0,0 +1,678 @@
+"""
+    Vectorized Disease Severity Estimate Over Many Runs Sharing One Daily Loop.
+
+    Every state variable is a vector with one entry per run (fungicide scenario, resistance class,
+    planting, ...), so a single pass over the days advances all runs together. Each run follows the
+    same arithmetic as `estimate_disease_severity_array`; results agree to `ARRAY_ENGINE_TOLERANCE`.
+"""
+
+import itertools
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+import numpy as np
+import pandas as pd
+from . import utils
+from .estimate_disease_severity_array import (
+    FUNGICIDE_VARIABLES, VARIABLES,
+    _P_OPT, _IP_OPT, _TEMP, _IP, _RRDD, _I, _P, _L, _AUDPC, _GDUSUM, _H, _HSEN,
+    _LEAKI, _LEAKL, _R, _RESSPRAY, _CUMULEAK, _DIS, _TOTSITES, _SEV, _DVS8,
+    _RAUPC, _GDU, _RTINC, _SITEMAX, _RRG, _RG, _RC_W, _RRLEX, _INOCP, _RCOPT, _RCT,
+    _RCA, _RESIDUAL, _RCFCUR, _FUNGEFFCCUR, _EFFRES, _FUNGEFFECRES, _RCRES, _RC, _COFR,
+    _AGG, _RRSEN, _RSEN, _RLEX, _RDI, _REM, _FLOWRES, _RT, _RDL,
+    _INIT_H, _CONST_SITEMAX, _CONST_RRDD, _CONST_RRG, _CONST_RRSEN, _INIT_RDI, _INIT_REM, _CONST_AGG,
+)
+
+
+_FUNGICIDE_INDEX = np.array([VARIABLES.index(v) for v in FUNGICIDE_VARIABLES])
+
+# Variables Kept (Not Zeroed) On The Row After `days_after_planting`.
+_CARRIED_INDEX = np.array([_I, _L, _AUDPC, _GDUSUM])
+
+
+def _check_finite_release(
+    p: np.ndarray
+) -> None:
+    """Raise Like `round(p)` Does In The Other Engines When A Run's Latent Period Is Not Finite."""
+
+    if np.isinf(p).any():
+        raise OverflowError("cannot convert float infinity to integer")
+
+    if np.isnan(p).any():
+        raise ValueError("cannot convert float NaN to integer")
+
+
+def simulate_disease_severity_batch(
+    temperature: np.ndarray,
+    rc_w: np.ndarray,
+    precip: np.ndarray,
+    ip_series: np.ndarray,
+    p_series: np.ndarray,
+    rc_t_series: np.ndarray,
+    dvs_8_input: np.ndarray,
+    rc_a_input: np.ndarray,
+    fungicide_residual: np.ndarray,
+    p_opt: np.ndarray,
+    inocp: np.ndarray,
+    rrlex_par: np.ndarray,
+    rc_opt_par: np.ndarray,
+    ip_opt: np.ndarray,
+    GDU_treshhold: np.ndarray,
+    is_fungicide: np.ndarray,
+    spray_moment: np.ndarray,
+    spray_end: np.ndarray,
+    spray_eff: np.ndarray,
+    days_after_planting: np.ndarray,
+    variables: Sequence[str] = VARIABLES,
+    spray_interval: int = 7,
+    total_days: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Run The Season Loop For A Batch Of Runs At Once.
+
+    Runs Advance In Lockstep, One Day At A Time. Runs With Shorter Weather Series (`total_days`) Or
+    Seasons (`days_after_planting`) Stop Recording Once They End; Their Remaining Columns Are Left
+    Unspecified And Should Be Masked With The Returned Number Of Valid Days.
+
+    Args:
+        temperature (np.ndarray): (runs, days) Daily Mean Temperature (Degrees C). Runs Sharing
+            Weather Can Pass A Broadcast View.
+        rc_w (np.ndarray): (runs, days) Antecedent Precipitation Conditions Score, See
+            `utils.calculate_antecedent_precipitation_conditions_scores`.
+        precip (np.ndarray): (runs, days) Daily Precipitation (mm).
+        ip_series, p_series, rc_t_series (np.ndarray): (runs, days) Daily `ip`, `p` And `RcT`, See
+            `utils.CropLookupTables.temperature_coefficients`.
+        dvs_8_input, rc_a_input, fungicide_residual (np.ndarray): Lookup Tables As (2, n) Arrays Of
+            Breakpoints And Values (`utils.LookupTable.table`), Shared By All Runs.
+        p_opt, inocp, rrlex_par, rc_opt_par, ip_opt, GDU_treshhold (np.ndarray): Per-run Parameters.
+        is_fungicide (np.ndarray): Per-run Boolean, Whether Or Not Fungicide Was Applied.
+        spray_moment, spray_end, spray_eff (np.ndarray): (runs, sprays) Spray Day, Last Effective
+            Day (`V4`) And Efficacy, Padded With NaN.
+        days_after_planting (np.ndarray): Per-run Last Simulated Day After Planting.
+        variables (Sequence[str], optional): Names From `VARIABLES` To Record. Defaults to all.
+        spray_interval (int, optional): Day Interval For Spraying. Defaults to 7.
+        total_days (np.ndarray, optional): Per-run Length Of The Weather Series. Weather Past It Must
+            Be Padded. Defaults to The Full Width Of `temperature`.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: (runs, days, variables) Trajectories, (runs, days)
+        Daily Infection Rate `RI` And The Per-run Number Of Valid Days (Final Day After Planting).
+    """
+
+    n_runs, n_days = temperature.shape
+
+    if total_days is None:
+        total_days = np.full(n_runs, n_days)
+
+    last_day = np.asarray(total_days) - 3
+
+    if np.any(last_day < 1):
+        raise ValueError(f"At least 4 days of weather are required, got {int(np.min(total_days))}.")
+
+    runs = np.arange(n_runs)
+    record = np.array([VARIABLES.index(v) for v in variables], dtype=np.intp)
+    days_after_planting = np.asarray(days_after_planting)
+    end_day = np.minimum(np.maximum(days_after_planting + 1, 2), last_day)
+    any_fungicide = bool(np.any(is_fungicide))
+
+    s = np.zeros((len(VARIABLES), n_runs))
+    out = np.zeros((n_runs, n_days, len(record)))
+    ri = np.zeros((n_runs, n_days))
+    # RT released on each (1-based) day; entries are final once their day has passed.
+    release = np.zeros((n_runs, n_days + 1))
+
+    with np.errstate(all="ignore"):
+
+        # First Day initialization.
+        temp = temperature[:, 0]
+        s[_P_OPT] = p_opt
+        s[_IP_OPT] = ip_opt
+        s[_TEMP] = temp
+        s[_IP] = ip_series[:, 0]
+        s[_RRDD] = _CONST_RRDD
+        s[_I] = s[_IP]
+        s[_P] = p_series[:, 0]
+        s[_H] = _INIT_H
+        s[_CUMULEAK] = s[_LEAKL] + s[_LEAKI]
+        s[_DIS] = s[_R] + s[_I] + s[_CUMULEAK] + s[_L]
+        s[_TOTSITES] = s[_HSEN] + s[_H] + s[_DIS]
+        s[_SEV] = s[_DIS] / s[_TOTSITES]
+        s[_DVS8] = np.interp(s[_GDUSUM], dvs_8_input[0], dvs_8_input[1])
+        s[_RAUPC] = np.where(s[_DVS8] < 7, s[_SEV], 0.0)
+        s[_GDU] = temp - GDU_treshhold
+        s[_RTINC] = s[_GDU]
+        s[_SITEMAX] = _CONST_SITEMAX
+        s[_RRG] = _CONST_RRG
+        s[_RG] = _CONST_RRG * s[_H] * (1 - (s[_TOTSITES] / _CONST_SITEMAX))
+        s[_RC_W] = rc_w[:, 0]
+        s[_RRLEX] = rrlex_par
+        s[_INOCP] = inocp
+        s[_RCOPT] = rc_opt_par - rrlex_par
+        s[_RCT] = rc_t_series[:, 0]
+        s[_RCA] = np.interp(s[_DVS8], rc_a_input[0], rc_a_input[1])
+        s[_RCFCUR] = 1.0
+        s[_FUNGEFFCCUR] = 1.0
+        s[_EFFRES] = 1.0
+        s[_FUNGEFFECRES] = 1.0
+        s[_RCRES] = 1.0
+        fung_prod = 1.0
+
+        if any_fungicide:
+            schedule = utils.fungicide_schedule_arrays(
+                spray_moment, spray_end, spray_eff, total_days=n_days, spray_interval=spray_interval
+            )
+            active = schedule["spray_active"] & is_fungicide[:, None]
+            flow_residual = np.where(active, precip, 0.0)
+            current_efficacy = schedule["current_efficacy"]
+
+            s[_RESIDUAL] = s[_RESSPRAY]
+            s[_FUNGEFFECRES] = np.where(active[:, 0], s[_RESIDUAL] * schedule["active_efficacy"][:, 0], 1.0)
+            fung_prod = np.where(is_fungicide, s[_RCFCUR] * s[_FUNGEFFECRES], 1.0)
+            s[_FLOWRES] = flow_residual[:, 0]
+
+        s[_RC] = s[_RCOPT] * s[_RCT] * s[_RCA] * s[_RC_W] * fung_prod
+        s[_COFR] = 1 - (s[_DIS] / (2 * s[_H]))
+        s[_AGG] = _CONST_AGG
+        ri[:, 0] = s[_RC] * s[_I] * np.power(s[_COFR], _CONST_AGG) + 1
+        s[_RRSEN] = _CONST_RRSEN
+        s[_RSEN] = _CONST_RRDD + _CONST_RRSEN * s[_H]
+        s[_RLEX] = s[_RRLEX] * s[_I] * s[_COFR]
+        s[_RDI] = _INIT_RDI
+        s[_REM] = _INIT_REM
+        release[:, 2] += ri[:, 0]
+
+        out[:, 0, :] = s[record].T
+
+        for day in range(2, int(end_day.max()) + 1):
+
+            s[_I] += s[_RT] + s[_RLEX] - s[_REM] - s[_RDI]
+            s[_L] += ri[:, day - 2] - s[_RT] - s[_RDL]
+            s[_AUDPC] += s[_RAUPC]
+            s[_GDUSUM] += s[_RTINC]
+
+            terminal = (end_day == day) & (day > days_after_planting)
+            if terminal.any():
+                carried = s[_FUNGICIDE_INDEX][:, terminal]
+
+            s[_H] += s[_RG] - ri[:, day - 2] - s[_RSEN] - s[_RLEX]
+            s[_HSEN] += s[_RSEN]
+            s[_LEAKI] += s[_RDI]
+            s[_LEAKL] += s[_RDL]
+            s[_R] += s[_REM]
+            s[_RESSPRAY] += s[_FLOWRES]
+
+            temp = temperature[:, day - 1]
+            s[_TEMP] = temp
+            s[_IP] = ip_series[:, day - 1]
+            s[_P] = p_series[:, day - 1]
+            s[_CUMULEAK] = s[_LEAKL] + s[_LEAKI]
+            s[_DIS] = s[_R] + s[_I] + s[_CUMULEAK] + s[_L]
+            s[_TOTSITES] = s[_HSEN] + s[_H] + s[_DIS]
+            s[_SEV] = s[_DIS] / s[_TOTSITES]
+            s[_DVS8] = np.interp(s[_GDUSUM], dvs_8_input[0], dvs_8_input[1])
+            s[_RAUPC] = np.where(s[_DVS8] < 7, s[_SEV], 0.0)
+            s[_GDU] = temp - GDU_treshhold
+            s[_RTINC] = s[_GDU]
+            s[_RG] = _CONST_RRG * s[_H] * (1 - (s[_TOTSITES] / _CONST_SITEMAX))
+            s[_RC_W] = rc_w[:, day - 1]
+            s[_RCT] = rc_t_series[:, day - 1]
+            s[_RCA] = np.interp(s[_DVS8], rc_a_input[0], rc_a_input[1])
+
+            if any_fungicide:
+                current = current_efficacy[:, day - 1]
+                notnull = ~np.isnan(current)
+                s[_FUNGEFFCCUR] = np.where(is_fungicide, current, s[_FUNGEFFCCUR])
+                s[_RCFCUR] = np.where(is_fungicide & notnull, current, 1.0)
+                s[_RESIDUAL] = np.where(
+                    is_fungicide,
+                    np.interp(s[_RESSPRAY], fungicide_residual[0], fungicide_residual[1]),
+                    s[_RESIDUAL]
+                )
+                s[_RCRES] = np.where(is_fungicide, current * s[_RESIDUAL], s[_RCRES])
+                s[_FUNGEFFECRES] = np.where(is_fungicide & notnull, s[_RCRES], 1.0)
+                s[_EFFRES] = s[_FUNGEFFCCUR]
+                fung_prod = np.where(is_fungicide, s[_RCFCUR] * s[_FUNGEFFECRES], 1.0)
+
+            s[_RC] = s[_RCOPT] * s[_RCT] * s[_RCA] * s[_RC_W] * fung_prod
+
+            start = inocp if day > 10 else 0
+
+            s[_COFR] = 1 - (s[_DIS] / (s[_DIS] + s[_H]))
+            ri[:, day - 1] = s[_RC] * s[_I] * np.power(s[_COFR], _CONST_AGG) + start
+            s[_RSEN] = _CONST_RRDD + _CONST_RRSEN * s[_H]
+            s[_RLEX] = s[_RRLEX] * s[_I] * s[_COFR]
+            s[_RDI] = s[_I] * _CONST_RRDD
+            s[_RDL] = s[_L] * _CONST_RRDD
+
+            # `results_list[ceil(day - ip) - 2]["RT"]` in the reference engine; -1 wraps to the previous day.
+            # Runs with `day <= ip` (including a non-finite `ip`) keep yesterday's REM.
+            due = day > s[_IP]
+            rem_row = np.ceil(day - np.where(due, s[_IP], day)).astype(np.intp) - 2
+            rem_row = np.clip(np.where(rem_row < 0, rem_row + day - 1, rem_row), 0, day - 2)
+            s[_REM] = np.where(due, release[runs, rem_row + 1], s[_REM])
+
+            if any_fungicide:
+                s[_FLOWRES] = flow_residual[:, day - 1]
+
+            # Schedule today's infections for release `round(p)` days from now. `round` raises on a
+            # non-finite `p` in the other engines, so do the same for runs still in their season.
+            live = (day <= end_day) & ~terminal
+            _check_finite_release(s[_P][live])
+            release_day = day + np.rint(s[_P])
+            scheduled = live & (release_day >= day) & (release_day <= n_days)
+            release[runs[scheduled], release_day[scheduled].astype(np.intp)] += ri[scheduled, day - 1]
+            s[_RT] = release[:, day]
+
+            out[:, day - 1, :] = s[record].T
+
+            if terminal.any():
+                # Past the season: keep the accumulators, zero everything else.
+                row = np.zeros((len(VARIABLES), int(terminal.sum())))
+                row[_CARRIED_INDEX] = s[_CARRIED_INDEX][:, terminal]
+                row[_FUNGICIDE_INDEX] = carried
+                out[terminal, day - 1, :] = row[record].T
+                ri[terminal, day - 1] = 0.0
+
+    return out, ri, end_day
+
+
+def scenario_parameters(
+    spray_parameters: pd.DataFrame,
+    genetic_mechanistic_parameters: Dict,
+    number_applications_list: List[int] = [0, 1, 2, 3],
+    genetic_mechanistic_list: List[str] = ["Susceptible", "Moderate", "Resistant"],
+    spray_interval: int = 7,
+) -> Tuple[pd.DataFrame, Dict[str, np.ndarray]]:
+    """Per-scenario Parameter Vectors For Every (number_applications, genetic_mechanistic) Pair.
+
+    Args:
+        spray_parameters (pd.DataFrame): Spray Application Parameters, See `utils.spray_application_parameters`.
+        genetic_mechanistic_parameters (Dict): Genetic Mechanistic Parameters, See `utils.genetic_mechanistic_parameters`.
+        number_applications_list (List[int], optional): Numbers Of Fungicide Applications. Defaults to [0, 1, 2, 3].
+        genetic_mechanistic_list (List[str], optional): Resistance Classes. Defaults to ["Susceptible", "Moderate", "Resistant"].
+        spray_interval (int, optional): Day Interval For Spraying. Defaults to 7.
+
+    Returns:
+        Tuple[pd.DataFrame, Dict[str, np.ndarray]]: One Row Per Scenario In `itertools.product` Order,
+        And The Matching `p_opt`, `rc_opt_par`, `rrlex_par`, `is_fungicide`, `spray_moment`,
+        `spray_end` And `spray_eff` Arrays.
+    """
+
+    scenarios = pd.DataFrame(
+        list(itertools.product(number_applications_list, genetic_mechanistic_list)),
+        columns=["number_applications", "genetic_mechanistic"]
+    )
+
+    for p in ["p_opt", "rc_opt_par", "rrlex_par"]:
+        scenarios[p] = [genetic_mechanistic_parameters[g][p] for g in scenarios["genetic_mechanistic"]]
+
+    n_sprays = int((spray_parameters["spray_number"] <= max(number_applications_list, default=0)).sum())
+    sprays = {k: np.full((len(scenarios), n_sprays), np.nan) for k in ["spray_moment", "spray_end", "spray_eff"]}
+
+    for i, number_applications in enumerate(scenarios["number_applications"]):
+        if number_applications > 0:
+            moment, end, eff = utils.fungicide_spray_arrays(
+                spray_parameters[spray_parameters["spray_number"] <= number_applications], spray_interval
+            )
+            sprays["spray_moment"][i, :len(moment)] = moment
+            sprays["spray_end"][i, :len(end)] = end
+            sprays["spray_eff"][i, :len(eff)] = eff
+
+    vectors = {p: scenarios[p].to_numpy() for p in ["p_opt", "rc_opt_par", "rrlex_par"]}
+    vectors["is_fungicide"] = scenarios["number_applications"].to_numpy() > 0
+    vectors.update(sprays)
+
+    return scenarios, vectors
+
+
+def estimate_disease_severity_scenarios(
+    weather_df: pd.DataFrame,
+    ip_t_cof: pd.DataFrame,
+    p_t_cof: pd.DataFrame,
+    rc_t_input: pd.DataFrame,
+    dvs_8_input: pd.DataFrame,
+    rc_a_input: pd.DataFrame,
+    spray_parameters: pd.DataFrame,
+    genetic_mechanistic_parameters: Dict,
+    inocp: int,
+    ip_opt: int,
+    GDU_treshhold: int,
+    number_applications_list: List[int] = [0, 1, 2, 3],
+    genetic_mechanistic_list: List[str] = ["Susceptible", "Moderate", "Resistant"],
+    fungicide_residual: pd.DataFrame = pd.DataFrame(),
+    days_after_planting: int = 140,
+    variables: Sequence[str] = VARIABLES,
+) -> Tuple[pd.DataFrame, np.ndarray, np.ndarray, int]:
+    """Disease Severity Estimate For All Fungicide × Resistance Scenarios Of One Field In One Pass.
+
+    Args:
+        weather_df (pd.DataFrame): Daily Weather Dataset For A Single Field. Necessary Columns:
+            `Temperature`: Degrees C
+            `precip_occur`: Boolean
+            `precip`: mm
+        ip_t_cof (pd.DataFrame): Crop-specific Lookup Table, Indexed On Temperature (Degrees C).
+        p_t_cof (pd.DataFrame): Crop-specific Lookup Table, Indexed On Temperature (Degrees C).
+        rc_t_input (pd.DataFrame): Crop-specific Lookup Table, Indexed On Temperature (Degrees C).
+        dvs_8_input (pd.DataFrame): Crop Specific Lookup Table, Indexed On Cumulative GDUs.
+        rc_a_input (pd.DataFrame): Crop-specific Lookup Table, Indexed On DVS 8.
+        spray_parameters (pd.DataFrame): Spray Application Parameters, See `utils.spray_application_parameters`.
+        genetic_mechanistic_parameters (Dict): Genetic Mechanistic Parameters, See `utils.genetic_mechanistic_parameters`.
+        inocp (int): Daily Inoculum Pressure After Day 10.
+        ip_opt (int): Optimal Infectious Period.
+        GDU_treshhold (int): Base Temperature For Growing Degree Units.
+        number_applications_list (List[int], optional): Numbers Of Fungicide Applications. Defaults to [0, 1, 2, 3].
+        genetic_mechanistic_list (List[str], optional): Resistance Classes. Defaults to ["Susceptible", "Moderate", "Resistant"].
+        fungicide_residual (pd.DataFrame, optional): Crop-specific Lookup Table. Defaults to pd.DataFrame().
+        days_after_planting (int, optional): Last Simulated Day After Planting. Defaults to 140.
+        variables (Sequence[str], optional): Names From `VARIABLES` To Record. Defaults to all.
+
+    Returns:
+        Tuple[pd.DataFrame, np.ndarray, np.ndarray, int]: Scenarios (See `scenario_parameters`),
+        (scenarios, days, variables) Trajectories, (scenarios, days) `RI` And Final Day After Planting
+        Of Model. With All `variables`, `trajectory_frame(out[i], ri[i], ...)` Gives The Reference Dataframe.
+    """
+
+    scenarios, vectors = scenario_parameters(
+        spray_parameters=spray_parameters,
+        genetic_mechanistic_parameters=genetic_mechanistic_parameters,
+        number_applications_list=number_applications_list,
+        genetic_mechanistic_list=genetic_mechanistic_list,
+    )
+
+    shape = (len(scenarios), len(weather_df))
+    temperature = weather_df["Temperature"].to_numpy(dtype=np.float64)
+    tables = utils.CropLookupTables(
+        ip_t_cof=ip_t_cof,
+        p_t_cof=p_t_cof,
+        rc_t_input=rc_t_input,
+        dvs_8_input=dvs_8_input,
+        rc_a_input=rc_a_input,
+        fungicide_residual=fungicide_residual,
+    )
+    coefficients = tables.temperature_coefficients(temperature, ip_opt=ip_opt, p_opt=vectors["p_opt"][:, None])
+
+    if vectors["is_fungicide"].any():
+        precip = np.broadcast_to(weather_df["precip"].to_numpy(dtype=np.float64), shape)
+    else:
+        precip = np.zeros(shape)
+
+    out, ri, end_day = simulate_disease_severity_batch(
+        temperature=np.broadcast_to(temperature, shape),
+        rc_w=np.broadcast_to(
+            utils.calculate_antecedent_precipitation_conditions_scores(weather_df["precip_occur"]), shape
+        ),
+        precip=precip,
+        ip_series=np.broadcast_to(coefficients["ip"], shape),
+        p_series=coefficients["p"],
+        rc_t_series=np.broadcast_to(coefficients["RcT"], shape),
+        dvs_8_input=tables.dvs_8_input.table,
+        rc_a_input=tables.rc_a_input.table,
+        fungicide_residual=tables.fungicide_residual.table,
+        p_opt=vectors["p_opt"],
+        inocp=np.full(shape[0], inocp),
+        rrlex_par=vectors["rrlex_par"],
+        rc_opt_par=vectors["rc_opt_par"],
+        ip_opt=np.full(shape[0], ip_opt),
+        GDU_treshhold=np.full(shape[0], GDU_treshhold),
+        is_fungicide=vectors["is_fungicide"],
+        spray_moment=vectors["spray_moment"],
+        spray_end=vectors["spray_end"],
+        spray_eff=vectors["spray_eff"],
+        days_after_planting=np.full(shape[0], days_after_planting),
+        variables=variables,
+    )
+
+    day = int(end_day[0])
+
+    return scenarios, out[:, :day], ri[:, :day], day
+
+
+ENSEMBLE_METRICS = ["Sev50%", "SevMAX", "AUC"]
+
+
+def season_metrics(
+    sev: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """`Sev50%`, `SevMAX` And `AUC` Of Every Run Of A (runs, days) Severity Array, Without A Loop Over Runs.
+
+    As In `calculation_crop_disease_severity`, `AUC` Is The Trapezoid Area Of The Nonzero Values With
+    Day Spacing 1; It Matches `np.trapz(sev[i][sev[i] != 0])` Up To Summation Order. Pad Shorter Runs
+    With NaN.
+
+    Args:
+        sev (np.ndarray): (runs, days) Daily Severity.
+
+    Returns:
+        Dict[str, np.ndarray]: Per-run `Sev50%`, `SevMAX` And `AUC`.
+    """
+
+    sev = np.asarray(sev, dtype=np.float64)
+    nonzero = ~np.isnan(sev) & (sev != 0)
+
+    # Move the nonzero values of every run to its front, in order, and sum the neighbouring pairs.
+    packed = np.take_along_axis(np.where(nonzero, sev, 0.0), np.argsort(~nonzero, axis=1, kind="stable"), axis=1)
+    pairs = (packed[:, 1:] + packed[:, :-1]) / 2.0
+    paired = np.arange(pairs.shape[1]) < nonzero.sum(axis=1)[:, None] - 1
+
+    return {
+        "Sev50%": np.nanmedian(sev, axis=1),
+        "SevMAX": np.nanmax(sev, axis=1),
+        "AUC": np.where(paired, pairs, 0.0).sum(axis=1),
+    }
+
+
+def estimate_disease_severity_ensemble(
+    weather_df: pd.DataFrame,
+    ip_t_cof: pd.DataFrame,
+    p_t_cof: pd.DataFrame,
+    rc_t_input: pd.DataFrame,
+    dvs_8_input: pd.DataFrame,
+    rc_a_input: pd.DataFrame,
+    p_opt: Union[float, np.ndarray],
+    rc_opt_par: Union[float, np.ndarray],
+    rrlex_par: Union[float, np.ndarray],
+    inocp: Union[float, np.ndarray] = 10,
+    ip_opt: Union[float, np.ndarray] = 14,
+    GDU_treshhold: int = 10,
+    is_fungicide: bool = False,
+    fungicide: pd.DataFrame = pd.DataFrame(),
+    fungicide_residual: pd.DataFrame = pd.DataFrame(),
+    days_after_planting: int = 140,
+    quantiles: Sequence[float] = (0.05, 0.25, 0.5, 0.75, 0.95),
+    batch_size: int = 4096,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Disease Severity Metrics Of An Ensemble Of Parameter Draws For One Field.
+
+    The Parameters Are Broadcast To One Member Each, Which Run Together Through
+    `simulate_disease_severity_batch`, `batch_size` Members At A Time. Everything Derived From The
+    Weather (Antecedent Precipitation Scores And Temperature Lookups) Is Computed Once For All Members.
+    Every Member Follows The Arithmetic Of `estimate_disease_severity_array` With The Same Scalar Parameters.
+
+    Args:
+        weather_df (pd.DataFrame): Daily Weather Dataset For A Single Field. Necessary Columns:
+            `Temperature`: Degrees C
+            `precip_occur`: Boolean
+            `precip`: mm
+        ip_t_cof (pd.DataFrame): Crop-specific Lookup Table, Indexed On Temperature (Degrees C).
+        p_t_cof (pd.DataFrame): Crop-specific Lookup Table, Indexed On Temperature (Degrees C).
+        rc_t_input (pd.DataFrame): Crop-specific Lookup Table, Indexed On Temperature (Degrees C).
+        dvs_8_input (pd.DataFrame): Crop Specific Lookup Table, Indexed On Cumulative GDUs.
+        rc_a_input (pd.DataFrame): Crop-specific Lookup Table, Indexed On DVS 8.
+        p_opt (Union[float, np.ndarray]): Optimal Latent Period Of Every Member.
+        rc_opt_par (Union[float, np.ndarray]): Optimal Corrected Basic Infection Rate Of Every Member.
+        rrlex_par (Union[float, np.ndarray]): Relative Rate Of Lesion Expansion Of Every Member.
+        inocp (Union[float, np.ndarray], optional): Daily Inoculum Pressure After Day 10. Defaults to 10.
+        ip_opt (Union[float, np.ndarray], optional): Optimal Infectious Period. Defaults to 14.
+        GDU_treshhold (int, optional): Base Temperature For Growing Degree Units. Defaults to 10.
+        is_fungicide (bool, optional): Whether Or Not Fungicide Was Applied. Defaults to False.
+        fungicide (pd.DataFrame, optional): Fungicide Schedule Shared By All Members, See
+            `utils.fungicide_spray_arrays`. Defaults to pd.DataFrame().
+        fungicide_residual (pd.DataFrame, optional): Crop-specific Lookup Table. Defaults to pd.DataFrame().
+        days_after_planting (int, optional): Last Simulated Day After Planting. Defaults to 140.
+        quantiles (Sequence[float], optional): Quantiles Of The Metrics Over The Members.
+            Defaults to (0.05, 0.25, 0.5, 0.75, 0.95).
+        batch_size (int, optional): Members Simulated Together, Bounding Memory. Defaults to 4096.
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame]: One Row Per Member With Its Parameters And `Sev50%`,
+        `SevMAX` And `AUC`; And The `quantiles` Of The Metrics, Indexed On The Quantile.
+    """
+
+    p_opt, rc_opt_par, rrlex_par, inocp, ip_opt = (
+        np.asarray(p, dtype=np.float64) for p in np.broadcast_arrays(
+            np.atleast_1d(p_opt), np.atleast_1d(rc_opt_par), np.atleast_1d(rrlex_par),
+            np.atleast_1d(inocp), np.atleast_1d(ip_opt)
+        )
+    )
+
+    if p_opt.ndim != 1:
+        raise ValueError("ensemble parameters must be scalars or one-dimensional arrays")
+
+    n_members = len(p_opt)
+    n_days = len(weather_df)
+
+    # Shared by all members.
+    temperature = weather_df["Temperature"].to_numpy(dtype=np.float64)
+    rc_w = utils.calculate_antecedent_precipitation_conditions_scores(weather_df["precip_occur"])
+    precip = weather_df["precip"].to_numpy(dtype=np.float64) if is_fungicide else np.zeros(n_days)
+    tables = utils.CropLookupTables(
+        ip_t_cof=ip_t_cof,
+        p_t_cof=p_t_cof,
+        rc_t_input=rc_t_input,
+        dvs_8_input=dvs_8_input,
+        rc_a_input=rc_a_input,
+        fungicide_residual=fungicide_residual,
+    )
+    ip_coefficient = tables.ip_t_cof(temperature)
+    p_coefficient = tables.p_t_cof(temperature)
+    rc_t_series = tables.rc_t_input(temperature)
+    spray_moment, spray_end, spray_eff = (
+        s[None, :] for s in utils.fungicide_spray_arrays(fungicide if is_fungicide else pd.DataFrame())
+    )
+
+    metrics = {name: np.empty(n_members) for name in ENSEMBLE_METRICS}
+
+    for start in range(0, n_members, batch_size):
+        chunk = slice(start, min(start + batch_size, n_members))
+        shape = (chunk.stop - chunk.start, n_days)
+
+        with np.errstate(divide="ignore"):
+            p_series = p_opt[chunk, None] / p_coefficient
+
+        out, _, end_day = simulate_disease_severity_batch(
+            temperature=np.broadcast_to(temperature, shape),
+            rc_w=np.broadcast_to(rc_w, shape),
+            precip=np.broadcast_to(precip, shape),
+            ip_series=ip_opt[chunk, None] * ip_coefficient,
+            p_series=p_series,
+            rc_t_series=np.broadcast_to(rc_t_series, shape),
+            dvs_8_input=tables.dvs_8_input.table,
+            rc_a_input=tables.rc_a_input.table,
+            fungicide_residual=tables.fungicide_residual.table,
+            p_opt=p_opt[chunk],
+            inocp=inocp[chunk],
+            rrlex_par=rrlex_par[chunk],
+            rc_opt_par=rc_opt_par[chunk],
+            ip_opt=ip_opt[chunk],
+            GDU_treshhold=np.full(shape[0], GDU_treshhold),
+            is_fungicide=np.full(shape[0], is_fungicide),
+            spray_moment=np.broadcast_to(spray_moment, (shape[0], spray_moment.shape[1])),
+            spray_end=np.broadcast_to(spray_end, (shape[0], spray_end.shape[1])),
+            spray_eff=np.broadcast_to(spray_eff, (shape[0], spray_eff.shape[1])),
+            days_after_planting=np.full(shape[0], days_after_planting),
+            variables=["Sev"],
+        )
+
+        for name, values in season_metrics(out[:, :int(end_day[0]), 0]).items():
+            metrics[name][chunk] = values
+
+    members = pd.DataFrame(
+        {
+            "p_opt": p_opt,
+            "rc_opt_par": rc_opt_par,
+            "rrlex_par": rrlex_par,
+            "inocp": inocp,
+            "ip_opt": ip_opt,
+            **metrics,
+        }
+    )
+    summary = pd.DataFrame(
+        np.nanquantile(members[ENSEMBLE_METRICS].to_numpy(), list(quantiles), axis=0),
+        index=pd.Index(list(quantiles), name="quantile"),
+        columns=ENSEMBLE_METRICS,
+    )
+
+    return members, summary
+
+
+def planting_weather_matrix(
+    data: pd.DataFrame,
+    columns: Sequence[str] = ("Temperature", "precip_occur", "precip"),
+) -> Tuple[pd.DataFrame, Dict[str, np.ndarray]]:
+    """Lay Prepared Field Data Out As (plantings, days) Arrays, Each Row Starting At Its Planting Date.
+
+    Args:
+        data (pd.DataFrame): Location Data, See `field_data_preparation`. `date` May Be Formatted
+            As "%Y%m%d" Or Kept As datetime64.
+        columns (Sequence[str], optional): Weather Columns To Lay Out.
+            Defaults to ("Temperature", "precip_occur", "precip").
+
+    Returns:
+        Tuple[pd.DataFrame, Dict[str, np.ndarray]]: One Row Per `info_id` In Order Of Appearance With
+        `Crop`, `obs_planting_delta`, `latitude`, `longitude`, `total_days`, `n_day` (Final Day After
+        Planting Of Model), `Date1`, `Date2` And `N_Days`; And The Weather Arrays, Truncated To The
+        Longest Simulated Season. Float Columns Are Padded With NaN, Boolean Columns With False.
+    """
+
+    info_ids = data["info_id"].unique()
+    code = pd.Categorical(data["info_id"], categories=info_ids).codes
+
+    dates = data["date"]
+
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, format="%Y%m%d")
+
+    planting_date = {dt: pd.to_datetime(dt).normalize() for dt in data["planting_date"].unique()}
+    keep = dates.to_numpy() >= data["planting_date"].map(planting_date).to_numpy(dtype="datetime64[ns]")
+
+    code = code[keep]
+    position = pd.Series(code).groupby(code).cumcount().to_numpy()
+    first = np.flatnonzero(position == 0)
+
+    plantings = pd.DataFrame({"info_id": info_ids})
+    plantings["total_days"] = np.bincount(code, minlength=len(info_ids))
+
+    rows = np.full(len(info_ids), -1)
+    rows[code[first]] = first
+    selected = data[keep].reset_index(drop=True)
+
+    for column in ["Crop", "obs_planting_delta", "latitude", "longitude"]:
+        plantings[column] = selected[column].reindex(rows).to_numpy()
+
+    used = plantings["total_days"].to_numpy() > 0
+    days_after_planting = plantings["obs_planting_delta"].fillna(0).to_numpy(dtype=np.int64)
+    n_day = np.minimum(np.maximum(days_after_planting + 1, 2), plantings["total_days"].to_numpy() - 3)
+    plantings["n_day"] = np.where(used, n_day, 0)
+
+    width = int(min(plantings["n_day"].max() + 3, plantings["total_days"].max())) if used.any() else 0
+    in_window = position < width
+
+    # Row Of `selected` Behind Every (planting, day) Cell, -1 For Padding.
+    index = np.full((len(info_ids), width), -1)
+    index[code[in_window], position[in_window]] = np.flatnonzero(in_window)
+
+    dates = dates.to_numpy()[keep]
+    last = np.where(used, index[np.arange(len(info_ids)), np.maximum(plantings["n_day"].to_numpy() - 1, 0)], -1)
+    date1 = pd.Series(np.where(used, dates[np.maximum(rows, 0)], np.datetime64("NaT")))
+    date2 = pd.Series(np.where(used, dates[np.maximum(last, 0)], np.datetime64("NaT")))
+    plantings["Date1"] = np.where(used, date1.dt.strftime("%Y%m%d"), None)
+    plantings["Date2"] = np.where(used, date2.dt.strftime("%Y%m%d"), None)
+    plantings["N_Days"] = (date2 - date1).dt.days
+
+    weather = {}
+
+    for column in columns:
+        values = selected[column].to_numpy()
+        fill = False if values.dtype == bool else np.nan
+        array = np.full(index.shape, fill, dtype=bool if values.dtype == bool else np.float64)
+        array[index >= 0] = values[index[index >= 0]]
+        weather[column] = array
+
+    return plantings, weather
@@ -0,0 +1,227 @@
+"""
+    On-disk Cache Of Prepared Field Data.
+
+    Entries are stored with `write_columnar`, one directory per fingerprint of the input files and
+    preparation arguments, and read back memory-mapped. Input files are only hashed when their size or
+    modification time changed since the last run. The cache is bounded in bytes; the least recently
+    used entries are evicted first.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+import pandas as pd
+from .columnar import ColumnarFrame, write_columnar
+
+
+# Bump When The Layout Of The Prepared Data Changes.
+CACHE_VERSION = 2
+
+_USED = "last_used"
+
+# Content Hashes Of Input Files, Stamped With Their Size And Modification Time.
+_STAMPS = ".stamps"
+
+
+def content_hash(
+    path: str
+) -> str:
+    """Hex Digest Of The Contents Of A File."""
+
+    digest = hashlib.blake2b(digest_size=20)
+
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+
+    return digest.hexdigest()
+
+
+def fingerprint_inputs(
+    paths: List[str],
+    file_hash: Callable[[str], str] = content_hash,
+    **arguments
+) -> str:
+    """Fingerprint Of The Contents Of Input Files And The Arguments Applied To Them.
+
+    Args:
+        paths (List[str]): Input Files, Hashed By Content.
+        file_hash (Callable[[str], str], optional): Content Hash Of One File, E.g.
+            `FieldDataCache.content_hash`. Defaults to `content_hash`.
+        **arguments: JSON-serializable Arguments, E.g. `number_of_repeat_years`.
+
+    Returns:
+        str: Hex Digest.
+    """
+
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(json.dumps({"version": CACHE_VERSION, **arguments}, sort_keys=True, default=str).encode())
+
+    for path in paths:
+        digest.update(b"\0")
+        digest.update(file_hash(path).encode())
+
+    return digest.hexdigest()
+
+
+class FieldDataCache():
+    """Size-bounded LRU Cache Of Dataframes In A Directory.
+
+    Args:
+        cache_dir (str): Cache Directory. Created If Missing.
+        max_bytes (int, optional): Total Size Above Which Old Entries Are Evicted. Defaults to 1 GiB.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_bytes: int = 1 << 30
+    ) -> None:
+
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def content_hash(
+        self,
+        path: str
+    ) -> str:
+        """`content_hash` Of A File, Read From Its Stamp While Its Size And Modification Time Are Unchanged.
+
+        A File With A New Modification Time Is Hashed Again And Re-stamped.
+        """
+
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        name = hashlib.blake2b(path.encode(), digest_size=10).hexdigest() + ".json"
+        stamp_path = os.path.join(self.cache_dir, _STAMPS, name)
+
+        try:
+            with open(stamp_path, encoding="utf-8") as f:
+                stamp = json.load(f)
+            if stamp["path"] == path and stamp["size"] == stat.st_size and stamp["mtime_ns"] == stat.st_mtime_ns:
+                return stamp["hash"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        digest = content_hash(path)
+
+        try:
+            os.makedirs(os.path.dirname(stamp_path), exist_ok=True)
+            with open(stamp_path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump({"path": path, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "hash": digest}, f)
+            os.replace(stamp_path + ".tmp", stamp_path)
+        except OSError:
+            pass
+
+        return digest
+
+    def get(
+        self,
+        key: str
+    ) -> Optional[Dict[str, ColumnarFrame]]:
+        """The Memory-mapped Frames Stored Under `key`, Or None. Marks The Entry As Recently Used."""
+
+        path = os.path.join(self.cache_dir, key)
+
+        if not os.path.isdir(path):
+            return None
+
+        try:
+            with open(os.path.join(path, "frames.json"), encoding="utf-8") as f:
+                names = json.load(f)
+            frames = {name: ColumnarFrame(os.path.join(path, name)) for name in names}
+        except (OSError, ValueError, KeyError):
+            # Partially evicted or written by another version.
+            return None
+
+        self._touch(path)
+
+        return frames
+
+    def put(
+        self,
+        key: str,
+        frames: Dict[str, pd.DataFrame]
+    ) -> None:
+        """Store `frames` Under `key`, Then Evict Least Recently Used Entries Over `max_bytes`."""
+
+        path = os.path.join(self.cache_dir, key)
+        tmp = tempfile.mkdtemp(prefix=".tmp-", dir=self.cache_dir)
+
+        try:
+            for name, df in frames.items():
+                write_columnar(df, os.path.join(tmp, name))
+            with open(os.path.join(tmp, "frames.json"), "w", encoding="utf-8") as f:
+                json.dump(list(frames), f)
+            self._touch(tmp)
+            os.replace(tmp, path)
+        except OSError:
+            # Another process stored the same entry first.
+            shutil.rmtree(tmp, ignore_errors=True)
+            if not os.path.isdir(path):
+                raise
+
+        self.evict(keep=key)
+
+    def evict(
+        self,
+        keep: Optional[str] = None
+    ) -> List[str]:
+        """Remove Least Recently Used Entries Until The Cache Fits In `max_bytes`.
+
+        Args:
+            keep (str, optional): Entry Never Evicted, E.g. The One Just Written. Defaults to None.
+
+        Returns:
+            List[str]: Evicted Keys.
+        """
+
+        entries = []
+
+        for key in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, key)
+            if key.startswith(".") or not os.path.isdir(path):
+                continue
+            size = sum(
+                os.path.getsize(os.path.join(root, name))
+                for root, _, names in os.walk(path) for name in names
+            )
+            entries.append((self._last_used(path), key, size))
+
+        total = sum(size for _, _, size in entries)
+        evicted = []
+
+        for _, key, size in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            shutil.rmtree(os.path.join(self.cache_dir, key), ignore_errors=True)
+            total -= size
+            evicted.append(key)
+
+        return evicted
+
+    @staticmethod
+    def _touch(
+        path: str
+    ) -> None:
+
+        with open(os.path.join(path, _USED), "w", encoding="utf-8") as f:
+            f.write(repr(time.time()))
+
+    @staticmethod
+    def _last_used(
+        path: str
+    ) -> float:
+
+        try:
+            with open(os.path.join(path, _USED), encoding="utf-8") as f:
+                return float(f.read())
+        except (OSError, ValueError):
+            return 0.0
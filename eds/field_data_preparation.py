@@ -6,32 +6,115 @@ from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
+from .columnar import ColumnarFrame
+from .field_data_cache import FieldDataCache, fingerprint_inputs
+from .instrumentation import Instrumentation, _instrumentation
 
 
-def field_data_preparation(
+_HELPER_COLUMNS = ["planting", "label"]
+
+_WEATHER_DTYPES = {
+    "DOY": np.int16,
+    "precipitation": np.float32,
+    "maximum_temperature": np.float32,
+    "minimum_temperature": np.float32,
+    "wind_speed": np.float32,
+}
+
+
+def read_weather(
+    weather_df_path: str,
+    ids: List[str],
+    chunksize: int = 1_000_000,
+    instrumentation: Optional[Instrumentation] = None
+) -> pd.DataFrame:
+    """Stream The Weather File, Keeping The First Row Of Each (ID, DOY) Of The Selected IDs.
+
+    Only One Chunk And The Retained Rows Are Held In Memory. Weather Variables Are Read As float32,
+    `DOY` As int16 And `ID` As A Categorical Over `ids`.
+
+    Args:
+        weather_df_path (str): Path To The Data File.
+        ids (List[str]): Location IDs To Keep, E.g. Those Of The Info File.
+        chunksize (int, optional): Rows Read At A Time. Defaults to 1,000,000.
+        instrumentation (Instrumentation, optional): Counts `rows_read`. Defaults to None.
+
+    Returns:
+        pd.DataFrame: Rows In File Order, Equal To Reading The Whole File, Filtering On `ids` And
+        Dropping Duplicates On (ID, DOY), Up To The Compact Dtypes.
+    """
+
+    instrumentation = _instrumentation(instrumentation)
+    categories = pd.Index(pd.unique(np.asarray(ids, dtype=object)))
+    chunks = []
+    seen = np.empty(0, dtype=np.int64)
+
+    reader = pd.read_csv(
+        weather_df_path,
+        encoding="utf-8",
+        index_col=None,
+        dtype={"ID": str, **_WEATHER_DTYPES},
+        chunksize=chunksize,
+    )
+
+    for chunk in reader:
+
+        instrumentation.count("rows_read", len(chunk))
+        codes = categories.get_indexer(chunk["ID"])
+        chunk = chunk[codes >= 0]
+        codes = codes[codes >= 0]
+
+        # (ID, DOY) packed into one key; keep the first occurrence across all chunks.
+        keys = (codes.astype(np.int64) << 32) | (chunk["DOY"].to_numpy().astype(np.int64) & 0xFFFFFFFF)
+        _, first = np.unique(keys, return_index=True)
+        first = np.sort(first)
+        first = first[~np.isin(keys[first], seen)]
+
+        chunk = chunk.iloc[first].assign(ID=pd.Categorical.from_codes(codes[first], categories=categories))
+
+        seen = np.union1d(seen, keys[first])
+        chunks.append(chunk)
+
+    if not chunks:
+        return pd.read_csv(weather_df_path, encoding="utf-8", index_col=None, nrows=0)
+
+    return pd.concat(chunks, ignore_index=True)
+
+
+def _base_year_data(
     weather_df_path: str,
     plantings_df_path: str,
-    number_of_repeat_years: int = 1,
     daily_precip_threshold: float = 2,
     GDU_treshhold: Dict[str, List] = {
         "Corn": [10, 30],
         "Soy": [14, 40]
     },
-) -> pd.DataFrame:
-    """Data Preparation.
+    chunksize: Optional[int] = None,
+    instrumentation: Optional[Instrumentation] = None,
+) -> Optional[pd.DataFrame]:
+    """Base-year Location Data, Before Repeating Years And Dropping Days Without GDU.
 
     Args:
         weather_df (str): Path To The Data File.
         plantings_df (str): Path To The Info File.
-        number_of_repeat_years (int, optional): Number Of Repeat Data. Defaults to 1.
         daily_precip_threshold (float, optional): Daily Precipitation Threshold (mm). Defaults to 2 mm.
+        chunksize (int, optional): Stream The Weather File With `read_weather` In Chunks Of This Many
+            Rows. Defaults to None (Read At Once).
+        instrumentation (Instrumentation, optional): Times The "prep/read_csv", "prep/expansion" And
+            "prep/gdu" Stages And Counts `rows_read`. Defaults to None.
 
     Returns:
-        pd.DataFrame: Location Data.
+        Optional[pd.DataFrame]: One Row Per (planting, day), Sorted By Planting And Date. `date` Is
+        Still A datetime64 Column; `planting` And `label` Are Helper Columns. None Without Plantings.
     """
 
+    instrumentation = _instrumentation(instrumentation)
+
+    with instrumentation.stage("prep/read_csv"):
+        info = pd.read_csv(plantings_df_path, encoding="utf-8", index_col=None)
+
     info = (
-        pd.read_csv(plantings_df_path, encoding="utf-8", index_col=None)
+        info
         .groupby(["ID", "Field", "year", "planting_date", "obs_planting_delta", "Crop"])
         .size()
         .reset_index(name="count")
@@ -43,65 +126,47 @@ def field_data_preparation(
     info["model_origin"] = info["year"] - 1
     info["model_origin"] = info["model_origin"].astype(str) + "-12-31"
 
-    data = pd.read_csv(weather_df_path, encoding="utf-8", index_col=None)
-
-    data = data[data["ID"].isin(info["ID"])]
-    data = data.drop_duplicates(["ID", "DOY"]).reset_index(drop=True)
-
-    all_data = pd.DataFrame()
-
-    for row in info.iterrows():
-
-        df = data[data["ID"] == row[1]["ID"]]
-
-        # df["info_id"] = row[1]["ID"] + "_" + str(row[1]["year"]) + "_" + str(row[1]["planting_date"]) + "_" + \
-        #     str(row[1]["obs_planting_delta"]) + "_" + row[1]["Crop"]
-        df["info_id"] = "_".join(
-            (
-                str(row[1]["ID"]),
-                str(row[1]["year"]),
-                str(row[1]["planting_date"]),
-                str(row[1]["obs_planting_delta"]),
-                str(row[1]["Crop"])
-            )
+    if chunksize is not None:
+        with instrumentation.stage("prep/read_csv"):
+            data = read_weather(weather_df_path, ids=info["ID"], chunksize=chunksize, instrumentation=instrumentation)
+    else:
+        with instrumentation.stage("prep/read_csv"):
+            data = pd.read_csv(weather_df_path, encoding="utf-8", index_col=None)
+
+        instrumentation.count("rows_read", len(data))
+        data = data[data["ID"].isin(info["ID"])]
+        data = data.drop_duplicates(["ID", "DOY"]).reset_index(drop=True)
+
+    if len(info) == 0:
+        return None
+
+    info["info_id"] = (
+        info["ID"].astype(str)
+        + "_" + info["year"].astype(str)
+        + "_" + info["planting_date"].astype(str)
+        + "_" + info["obs_planting_delta"].astype(str)
+        + "_" + info["Crop"].astype(str)
+    )
+    info["planting"] = np.arange(len(info))
+    info["model_origin"] = pd.to_datetime(info["model_origin"])
+
+    with instrumentation.stage("prep/expansion"):
+        # One row per (planting, weather day), plantings in `info` order and days in file order.
+        df = data.merge(
+            info[["ID", "info_id", "year", "planting_date", "Crop", "obs_planting_delta", "planting", "model_origin"]],
+            on="ID",
+            how="inner",
+            sort=False
         )
-
-        df["info_id"].astype(str)
-
-        df["year"] = row[1]["year"]
-        df["planting_date"] = row[1]["planting_date"]
-        df["Crop"] = row[1]["Crop"]
-        df["obs_planting_delta"] = row[1]["obs_planting_delta"]
-
-        model_origin = pd.to_datetime(row[1]["model_origin"])
+        df = df.sort_values("planting", kind="stable")
 
         df["DOY"] = pd.to_timedelta(df["DOY"], unit="d")
+        df["time"] = (df["DOY"] + df["model_origin"]).dt.floor("D")
+        df = df.drop(columns=["model_origin"])
 
-        df["time"] = (df["DOY"] + model_origin).dt.strftime("%Y-%m-%d")
-
-        df = (
-            df.drop_duplicates(subset=["info_id", "time"])
-            .reset_index(drop=True)
-            .sort_values(["ID", "time"])
-        )
-
-        df_new_raw = df.copy()
-
-        for i in range(1, number_of_repeat_years + 1):
-
-            df_new = df_new_raw.copy()
-
-            df_new["time"] = (
-                pd.to_datetime(df_new["time"]) + pd.Timedelta(i * 365, "d")
-            ).dt.strftime("%Y-%m-%d")
-
-            df = pd.concat([df, df_new], axis=0, ignore_index=True)
-
-            df = (
-                df.drop_duplicates(subset=["info_id", "time"])
-                .reset_index(drop=True)
-                .sort_values(["ID", "time"])
-            )
+        df = df.drop_duplicates(subset=["planting", "time"])
+        df["label"] = df.groupby("planting", sort=False).cumcount().to_numpy()
+        df = df.sort_values(["planting", "time"], kind="stable")
 
         df = df.rename(
             columns={
@@ -114,26 +179,338 @@ def field_data_preparation(
             }
         )
 
-        df["date"] = pd.to_datetime(df["date"]).dt.strftime("%Y%m%d")
+    with instrumentation.stage("prep/gdu"):
+        mean_temperature = (df["maxtemp"] + df["mintemp"]) / 2
 
         df["GDU"] = np.where(
-            df["Crop"] == "Corn", (df["maxtemp"] + df["mintemp"]) / 2 - GDU_treshhold['Corn'][0], np.nan
+            df["Crop"] == "Corn",
+            (mean_temperature - GDU_treshhold['Corn'][0]).clip(GDU_treshhold['Corn'][0], GDU_treshhold['Corn'][1]),
+            np.nan
         )
 
         df["GDU"] = np.where(
-            df["Crop"] == "Soy", (df["maxtemp"] + df["mintemp"]) / 2 - GDU_treshhold['Soy'][0], df["GDU"]
+            df["Crop"] == "Soy",
+            (mean_temperature - GDU_treshhold['Soy'][0]).clip(GDU_treshhold['Soy'][0], GDU_treshhold['Soy'][1]),
+            df["GDU"]
         )
 
-        df["GDU"] = np.where(df["Crop"] == "Corn", df["GDU"].clip(GDU_treshhold['Corn'][0], GDU_treshhold['Corn'][1]), df["GDU"])
+        df["Temperature"] = df[["maxtemp", "mintemp"]].mean(axis=1)
 
-        df["GDU"] = np.where(df["Crop"] == "Soy", df["GDU"].clip(GDU_treshhold['Soy'][0], GDU_treshhold['Soy'][1]), df["GDU"])
+        df["precip_occur"] = df["precip"] >= daily_precip_threshold  # Set precip occur as boolean
 
-        df = df[df["GDU"].notnull()]
+    # Helper columns last.
+    df = df[[c for c in df.columns if c not in _HELPER_COLUMNS] + _HELPER_COLUMNS]
 
-        df["Temperature"] = df[["maxtemp", "mintemp"]].mean(axis=1)
+    return df.reset_index(drop=True)
 
-        df["precip_occur"] = df["precip"] >= daily_precip_threshold  # Set precip occur as boolean
 
-        all_data = pd.concat([all_data, df])
+def _repeat_index(
+    base: pd.DataFrame,
+    number_of_repeat_years: int = 1
+) -> pd.DataFrame:
+    """Base-year Row, Day Offset And Index Label Of Every Day Of The Repeated Data.
+
+    Args:
+        base (pd.DataFrame): Base-year Data, See `_base_year_data`.
+        number_of_repeat_years (int, optional): Number Of Repeat Data. Defaults to 1.
+
+    Returns:
+        pd.DataFrame: `row`, `offset_days` And `label` Columns, In Output Order.
+    """
+
+    index = pd.DataFrame(
+        {
+            "planting": base["planting"].to_numpy(),
+            "date": base["date"].to_numpy(),
+            "row": np.arange(len(base)),
+            "copy": 0,
+            "label": base["label"].to_numpy(),
+        }
+    )
+
+    if number_of_repeat_years > 0:
+
+        # Copy `i` shifts the dates by `i` * 365 days; a date already present in an earlier
+        # copy is kept from that copy.
+        copies = [
+            index.assign(date=index["date"] + pd.Timedelta(i * 365, "d"), copy=i)
+            for i in range(number_of_repeat_years + 1)
+        ]
+
+        index = pd.concat(copies, axis=0, ignore_index=True)
+        index = index.drop_duplicates(subset=["planting", "date"])
+        index = index.sort_values(["planting", "copy", "date"], kind="stable")
+
+        # Row labels as left by the last concat: earlier copies first, then the last copy.
+        last = (index["copy"] == number_of_repeat_years).to_numpy()
+        previous = index[~last].groupby("planting", sort=False).size()
+        index["label"] = index.groupby(["planting", last], sort=False).cumcount().to_numpy()
+        index["label"] += np.where(last, index["planting"].map(previous).fillna(0).astype(np.int64), 0)
+
+        index = index.sort_values(["planting", "date"], kind="stable")
+
+    index = index[base["GDU"].notnull().to_numpy()[index["row"].to_numpy()]]
+
+    return pd.DataFrame(
+        {
+            "row": index["row"].to_numpy(dtype=np.int64),
+            "offset_days": index["copy"].to_numpy(dtype=np.int32) * np.int32(365),
+            "label": index["label"].to_numpy(dtype=np.int64),
+        }
+    )
+
+
+def _column_values(
+    frame: Union[pd.DataFrame, ColumnarFrame],
+    name: str
+) -> np.ndarray:
+    """One Column Of A Dataframe Or Of A Memory-mapped `ColumnarFrame` (Not Copied) As An Array."""
+
+    if isinstance(frame, ColumnarFrame):
+        return frame.column(name)
+
+    return frame[name].to_numpy()
+
+
+class RepeatedYears():
+    """Multi-year Location Data As A View Over The Base Year.
+
+    Every Repeated Day Is Stored As The Position Of Its Base-year Row Plus A Day Offset (A Multiple
+    Of 365), So The Weather Columns Are Never Duplicated. Rows Are Only Materialized On Access, And
+    The Materialized Rows Are Identical To `field_data_preparation(..., as_view=False)`.
+
+    Args:
+        base (Union[pd.DataFrame, ColumnarFrame]): Base-year Data, See `_base_year_data`, Or Its
+            Memory-mapped Copy From The Cache.
+        number_of_repeat_years (int, optional): Number Of Repeat Data. Defaults to 1.
+        date_format (str, optional): `strftime` Format Of The `date` Column, Or None To Keep It As
+            datetime64. Defaults to "%Y%m%d".
+        index (Union[pd.DataFrame, ColumnarFrame], optional): Precomputed `_repeat_index`, E.g. From
+            The Cache. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        base: Union[pd.DataFrame, ColumnarFrame],
+        number_of_repeat_years: int = 1,
+        date_format: Optional[str] = "%Y%m%d",
+        index: Optional[Union[pd.DataFrame, ColumnarFrame]] = None
+    ) -> None:
+
+        if index is None:
+            index = _repeat_index(base, number_of_repeat_years)
+
+        self.base = base
+        self.number_of_repeat_years = number_of_repeat_years
+        self.date_format = date_format
+        self.columns = [c for c in base.columns if c not in _HELPER_COLUMNS]
+        self.index = index
+
+        self.rows = _column_values(index, "row").astype(np.intp, copy=False)
+        self.offset_days = _column_values(index, "offset_days").astype(np.int32, copy=False)
+        self.labels = _column_values(index, "label").astype(np.int64, copy=False)
+
+        codes, self.info_ids = pd.factorize(self._base_values("info_id", self.rows))
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(len(self.info_ids) + 1))
+        self._positions = {
+            info_id: order[bounds[i]:bounds[i + 1]] for i, info_id in enumerate(self.info_ids)
+        }
+
+    def __len__(
+        self
+    ) -> int:
+
+        return len(self.rows)
+
+    def column(
+        self,
+        name: str,
+        positions: Optional[np.ndarray] = None
+    ) -> pd.Series:
+        """One Column Of The Expanded Data, Optionally Only At `positions`."""
+
+        positions = np.arange(len(self)) if positions is None else positions
+        values = self._base_values(name, self.rows[positions])
+
+        if name == "date":
+            values = self._dates(values, positions)
+
+        return pd.Series(values, index=pd.Index(self.labels[positions]), name=name)
+
+    def _base_values(
+        self,
+        name: str,
+        rows: np.ndarray
+    ) -> np.ndarray:
+        """One Base-year Column At Positions `rows`."""
+
+        if isinstance(self.base, ColumnarFrame):
+            return self.base.take_column(name, rows)
+
+        return self.base[name].to_numpy()[rows]
+
+    def base_frame(
+        self
+    ) -> pd.DataFrame:
+        """The Base-year Data As A Dataframe, Including The Helper Columns."""
+
+        if isinstance(self.base, ColumnarFrame):
+            return self.base.to_frame()
+
+        return self.base
+
+    def _dates(
+        self,
+        base_dates: np.ndarray,
+        positions: np.ndarray
+    ) -> np.ndarray:
+        """Shift Base-year Dates By The Repeat Offsets, Formatting Them Only If `date_format` Is Set."""
+
+        dates = pd.Series(base_dates + self.offset_days[positions].astype("timedelta64[D]"))
+
+        if self.date_format is not None:
+            return dates.dt.strftime(self.date_format).to_numpy()
+
+        return dates.to_numpy()
+
+    def take(
+        self,
+        positions: np.ndarray
+    ) -> pd.DataFrame:
+        """Materialize The Expanded Rows At `positions`."""
+
+        if isinstance(self.base, ColumnarFrame):
+            df = self.base.take(self.rows[positions], columns=self.columns)
+        else:
+            df = self.base.iloc[self.rows[positions]]
+            df = df.drop(columns=_HELPER_COLUMNS)
+
+        df["date"] = self._dates(df["date"].to_numpy(), positions)
+        df.index = pd.Index(self.labels[positions])
+
+        return df
+
+    def planting(
+        self,
+        info_id: str
+    ) -> pd.DataFrame:
+        """Rows Of One `info_id`, Equivalent To `data[data["info_id"] == info_id]`."""
+
+        return self.take(self._positions.get(info_id, np.zeros(0, dtype=np.intp)))
+
+    def plantings(
+        self,
+        info_ids: List[str]
+    ) -> pd.DataFrame:
+        """Rows Of Several `info_id`s, In The Order Of The Full Data."""
+
+        positions = [self._positions[info_id] for info_id in info_ids if info_id in self._positions]
+
+        return self.take(np.sort(np.concatenate(positions)) if positions else np.zeros(0, dtype=np.intp))
+
+    def __getitem__(
+        self,
+        key: Union[str, np.ndarray, pd.Series]
+    ) -> Union[pd.Series, pd.DataFrame]:
+        """A Column By Name, Or The Rows Selected By A Boolean Mask."""
+
+        if isinstance(key, str):
+            return self.column(key)
+
+        return self.take(np.flatnonzero(np.asarray(key, dtype=bool)))
+
+    def to_frame(
+        self
+    ) -> pd.DataFrame:
+        """Materialize Every Repeated Year."""
+
+        return self.take(np.arange(len(self)))
+
+
+def field_data_preparation(
+    weather_df_path: str,
+    plantings_df_path: str,
+    number_of_repeat_years: int = 1,
+    daily_precip_threshold: float = 2,
+    GDU_treshhold: Dict[str, List] = {
+        "Corn": [10, 30],
+        "Soy": [14, 40]
+    },
+    as_view: bool = False,
+    date_format: Optional[str] = "%Y%m%d",
+    cache_dir: Optional[str] = None,
+    cache_max_bytes: int = 1 << 30,
+    chunksize: Optional[int] = None,
+    instrumentation: Optional[Instrumentation] = None,
+) -> Union[pd.DataFrame, RepeatedYears]:
+    """Data Preparation.
+
+    Args:
+        weather_df (str): Path To The Data File.
+        plantings_df (str): Path To The Info File.
+        number_of_repeat_years (int, optional): Number Of Repeat Data. Defaults to 1.
+        daily_precip_threshold (float, optional): Daily Precipitation Threshold (mm). Defaults to 2 mm.
+        as_view (bool, optional): Return A `RepeatedYears` View Instead Of Copying The Base Year Once
+            Per Repeat. Defaults to False.
+        date_format (str, optional): `strftime` Format Of The `date` Column, Or None To Keep It As
+            datetime64. Defaults to "%Y%m%d".
+        cache_dir (str, optional): Directory Of An On-disk Cache Of The Prepared Data, Keyed By The
+            Contents Of Both Files And The Preparation Arguments. Defaults to None (No Cache).
+        cache_max_bytes (int, optional): Size Above Which Least Recently Used Cache Entries Are
+            Evicted. Defaults to 1 GiB.
+        chunksize (int, optional): Stream The Weather File In Chunks Of This Many Rows, With Compact
+            Dtypes, See `read_weather`. Defaults to None (Read At Once).
+        instrumentation (Instrumentation, optional): Records The "prep/..." Stages, `rows_read` And
+            Cache Hits And Misses. Defaults to None.
+
+    Returns:
+        Union[pd.DataFrame, RepeatedYears]: Location Data.
+    """
+
+    instrumentation = _instrumentation(instrumentation)
+    cache = key = cached = None
+
+    if cache_dir is not None:
+        cache = FieldDataCache(cache_dir, max_bytes=cache_max_bytes)
+        key = fingerprint_inputs(
+            [weather_df_path, plantings_df_path],
+            file_hash=cache.content_hash,
+            number_of_repeat_years=number_of_repeat_years,
+            daily_precip_threshold=daily_precip_threshold,
+            GDU_treshhold=GDU_treshhold,
+            compact_dtypes=chunksize is not None,
+        )
+        cached = cache.get(key)
+        instrumentation.count("cache_misses" if cached is None else "cache_hits")
+
+    if cached is not None:
+        base, index = cached["base"], cached["index"]
+    else:
+        base = _base_year_data(
+            weather_df_path=weather_df_path,
+            plantings_df_path=plantings_df_path,
+            daily_precip_threshold=daily_precip_threshold,
+            GDU_treshhold=GDU_treshhold,
+            chunksize=chunksize,
+            instrumentation=instrumentation,
+        )
+
+        if base is None:
+            return pd.DataFrame()
+
+        with instrumentation.stage("prep/expansion"):
+            index = _repeat_index(base, number_of_repeat_years)
+
+        if cache is not None:
+            cache.put(key, {"base": base, "index": index})
+
+    data = RepeatedYears(
+        base, number_of_repeat_years=number_of_repeat_years, date_format=date_format, index=index
+    )
+
+    if as_view:
+        return data
 
-    return all_data
+    with instrumentation.stage("prep/expansion"):
+        return data.to_frame()
@@ -0,0 +1,153 @@
+"""
+    Incremental Re-runs.
+
+    Every planting gets a content hash of its weather slice and of the parameters its simulations
+    depend on. Results are stored next to these hashes, so a re-run only simulates the plantings
+    whose hash changed and reuses the stored results of all others.
+"""
+
+import hashlib
+import os
+import shutil
+from typing import Any, Dict, Optional
+import numpy as np
+import pandas as pd
+from .columnar import ColumnarFrame, write_columnar
+from .field_data_preparation import RepeatedYears
+
+
+# Bump When A Model Change Invalidates Stored Results.
+FINGERPRINT_VERSION = 1
+
+_RESULTS = "results"
+
+
+def _update(
+    digest: "hashlib._Hash",
+    value: Any
+) -> None:
+    """Feed A (Nested) Parameter Value Into `digest`."""
+
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        labels = list(value.columns) if isinstance(value, pd.DataFrame) else [value.name]
+        digest.update(repr((type(value).__name__, value.shape, labels)).encode())
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, np.ndarray):
+        digest.update(repr((value.dtype.str, value.shape)).encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, dict):
+        digest.update(b"{")
+        for key in sorted(value, key=repr):
+            digest.update(repr(key).encode())
+            _update(digest, value[key])
+        digest.update(b"}")
+    elif isinstance(value, (list, tuple)):
+        digest.update(b"[")
+        for item in value:
+            _update(digest, item)
+        digest.update(b"]")
+    else:
+        digest.update(repr(value).encode())
+
+
+def planting_fingerprints(
+    data: RepeatedYears,
+    crop_parameters: Dict,
+    **parameters
+) -> Dict[str, str]:
+    """Content Hash Of Every Planting's Weather Slice And Simulation Parameters.
+
+    Args:
+        data (RepeatedYears): Location Data, See `field_data_preparation(..., as_view=True)`.
+        crop_parameters (Dict): Crop Parameters Keyed By Crop Name; Only A Planting's Own Crop Counts.
+        **parameters: Other Parameters The Results Depend On, E.g. `spray_parameters`.
+
+    Returns:
+        Dict[str, str]: Hex Digest Keyed By `info_id`.
+    """
+
+    shared = hashlib.blake2b(digest_size=20)
+    _update(shared, {"version": FINGERPRINT_VERSION, "number_of_repeat_years": data.number_of_repeat_years, **parameters})
+
+    crops = {}
+    for crop, values in crop_parameters.items():
+        digest = shared.copy()
+        _update(digest, values)
+        crops[crop] = digest
+
+    base = data.base_frame()
+    row_hashes = pd.util.hash_pandas_object(base.drop(columns=["planting"]), index=False).to_numpy()
+    info_ids = base["info_id"].to_numpy()
+    starts = np.flatnonzero(np.r_[True, base["planting"].to_numpy()[1:] != base["planting"].to_numpy()[:-1]])
+    stops = np.r_[starts[1:], len(base)]
+    fingerprints = {}
+
+    for start, stop in zip(starts, stops):
+        crop = base["Crop"].iat[start]
+        digest = crops[crop].copy() if crop in crops else shared.copy()
+        digest.update(row_hashes[start:stop].tobytes())
+        fingerprints[info_ids[start]] = digest.hexdigest()
+
+    return fingerprints
+
+
+class IncrementalStore():
+    """Results Of The Previous Run, With The `fingerprint` Of Each Result's Planting.
+
+    Args:
+        path (str): Store Directory. Created If Missing.
+    """
+
+    def __init__(
+        self,
+        path: str
+    ) -> None:
+
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+    def load(
+        self
+    ) -> Optional[pd.DataFrame]:
+        """Stored Results, Or None Before The First Run."""
+
+        for name in [_RESULTS, _RESULTS + ".old"]:
+            try:
+                return ColumnarFrame(os.path.join(self.path, name)).to_frame()
+            except (OSError, ValueError):
+                continue
+
+        return None
+
+    def save(
+        self,
+        results: pd.DataFrame
+    ) -> None:
+        """Replace The Stored Results; The Previous Ones Stay Readable Until The New Ones Are Complete."""
+
+        current = os.path.join(self.path, _RESULTS)
+
+        shutil.rmtree(current + ".tmp", ignore_errors=True)
+        write_columnar(results.reset_index(drop=True), current + ".tmp")
+
+        if os.path.isdir(current):
+            shutil.rmtree(current + ".old", ignore_errors=True)
+            os.replace(current, current + ".old")
+
+        os.replace(current + ".tmp", current)
+        shutil.rmtree(current + ".old", ignore_errors=True)
+
+    def reusable(
+        self,
+        fingerprints: Dict[str, str]
+    ) -> pd.DataFrame:
+        """Stored Results Of The Plantings Whose Fingerprint Is Unchanged."""
+
+        previous = self.load()
+
+        if previous is None or "fingerprint" not in previous.columns:
+            return pd.DataFrame()
+
+        unchanged = previous["locationId"].map(fingerprints) == previous["fingerprint"]
+
+        return previous[unchanged.to_numpy()].reset_index(drop=True)
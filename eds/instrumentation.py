@@ -0,0 +1,166 @@
+"""
+    Opt-in Instrumentation.
+
+    Pass an `Instrumentation` to `field_data_preparation`, `calculation_crop_disease_severity` or
+    `estimate_disease_severity` to record the wall time of their stages and counters such as rows
+    read, plantings skipped, simulations run and simulated days. Without one, the functions use a
+    shared no-op recorder, so instrumentation costs next to nothing when it is off.
+"""
+
+import contextlib
+import json
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+class Instrumentation():
+    """Recorder Of Stage Wall Times And Counters.
+
+    Stage Times Accumulate Over Calls, E.g. "driver/simulation" Sums All Simulations. In Parallel Runs
+    Each Worker Records Its Own Stages, Which Are Summed Into The Parent's, So They Add Up To More Than
+    The Elapsed Time.
+
+    Args:
+        callback (Callable[[str, str, Any], None], optional): Called As `callback(kind, name, value)` For
+            Every Record: ("time", Stage, Seconds), ("count", Counter, Increment) Or
+            ("event", Counter, Details Dict). Defaults to None.
+    """
+
+    enabled = True
+
+    def __init__(
+        self,
+        callback: Optional[Callable[[str, str, Any], None]] = None
+    ) -> None:
+
+        self.callback = callback
+        self.timings = {}
+        self.counters = {}
+
+    @contextlib.contextmanager
+    def stage(
+        self,
+        name: str
+    ):
+        """Time The `with` Block As One Call Of Stage `name`."""
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def add_time(
+        self,
+        name: str,
+        seconds: float,
+        calls: int = 1
+    ) -> None:
+
+        total = self.timings.setdefault(name, {"seconds": 0.0, "calls": 0})
+        total["seconds"] += seconds
+        total["calls"] += calls
+
+        if self.callback is not None:
+            self.callback("time", name, seconds)
+
+    def count(
+        self,
+        name: str,
+        n: int = 1
+    ) -> None:
+
+        self.counters[name] = self.counters.get(name, 0) + int(n)
+
+        if self.callback is not None:
+            self.callback("count", name, int(n))
+
+    def event(
+        self,
+        name: str,
+        **details
+    ) -> None:
+        """Count One Occurrence Of `name`, Handing `details` To The Callback."""
+
+        self.counters[name] = self.counters.get(name, 0) + 1
+
+        if self.callback is not None:
+            self.callback("event", name, details)
+
+    def merge(
+        self,
+        report: Dict
+    ) -> None:
+        """Add A `report` Of Another Recorder, E.g. Of A Worker Process."""
+
+        for name, total in report["timings"].items():
+            self.add_time(name, total["seconds"], calls=total["calls"])
+
+        for name, n in report["counters"].items():
+            self.count(name, n)
+
+    def report(
+        self
+    ) -> Dict:
+        """Timings (`seconds`, `calls`) Per Stage And Counters, JSON-serializable."""
+
+        return {
+            "timings": {name: dict(total) for name, total in self.timings.items()},
+            "counters": dict(self.counters),
+        }
+
+    def to_json(
+        self,
+        path: str
+    ) -> None:
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+
+
+class _DisabledInstrumentation(Instrumentation):
+    """Shared No-op Recorder Used When Instrumentation Is Off."""
+
+    enabled = False
+
+    def stage(
+        self,
+        name: str
+    ):
+
+        return _NO_STAGE
+
+    def add_time(
+        self,
+        name: str,
+        seconds: float,
+        calls: int = 1
+    ) -> None:
+        pass
+
+    def count(
+        self,
+        name: str,
+        n: int = 1
+    ) -> None:
+        pass
+
+    def event(
+        self,
+        name: str,
+        **details
+    ) -> None:
+        pass
+
+
+_NO_STAGE = contextlib.nullcontext()
+
+_DISABLED = _DisabledInstrumentation()
+
+
+def _instrumentation(
+    instrumentation: Optional[Instrumentation]
+) -> Instrumentation:
+    """`instrumentation`, Or The Shared No-op Recorder."""
+
+    return _DISABLED if instrumentation is None else instrumentation
@@ -0,0 +1,319 @@
+"""
+    Registry Of Crop Parameters.
+
+    `load_crop_parameter_workbook` reads all sheets of a crop parameter workbook in one pass, validates
+    the tables and compiles them to a `.npz` file next to the workbook. Later loads read the compiled
+    tables instead of the workbook as long as its size and modification time, or failing those its
+    content hash, are unchanged. Within a process every workbook, and the constant parameters of
+    `CropParameters`, are loaded once and shared: the mappings cannot be changed and the values of the
+    frames cannot be assigned. Copy a frame (`frame.copy()`) or mapping (`dict(parameters)`) to edit it.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from .utils import LookupTable
+
+
+CROP_PARAMETER_SHEETS = ["ip_t_cof", "p_t_cof", "rc_t_input", "dvs_8_input", "rc_a_input", "fungicide", "fungicide_residual"]
+
+# Bump When The Layout Of The Compiled Tables Changes.
+CACHE_VERSION = 1
+
+_CACHE_SUFFIX = ".eds-cache.npz"
+
+_META = "__meta__"
+
+# Absolute Workbook Path: ((size, mtime_ns), Parameters).
+_LOADED = {}
+
+_CONSTANT = {}
+
+
+class FrozenParameters(dict):
+    """Read-only `dict` Of Shared Parameters, Picklable Like A `dict`."""
+
+    def _immutable(
+        self,
+        *args,
+        **kwargs
+    ) -> None:
+
+        raise TypeError(f"{type(self).__name__} is shared and immutable; edit a copy, e.g. dict(parameters).")
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __reduce__(
+        self
+    ) -> Tuple:
+
+        return type(self), (dict(self),)
+
+
+def read_only_frame(
+    frame: pd.DataFrame
+) -> pd.DataFrame:
+    """Copy Of `frame` Whose Values Cannot Be Assigned.
+
+    Contiguous Columns Of One dtype Share One Read-only Block.
+    """
+
+    if frame.shape[1] == 0:
+        return frame.copy()
+
+    pieces = []
+    start = 0
+    dtypes = frame.dtypes.tolist()
+
+    for stop in range(1, len(dtypes) + 1):
+        if stop == len(dtypes) or dtypes[stop] != dtypes[start]:
+            values = np.array(frame.iloc[:, start:stop].to_numpy(dtype=dtypes[start]), order="F")
+            values.setflags(write=False)
+            pieces.append(pd.DataFrame(values, index=frame.index, columns=frame.columns[start:stop], copy=False))
+            start = stop
+
+    return pieces[0] if len(pieces) == 1 else pd.concat(pieces, axis=1, copy=False)
+
+
+def freeze_crop_parameters(
+    crop_parameters: Dict[str, Dict[str, pd.DataFrame]]
+) -> FrozenParameters:
+    """Shared Read-only Form Of Crop Parameters Keyed By Crop Name."""
+
+    return FrozenParameters(
+        {
+            crop: FrozenParameters({name: read_only_frame(table) for name, table in tables.items()})
+            for crop, tables in crop_parameters.items()
+        }
+    )
+
+
+def validate_crop_parameter_tables(
+    tables: Dict[str, pd.DataFrame],
+    source: str = "crop parameters"
+) -> None:
+    """Check The Sheets Of One Crop.
+
+    Every Sheet Of `CROP_PARAMETER_SHEETS` Must Be Present And Numeric Without Missing Values. The
+    Lookup Tables Need Breakpoints (Column 0) And Values (Column 1) As Accepted By `LookupTable`;
+    `fungicide` Needs Spray Number, Spray Moment And Efficacy Columns. `fungicide_residual` May Be Empty.
+
+    Raises:
+        ValueError: Naming The Source And Sheet Of The First Problem.
+    """
+
+    missing = [name for name in CROP_PARAMETER_SHEETS if name not in tables]
+
+    if missing:
+        raise ValueError(f"{source}: missing sheets {missing}.")
+
+    for name in CROP_PARAMETER_SHEETS:
+
+        table = tables[name]
+
+        if name == "fungicide_residual" and len(table) == 0:
+            continue
+
+        if not all(pd.api.types.is_numeric_dtype(dtype) for dtype in table.dtypes):
+            raise ValueError(f"{source}: {name}: all cells must be numbers.")
+
+        if table.isna().any().any():
+            raise ValueError(f"{source}: {name}: empty or missing cells.")
+
+        columns = 3 if name == "fungicide" else 2
+
+        if table.shape[1] < columns or len(table) == 0:
+            raise ValueError(f"{source}: {name}: expected at least {columns} columns and one row, got {table.shape}.")
+
+        if name != "fungicide":
+            try:
+                LookupTable.from_frame(table)
+            except ValueError as e:
+                raise ValueError(f"{source}: {name}: {e}") from e
+
+
+def _content_hash(
+    path: str
+) -> str:
+
+    digest = hashlib.blake2b(digest_size=20)
+
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+
+    return digest.hexdigest()
+
+
+def compiled_cache_path(
+    path: str
+) -> str:
+    """Compiled Tables Of The Workbook `path`, Stored Next To It."""
+
+    return path + _CACHE_SUFFIX
+
+
+def _write_compiled(
+    path: str,
+    tables: Dict[str, pd.DataFrame],
+    stat: os.stat_result,
+    content_hash: str
+) -> None:
+    """Store `tables` Next To The Workbook, Replacing Any Previous Version Atomically."""
+
+    arrays = {}
+    layout = {}
+
+    for name, table in tables.items():
+        layout[name] = [[label, str(dtype)] for label, dtype in zip(table.columns.tolist(), table.dtypes)]
+        for i, label in enumerate(table.columns):
+            arrays[f"{name}/{i}"] = table.iloc[:, i].to_numpy()
+
+    meta = {
+        "version": CACHE_VERSION,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "hash": content_hash,
+        "layout": layout,
+    }
+    arrays[_META] = np.array(json.dumps(meta))
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temporary = tempfile.mkstemp(prefix=".eds-", suffix=".npz", dir=directory)
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(temporary, compiled_cache_path(path))
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+def _read_compiled(
+    path: str,
+    stat: os.stat_result
+) -> Optional[Dict[str, pd.DataFrame]]:
+    """Compiled Tables Of The Workbook, Or None If Missing, Outdated Or Unreadable.
+
+    A Workbook With A New Modification Time But Unchanged Contents Keeps Its Compiled Tables, Which
+    Are Then Re-stamped So The Next Load Skips The Hash.
+    """
+
+    try:
+        with np.load(compiled_cache_path(path), allow_pickle=False) as compiled:
+            arrays = dict(compiled)
+        meta = json.loads(str(arrays.pop(_META)))
+    except (OSError, ValueError, KeyError):
+        return None
+
+    if meta.get("version") != CACHE_VERSION:
+        return None
+
+    unchanged = meta["size"] == stat.st_size and meta["mtime_ns"] == stat.st_mtime_ns
+
+    if not unchanged and (meta["size"] != stat.st_size or meta["hash"] != _content_hash(path)):
+        return None
+
+    tables = {}
+    for name, columns in meta["layout"].items():
+        tables[name] = pd.DataFrame(
+            {label: arrays[f"{name}/{i}"].astype(dtype, copy=False) for i, (label, dtype) in enumerate(columns)},
+            columns=[label for label, _ in columns],
+        )
+
+    if not unchanged:
+        try:
+            _write_compiled(path, tables, stat, meta["hash"])
+        except OSError:
+            pass
+
+    return tables
+
+
+def load_crop_parameter_workbook(
+    path: str,
+    use_cache: bool = True
+) -> FrozenParameters:
+    """Tables Of One Crop Parameter Workbook, One Sheet Per Name Of `CROP_PARAMETER_SHEETS`.
+
+    Repeated Loads Of An Unchanged Workbook Return The Same Shared Instance. Otherwise The Compiled
+    Tables Next To The Workbook Are Read, Or The Workbook Is Opened Once With openpyxl, Validated And
+    Compiled. A Compiled File That Cannot Be Written (E.g. A Read-only Directory) Is Skipped.
+
+    Args:
+        path (str): Path To The Workbook.
+        use_cache (bool, optional): Use And Write The Compiled Tables. Defaults to True.
+
+    Returns:
+        FrozenParameters: Read-only Tables Keyed By Sheet Name.
+    """
+
+    key = os.path.abspath(path)
+    stat = os.stat(key)
+    version = (stat.st_size, stat.st_mtime_ns)
+
+    if use_cache and key in _LOADED and _LOADED[key][0] == version:
+        return _LOADED[key][1]
+
+    tables = _read_compiled(key, stat) if use_cache else None
+
+    if tables is None:
+        tables = pd.read_excel(key, engine="openpyxl", sheet_name=CROP_PARAMETER_SHEETS, header=None)
+        validate_crop_parameter_tables(tables, source=path)
+
+        if use_cache:
+            try:
+                _write_compiled(key, tables, stat, _content_hash(key))
+            except OSError:
+                pass
+
+    parameters = FrozenParameters({name: read_only_frame(tables[name]) for name in CROP_PARAMETER_SHEETS})
+
+    if use_cache:
+        _LOADED[key] = (version, parameters)
+
+    return parameters
+
+
+def load_crop_parameters(
+    crop_name: List[str],
+    crop_parameters_path: List[str],
+    use_cache: bool = True
+) -> FrozenParameters:
+    """Crop Parameters Keyed By Crop Name, One Workbook Per Crop.
+
+    Args:
+        crop_name (List[str]): Crop Names.
+        crop_parameters_path (List[str]): Workbook Of Each Crop, See `load_crop_parameter_workbook`.
+        use_cache (bool, optional): Use And Write The Compiled Tables. Defaults to True.
+
+    Returns:
+        FrozenParameters: Read-only Crop Parameters Keyed By Crop Name.
+    """
+
+    if len(crop_name) != len(crop_parameters_path):
+        raise ValueError(f"Got {len(crop_name)} crop names for {len(crop_parameters_path)} workbooks.")
+
+    return FrozenParameters(
+        {crop: load_crop_parameter_workbook(path, use_cache=use_cache) for crop, path in zip(crop_name, crop_parameters_path)}
+    )
+
+
+def constant_crop_parameters(
+    build: Callable[[], Dict]
+) -> FrozenParameters:
+    """Shared Read-only Form Of The Parameters Returned By `build`, Built On The First Call Only."""
+
+    if "parameters" not in _CONSTANT:
+        parameters = build()
+        for crop, tables in parameters.items():
+            validate_crop_parameter_tables(tables, source=f"constant {crop} parameters")
+        _CONSTANT["parameters"] = freeze_crop_parameters(parameters)
+
+    return _CONSTANT["parameters"]
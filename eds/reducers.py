@@ -0,0 +1,317 @@
+"""
+    Online Reducers Of Simulated Trajectories.
+
+    Summary runs record only the variables their reducers read, one column per variable, and hand
+    the columns to each reducer's `reduce` at the end of the run, so the trajectory is never built.
+    Subclass `Reducer` to add a metric; one without `reduce` is fed every day's full row through
+    `update` instead.
+"""
+
+from typing import Dict, List
+import numpy as np
+from .estimate_disease_severity_array import VARIABLES
+
+
+class Reducer():
+    """Base Class Of Online Reducers.
+
+    Args:
+        name (str): Output Name Of The Metric.
+        variable (str, optional): Reduced Column Of The Trajectory, See `VARIABLES`. Defaults to "Sev".
+    """
+
+    def __init__(
+        self,
+        name: str,
+        variable: str = "Sev"
+    ) -> None:
+
+        if variable not in VARIABLES:
+            raise ValueError(f"Unknown variable {variable!r}, expected one of {VARIABLES}.")
+
+        self.name = name
+        self.variable = variable
+        self.column = VARIABLES.index(variable)
+        self.variables = [variable]
+
+    def reset(
+        self,
+        total_days: int
+    ) -> None:
+        """Start A New Run Of At Most `total_days` Days."""
+
+    def update(
+        self,
+        row: np.ndarray
+    ) -> None:
+        """Fold In One Simulated Day, A Row Ordered As `VARIABLES`."""
+
+        raise NotImplementedError
+
+    def reduce(
+        self,
+        values: Dict[str, np.ndarray]
+    ) -> None:
+        """Fold In Every Simulated Day At Once, The Daily Values Of Each Of `variables` Keyed By Name.
+
+        Optional; Reducers Without It Are Fed Row By Row Through `update`.
+        """
+
+        raise NotImplementedError
+
+    def reduces_columns(
+        self
+    ) -> bool:
+        """Whether `reduce` Is Implemented."""
+
+        return type(self).reduce is not Reducer.reduce
+
+    def result(
+        self
+    ) -> float:
+        """Metric Of The Days Seen Since `reset`."""
+
+        raise NotImplementedError
+
+
+class MaxReducer(Reducer):
+    """Running Maximum, Ignoring NaN Like `np.nanmax`."""
+
+    def reset(
+        self,
+        total_days: int
+    ) -> None:
+
+        self.value = np.nan
+
+    def update(
+        self,
+        row: np.ndarray
+    ) -> None:
+
+        value = row[self.column]
+
+        if value > self.value or self.value != self.value:
+            self.value = value
+
+    def reduce(
+        self,
+        values: Dict[str, np.ndarray]
+    ) -> None:
+
+        values = values[self.variable]
+        values = values[~np.isnan(values)]
+        self.value = values.max() if len(values) else np.nan
+
+    def result(
+        self
+    ) -> float:
+
+        return self.value
+
+
+class TrapezoidAUCReducer(Reducer):
+    """Trapezoid Area Under The Curve Of The Nonzero Values, Day Spacing 1.
+
+    Matches `np.trapz(values[values != 0])`, Exactly With `reduce` And Up To Summation Order With `update`.
+    """
+
+    def reset(
+        self,
+        total_days: int
+    ) -> None:
+
+        self.value = 0.0
+        self.previous = None
+
+    def update(
+        self,
+        row: np.ndarray
+    ) -> None:
+
+        value = row[self.column]
+
+        if value == 0:
+            return
+
+        if self.previous is not None:
+            self.value += (self.previous + value) / 2.0
+
+        self.previous = value
+
+    def reduce(
+        self,
+        values: Dict[str, np.ndarray]
+    ) -> None:
+
+        values = values[self.variable]
+        self.value = float(np.trapz(values[values != 0]))
+
+    def result(
+        self
+    ) -> float:
+
+        return self.value
+
+
+class MedianReducer(Reducer):
+    """Exact Median, Ignoring NaN Like `np.nanmedian`, Over A Buffer Allocated Once Per Size."""
+
+    def __init__(
+        self,
+        name: str,
+        variable: str = "Sev"
+    ) -> None:
+
+        super().__init__(name, variable)
+        self.buffer = np.empty(0)
+
+    def reset(
+        self,
+        total_days: int
+    ) -> None:
+
+        if len(self.buffer) < total_days:
+            self.buffer = np.empty(total_days)
+
+        self.n = 0
+
+    def update(
+        self,
+        row: np.ndarray
+    ) -> None:
+
+        self.buffer[self.n] = row[self.column]
+        self.n += 1
+
+    def reduce(
+        self,
+        values: Dict[str, np.ndarray]
+    ) -> None:
+
+        values = values[self.variable]
+        self.n = len(values)
+        self.buffer[:self.n] = values
+
+    def result(
+        self
+    ) -> float:
+
+        return np.nanmedian(self.buffer[:self.n])
+
+
+class ValueAtStageReducer(Reducer):
+    """Value On The First Day A Development Stage Is Reached, NaN If It Never Is.
+
+    Args:
+        name (str): Output Name Of The Metric.
+        stage (float): Stage Threshold.
+        variable (str, optional): Reported Column. Defaults to "Sev".
+        stage_variable (str, optional): Stage Column. Defaults to "DVS8".
+    """
+
+    def __init__(
+        self,
+        name: str,
+        stage: float,
+        variable: str = "Sev",
+        stage_variable: str = "DVS8"
+    ) -> None:
+
+        super().__init__(name, variable)
+        self.stage = stage
+        self.stage_variable = stage_variable
+        self.stage_column = VARIABLES.index(stage_variable)
+        self.variables = [variable, stage_variable]
+
+    def reset(
+        self,
+        total_days: int
+    ) -> None:
+
+        self.value = np.nan
+        self.reached = False
+
+    def update(
+        self,
+        row: np.ndarray
+    ) -> None:
+
+        if not self.reached and row[self.stage_column] >= self.stage:
+            self.value = row[self.column]
+            self.reached = True
+
+    def reduce(
+        self,
+        values: Dict[str, np.ndarray]
+    ) -> None:
+
+        reached = np.flatnonzero(values[self.stage_variable] >= self.stage)
+
+        if len(reached):
+            self.value = values[self.variable][reached[0]]
+            self.reached = True
+
+    def result(
+        self
+    ) -> float:
+
+        return self.value
+
+
+class DaysAboveReducer(Reducer):
+    """Number Of Days The Value Exceeds A Threshold.
+
+    Args:
+        name (str): Output Name Of The Metric.
+        threshold (float): Threshold, Exclusive.
+        variable (str, optional): Reduced Column. Defaults to "Sev".
+    """
+
+    def __init__(
+        self,
+        name: str,
+        threshold: float,
+        variable: str = "Sev"
+    ) -> None:
+
+        super().__init__(name, variable)
+        self.threshold = threshold
+
+    def reset(
+        self,
+        total_days: int
+    ) -> None:
+
+        self.value = 0
+
+    def update(
+        self,
+        row: np.ndarray
+    ) -> None:
+
+        if row[self.column] > self.threshold:
+            self.value += 1
+
+    def reduce(
+        self,
+        values: Dict[str, np.ndarray]
+    ) -> None:
+
+        self.value = int(np.count_nonzero(values[self.variable] > self.threshold))
+
+    def result(
+        self
+    ) -> float:
+
+        return self.value
+
+
+def default_reducers() -> List[Reducer]:
+    """Reducers Of The Metrics Reported By `calculation_crop_disease_severity`.
+
+    Returns:
+        List[Reducer]: `Sev50%`, `SevMAX` And `AUC` Of The Daily Severity.
+    """
+
+    return [MedianReducer("Sev50%"), MaxReducer("SevMAX"), TrapezoidAUCReducer("AUC")]
@@ -0,0 +1,202 @@
+"""
+    Incremental Writers Of Simulation Results.
+
+    Sinks buffer result records (dicts) and write them out every `batch_size` records, so a run can
+    be consumed while it is still going and only one batch is ever held in memory.
+"""
+
+import os
+import shutil
+from typing import Dict, Iterable, List, Optional
+import pandas as pd
+from .columnar import ColumnarFrame, write_columnar
+
+
+class _Sink():
+    """Buffer Records And Hand Them To `_write` One Batch At A Time."""
+
+    def __init__(
+        self,
+        path: str,
+        columns: Optional[List[str]] = None,
+        batch_size: int = 10_000
+    ) -> None:
+
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, got {batch_size}.")
+
+        self.path = path
+        self.columns = columns
+        self.batch_size = batch_size
+        self.records_written = 0
+        self._buffer = []
+
+    def write(
+        self,
+        record: Dict
+    ) -> None:
+        """Add One Record, Flushing When A Full Batch Is Buffered."""
+
+        self._buffer.append(record)
+
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def write_all(
+        self,
+        records: Iterable[Dict]
+    ) -> int:
+        """Add Every Record, E.g. From `iter_crop_disease_severity`, And Flush.
+
+        Returns:
+            int: Records Written So Far.
+        """
+
+        for record in records:
+            self.write(record)
+
+        self.flush()
+
+        return self.records_written
+
+    def flush(
+        self
+    ) -> None:
+        """Write The Buffered Records."""
+
+        if not self._buffer:
+            return
+
+        batch = pd.DataFrame.from_records(self._buffer, columns=self.columns)
+        self._write(batch)
+        self.records_written += len(batch)
+        self._buffer = []
+
+    def close(
+        self
+    ) -> None:
+
+        self.flush()
+
+    def __enter__(
+        self
+    ):
+
+        return self
+
+    def __exit__(
+        self,
+        *exc_info
+    ) -> None:
+
+        self.close()
+
+    def _write(
+        self,
+        batch: pd.DataFrame
+    ) -> None:
+
+        raise NotImplementedError
+
+
+class CSVSink(_Sink):
+    """Append Results To A CSV File, Writing The Header With The First Batch.
+
+    Args:
+        path (str): Output File. Overwritten.
+        columns (List[str], optional): Output Columns, In Order. Defaults to None (All, In Record Order).
+        batch_size (int, optional): Records Per Write. Defaults to 10,000.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        columns: Optional[List[str]] = None,
+        batch_size: int = 10_000
+    ) -> None:
+
+        super().__init__(path, columns=columns, batch_size=batch_size)
+        self._file = open(path, "w", encoding="utf-8", newline="")
+
+    def _write(
+        self,
+        batch: pd.DataFrame
+    ) -> None:
+
+        batch.to_csv(self._file, header=self.records_written == 0, index=False)
+        self._file.flush()
+
+    def close(
+        self
+    ) -> None:
+
+        if self._file.closed:
+            return
+
+        self.flush()
+        self._file.close()
+
+
+class ColumnarSink(_Sink):
+    """Write Each Batch Of Results As A `write_columnar` Part Directory.
+
+    Parts Are Named `part-00000`, `part-00001`, ... Inside `path` And Are Complete As Soon As They
+    Appear, See `read_result_parts`.
+
+    Args:
+        path (str): Output Directory. Created If Missing; Parts Of A Previous Run In It Are Removed.
+        columns (List[str], optional): Output Columns, In Order. Defaults to None (All, In Record Order).
+        batch_size (int, optional): Records Per Part. Defaults to 10,000.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        columns: Optional[List[str]] = None,
+        batch_size: int = 10_000
+    ) -> None:
+
+        super().__init__(path, columns=columns, batch_size=batch_size)
+        os.makedirs(path, exist_ok=True)
+
+        for name in os.listdir(path):
+            if name.startswith("part-"):
+                shutil.rmtree(os.path.join(path, name))
+
+        self.parts = 0
+
+    def _write(
+        self,
+        batch: pd.DataFrame
+    ) -> None:
+
+        part = os.path.join(self.path, f"part-{self.parts:05d}")
+
+        # Rename into place so readers never see a partial part.
+        shutil.rmtree(part + ".tmp", ignore_errors=True)
+        write_columnar(batch, part + ".tmp")
+        shutil.rmtree(part, ignore_errors=True)
+        os.replace(part + ".tmp", part)
+        self.parts += 1
+
+
+def read_result_parts(
+    path: str
+) -> pd.DataFrame:
+    """Concatenate The Parts Written By A `ColumnarSink` So Far.
+
+    Args:
+        path (str): Output Directory Of The Sink.
+
+    Returns:
+        pd.DataFrame: Results In Write Order.
+    """
+
+    parts = sorted(
+        name for name in os.listdir(path) if name.startswith("part-") and not name.endswith(".tmp")
+    )
+
+    if not parts:
+        return pd.DataFrame()
+
+    return pd.concat([ColumnarFrame(os.path.join(path, name)).to_frame() for name in parts], ignore_index=True)
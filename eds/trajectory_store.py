@@ -0,0 +1,217 @@
+"""
+    Compact Store Of Daily Trajectories.
+
+    Selected columns of many runs are kept as float32 in one preallocated, memory-mapped
+    (runs x days x variables) `.npy` array, with a JSON index of run keys and lengths. Readers open
+    the array lazily, so single runs can be inspected without loading the rest.
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, Hashable, List, Optional, Sequence, Union
+import numpy as np
+import pandas as pd
+
+
+_ARRAY = "trajectories.npy"
+_INDEX = "index.json"
+
+
+def _encode_key(
+    key: Hashable
+) -> Union[str, int, float, list]:
+
+    return list(key) if isinstance(key, tuple) else key
+
+
+def _decode_key(
+    key: Union[str, int, float, list]
+) -> Hashable:
+
+    return tuple(key) if isinstance(key, list) else key
+
+
+class TrajectoryStore():
+    """Writer Of A Trajectory Store.
+
+    Args:
+        path (str): Store Directory. Created If Missing; An Existing Store Is Overwritten.
+        n_runs (int): Runs To Preallocate, An Upper Bound On The Runs Recorded.
+        n_days (int): Days To Preallocate Per Run; Longer Trajectories Are Truncated.
+        variables (Sequence[str], optional): Recorded Columns. Defaults to ["Sev"].
+        sample_fraction (float, optional): Fraction Of Run Keys Recorded, Chosen By A Hash Of The Key
+            So The Same Runs Are Sampled In Every Order And Process. Defaults to 1.0 (All).
+        seed (int, optional): Sampling Seed. Defaults to 0.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        n_runs: int,
+        n_days: int,
+        variables: Sequence[str] = ["Sev"],
+        sample_fraction: float = 1.0,
+        seed: int = 0
+    ) -> None:
+
+        if not 0 <= sample_fraction <= 1:
+            raise ValueError(f"sample_fraction must be between 0 and 1, got {sample_fraction}.")
+
+        os.makedirs(path, exist_ok=True)
+
+        self.path = path
+        self.variables = list(variables)
+        self.sample_fraction = sample_fraction
+        self.seed = seed
+        self.keys = []
+        self.lengths = []
+        self.array = np.lib.format.open_memmap(
+            os.path.join(path, _ARRAY), mode="w+", dtype=np.float32,
+            shape=(n_runs, n_days, len(self.variables))
+        )
+
+    def sampled(
+        self,
+        key: Hashable
+    ) -> bool:
+        """Whether The Run `key` Is Recorded."""
+
+        if self.sample_fraction >= 1:
+            return True
+
+        digest = hashlib.blake2b(repr((self.seed, key)).encode(), digest_size=8).digest()
+
+        return int.from_bytes(digest, "little") < self.sample_fraction * 2**64
+
+    def append(
+        self,
+        key: Hashable,
+        trajectory: Union[pd.DataFrame, Dict[str, np.ndarray]]
+    ) -> bool:
+        """Record The Selected Columns Of One Run, If `key` Is Sampled.
+
+        Args:
+            key (Hashable): Run Key, A String, Number Or Tuple Of Them, E.g.
+                (info_id, number_applications, genetic_mechanistic).
+            trajectory (Union[pd.DataFrame, Dict[str, np.ndarray]]): Daily Values, With At Least The
+                Recorded Columns.
+
+        Returns:
+            bool: Whether The Run Was Recorded.
+        """
+
+        if not self.sampled(key):
+            return False
+
+        run = len(self.keys)
+
+        if run == self.array.shape[0]:
+            raise ValueError(f"The store holds {run} runs, preallocate more with n_runs.")
+
+        n_days = min(len(trajectory[self.variables[0]]), self.array.shape[1])
+
+        for i, variable in enumerate(self.variables):
+            self.array[run, :n_days, i] = np.asarray(trajectory[variable])[:n_days]
+
+        self.array[run, n_days:] = np.nan
+
+        self.keys.append(key)
+        self.lengths.append(n_days)
+
+        return True
+
+    def close(
+        self
+    ) -> None:
+        """Flush The Array And Write The Index."""
+
+        self.array.flush()
+
+        with open(os.path.join(self.path, _INDEX), "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "variables": self.variables,
+                    "keys": [_encode_key(key) for key in self.keys],
+                    "lengths": self.lengths,
+                },
+                f
+            )
+
+    def __enter__(
+        self
+    ):
+
+        return self
+
+    def __exit__(
+        self,
+        *exc_info
+    ) -> None:
+
+        self.close()
+
+
+class Trajectories():
+    """Lazy, Read-only View Of A Trajectory Store.
+
+    Args:
+        path (str): Store Directory Written By `TrajectoryStore`.
+    """
+
+    def __init__(
+        self,
+        path: str
+    ) -> None:
+
+        with open(os.path.join(path, _INDEX), encoding="utf-8") as f:
+            index = json.load(f)
+
+        self.path = path
+        self.variables = index["variables"]
+        self.keys = [_decode_key(key) for key in index["keys"]]
+        self.lengths = np.asarray(index["lengths"], dtype=np.int64)
+        self.index = {key: run for run, key in enumerate(self.keys)}
+        # Only the recorded runs; the array itself stays on disk.
+        self.array = np.load(os.path.join(path, _ARRAY), mmap_mode="r")[:len(self.keys)]
+
+    def __len__(
+        self
+    ) -> int:
+
+        return len(self.keys)
+
+    def __contains__(
+        self,
+        key: Hashable
+    ) -> bool:
+
+        return key in self.index
+
+    def __getitem__(
+        self,
+        key: Hashable
+    ) -> pd.DataFrame:
+        """Trajectory Of One Run, One Row Per Recorded Day."""
+
+        run = self.index[key]
+
+        return pd.DataFrame(
+            np.asarray(self.array[run, :self.lengths[run]]), columns=self.variables
+        )
+
+    def variable(
+        self,
+        name: str,
+        keys: Optional[List[Hashable]] = None
+    ) -> np.ndarray:
+        """(runs, days) Values Of One Variable, NaN Past Each Run's Length.
+
+        Args:
+            name (str): Recorded Column.
+            keys (List[Hashable], optional): Runs To Read, In Order. Defaults to None (All).
+        """
+
+        runs = slice(None) if keys is None else [self.index[key] for key in keys]
+
+        return np.asarray(self.array[runs, :, self.variables.index(name)])
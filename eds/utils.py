@@ -44,6 +44,48 @@ def calculate_antecedent_precipitation_conditions_score(
     return antecedent_precip_conditions_score
 
 
+def calculate_antecedent_precipitation_conditions_scores(
+    precipitation_occur: Union[pd.Series, np.ndarray]
+) -> np.ndarray:
+    """Calculates The Antecedent Precipitation Conditions Score (1-4) Of Every Day At Once.
+
+    Vectorized Equivalent Of Calling `calculate_antecedent_precipitation_conditions_score` For Each
+    Day, Including The Shorter Windows Over The Last Three Days Of The Series.
+
+    Args:
+        precipitation_occur (Union[pd.Series, np.ndarray]): Boolean Series of Whether or not Significant (Currently >= 2mm) Precipitation Was Recorded for a Day.
+            A 2-D Array Scores Each Row (Season) Independently.
+
+    Returns:
+        np.ndarray: Antecedent Precipitation Conditions Scores, Same Shape As The Input.
+    """
+
+    precipitation_occur = np.asarray(precipitation_occur, dtype=np.float64)
+    n = precipitation_occur.shape[-1]
+
+    # Days past the end of the series are missing, as in the truncated `iloc` window.
+    padded = np.concatenate(
+        [precipitation_occur, np.full(precipitation_occur.shape[:-1] + (3,), np.nan)], axis=-1
+    )
+    counted = np.nan_to_num(padded)
+
+    four_day_sums = counted[..., 0:n] + counted[..., 1:n + 1] + counted[..., 2:n + 2] + counted[..., 3:n + 3]
+
+    two_day = (padded[..., :-1] + padded[..., 1:]) == 2
+    two_day = two_day[..., 0:n] | two_day[..., 1:n + 1] | two_day[..., 2:n + 2]
+
+    three_day = (padded[..., :-2] + padded[..., 1:-1] + padded[..., 2:]) == 3
+    three_day = three_day[..., 0:n] | three_day[..., 1:n + 1]
+
+    antecedent_precip_conditions_scores = np.select(
+        [four_day_sums == 0, four_day_sums == 1, four_day_sums == 2, two_day, three_day],
+        [1, 2, 3, 3, 3],
+        default=4
+    )
+
+    return antecedent_precip_conditions_scores
+
+
 def calculate_fungicide_effective_residual(
     days_after_planting: int,
     fungicide: pd.DataFrame,
@@ -66,8 +108,9 @@ def calculate_fungicide_effective_residual(
     """
 
     fungicide_efficacy_residual = 1.0
-    fungicide["tmp"] = fungicide["spray_moment"] + spray_interval
-    flag = fungicide["spray_moment"] < days_after_planting <= fungicide["tmp"]
+    flag = (fungicide["spray_moment"] < days_after_planting) & (
+        days_after_planting <= fungicide["spray_moment"] + spray_interval
+    )
 
     if flag.any():
         efficacy_residual = fungicide["spray_eff"][flag]
@@ -98,8 +141,9 @@ def calculate_flow_residual(
     """
 
     flow_residual = 0.0
-    fungicide["tmp"] = fungicide["spray_moment"] + spray_interval
-    flag = fungicide["spray_moment"] < days_after_planting <= fungicide["tmp"]
+    flag = (fungicide["spray_moment"] < days_after_planting) & (
+        days_after_planting <= fungicide["spray_moment"] + spray_interval
+    )
 
     if flag.any():
         flow_residual = daily_precipitation
@@ -107,6 +151,143 @@ def calculate_flow_residual(
     return flow_residual
 
 
+def fungicide_spray_arrays(
+    fungicide: pd.DataFrame,
+    spray_interval: int = 7
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Spray Moment, Last Effective Day And Efficacy Of A Fungicide Table.
+
+    Accepts Both The Engine Columns (`spray_eff`, `V4`) And The Output Of
+    `spray_application_parameters` (`spray_efficiency`, No `V4`). Without `V4` A Spray Stays
+    Effective For `spray_interval` Days.
+
+    Args:
+        fungicide (pd.DataFrame): Necessary Columns:
+            `spray_moment`
+            `spray_eff` Or `spray_efficiency`
+            `V4` (Optional)
+        spray_interval (int, optional): Day Interval for Spraying. Defaults to 7.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: float64 Spray Moment, Last Effective Day And Efficacy.
+    """
+
+    if len(fungicide) == 0:
+        return np.zeros(0), np.zeros(0), np.zeros(0)
+
+    spray_moment = fungicide["spray_moment"].to_numpy(dtype=np.float64)
+
+    if "V4" in fungicide:
+        spray_end = fungicide["V4"].to_numpy(dtype=np.float64)
+    else:
+        spray_end = spray_moment + spray_interval
+
+    efficacy = "spray_eff" if "spray_eff" in fungicide else "spray_efficiency"
+
+    return spray_moment, spray_end, fungicide[efficacy].to_numpy(dtype=np.float64)
+
+
+def fungicide_schedule_arrays(
+    spray_moment: np.ndarray,
+    spray_end: np.ndarray,
+    spray_eff: np.ndarray,
+    total_days: int,
+    spray_interval: int = 7
+) -> Dict[str, np.ndarray]:
+    """Per-day Fungicide State For Days 1 To `total_days`.
+
+    The Spray Arrays May Carry Leading Dimensions (E.g. One Row Per Run, Padded With NaN); The
+    Sprays Are On The Last Axis And Are Replaced By The Days In The Result.
+
+    Args:
+        spray_moment (np.ndarray): Spray Day.
+        spray_end (np.ndarray): Last Effective Day Of Each Spray (`V4`).
+        spray_eff (np.ndarray): Spray Efficacy.
+        total_days (int): Number Of Days.
+        spray_interval (int, optional): Day Interval for Spraying. Defaults to 7.
+
+    Returns:
+        Dict[str, np.ndarray]:
+            `spray_active`: A Spray Was Applied Within The Last `spray_interval` Days.
+            `active_efficacy`: Efficacy Of The First Active Spray, 1.0 Otherwise.
+            `spray_current`: A Spray Is Between Its Moment And `V4`.
+            `current_efficacy`: Efficacy Of The First Current Spray, 1.0 Otherwise.
+    """
+
+    spray_moment = np.asarray(spray_moment, dtype=np.float64)[..., None]
+    spray_end = np.asarray(spray_end, dtype=np.float64)[..., None]
+    spray_eff = np.asarray(spray_eff, dtype=np.float64)[..., None]
+    days = np.arange(1, total_days + 1, dtype=np.float64)
+
+    def first_spray(flag: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        if flag.shape[-2] == 0:
+            shape = flag.shape[:-2] + flag.shape[-1:]
+            return np.zeros(shape, dtype=bool), np.ones(shape)
+        first = flag.argmax(axis=-2)[..., None, :]
+        efficacy = np.take_along_axis(np.broadcast_to(spray_eff, flag.shape), first, axis=-2)[..., 0, :]
+        has = flag.any(axis=-2)
+        return has, np.where(has, efficacy, 1.0)
+
+    spray_active, active_efficacy = first_spray(
+        (spray_moment < days) & (days <= spray_moment + spray_interval)
+    )
+    spray_current, current_efficacy = first_spray((spray_moment <= days) & (days <= spray_end))
+
+    return {
+        "spray_active": spray_active,
+        "active_efficacy": active_efficacy,
+        "spray_current": spray_current,
+        "current_efficacy": current_efficacy,
+    }
+
+
+class FungicideSchedule():
+    """Per-day Fungicide State Of One Scenario, Built Once Before The Season Loop.
+
+    Replaces The Daily Filtering Of The Fungicide Table. All Arrays Are Indexed By Day - 1 And Are
+    Read-only, So A Schedule Can Be Shared Between Runs And Threads.
+
+    Args:
+        fungicide (pd.DataFrame): Fungicide Table, See `fungicide_spray_arrays`. Not Modified.
+        precipitation (np.ndarray): Daily Precipitation (mm) Of The Season.
+        spray_interval (int, optional): Day Interval for Spraying. Defaults to 7.
+    """
+
+    __slots__ = (
+        "spray_interval", "spray_active", "active_efficacy", "spray_current", "current_efficacy",
+        "flow_residual",
+    )
+
+    def __init__(
+        self,
+        fungicide: pd.DataFrame,
+        precipitation: np.ndarray,
+        spray_interval: int = 7
+    ) -> None:
+
+        precipitation = np.asarray(precipitation, dtype=np.float64)
+        arrays = fungicide_schedule_arrays(
+            *fungicide_spray_arrays(fungicide, spray_interval),
+            total_days=len(precipitation),
+            spray_interval=spray_interval
+        )
+        arrays["flow_residual"] = np.where(arrays["spray_active"], precipitation, 0.0)
+
+        object.__setattr__(self, "spray_interval", spray_interval)
+
+        for name, values in arrays.items():
+            values.setflags(write=False)
+            object.__setattr__(self, name, values)
+
+    def __setattr__(
+        self,
+        name: str,
+        value: object
+    ) -> None:
+
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+
 def spray_application_parameters(
     spray_number: List[int] = [1, 2, 3],
     spray_moment: List[int] = [30, 45, 60],
@@ -187,6 +368,206 @@ def genetic_mechanistic_parameters(
     return parameters
 
 
+class RTReleaseSchedule():
+    """Infections Waiting Out Their Latent Period, Bucketed By Release Day.
+
+    Each day's infections are added to the bucket of the day they leave the latent stage, so the
+    daily RT is a single lookup instead of a scan over the season. Released values are kept per day
+    for the `REM` lookup.
+    """
+
+    def __init__(
+        self,
+        total_days: int
+    ) -> None:
+
+        self.pending = np.zeros(total_days + 1)
+        self.released = np.zeros(total_days + 1)
+
+    def schedule(
+        self,
+        simulation_day: int,
+        release_day: int,
+        infections: float
+    ) -> None:
+        """Add Infections Of `simulation_day` To The Bucket Of `release_day`.
+
+        Release Days Before `simulation_day` Or Past The End Of The Season Are Never Released.
+        """
+
+        if simulation_day <= release_day < len(self.pending):
+            self.pending[release_day] += infections
+
+    def release(
+        self,
+        simulation_day: int
+    ) -> float:
+        """Release The Bucket Of `simulation_day` And Return Its RT."""
+
+        self.released[simulation_day] = self.pending[simulation_day]
+
+        return self.released[simulation_day]
+
+
+class LookupTable():
+    """Immutable Piecewise-linear Lookup Table With Contiguous float64 Breakpoints.
+
+    Breakpoints Must Be Non-decreasing, As Required By `np.interp`. Values Outside The Breakpoints
+    Are Clamped To The End Values.
+    """
+
+    __slots__ = ("table",)
+
+    def __init__(
+        self,
+        breakpoints: np.ndarray,
+        values: np.ndarray
+    ) -> None:
+
+        table = np.array([breakpoints, values], dtype=np.float64, order="C")
+
+        if table.ndim != 2 or table.shape[1] == 0:
+            raise ValueError("A lookup table needs at least one breakpoint.")
+
+        if np.isnan(table).any():
+            raise ValueError("Lookup table breakpoints and values must not be NaN.")
+
+        if np.any(np.diff(table[0]) < 0):
+            raise ValueError(f"Lookup table breakpoints must be non-decreasing, got {table[0].tolist()}.")
+
+        table.setflags(write=False)
+        object.__setattr__(self, "table", table)
+
+    def __setattr__(
+        self,
+        name: str,
+        value: object
+    ) -> None:
+
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    @classmethod
+    def from_frame(
+        cls,
+        table: pd.DataFrame
+    ) -> "LookupTable":
+        """Compile A Two-column (`0`: Breakpoints, `1`: Values) Table From `CropParameters`.
+
+        An Empty Table (E.g. The Default `fungicide_residual`) Compiles To A Constant Zero.
+        """
+
+        if len(table) == 0:
+            return cls([0.0], [0.0])
+
+        return cls(table[0].to_numpy(dtype=np.float64), table[1].to_numpy(dtype=np.float64))
+
+    @property
+    def breakpoints(
+        self
+    ) -> np.ndarray:
+
+        return self.table[0]
+
+    @property
+    def values(
+        self
+    ) -> np.ndarray:
+
+        return self.table[1]
+
+    def __call__(
+        self,
+        x: Union[float, np.ndarray]
+    ) -> Union[float, np.ndarray]:
+        """Interpolate At `x`, A Scalar Or An Array Of Any Shape."""
+
+        return np.interp(x, self.table[0], self.table[1])
+
+
+class CropLookupTables():
+    """Compiled Crop-specific Lookup Tables.
+
+    Args:
+        ip_t_cof (pd.DataFrame): Crop-specific Lookup Table, Indexed On Temperature (Degrees C).
+        p_t_cof (pd.DataFrame): Crop-specific Lookup Table, Indexed On Temperature (Degrees C).
+        rc_t_input (pd.DataFrame): Crop-specific Lookup Table, Indexed On Temperature (Degrees C).
+        dvs_8_input (pd.DataFrame): Crop Specific Lookup Table, Indexed On Cumulative GDUs.
+        rc_a_input (pd.DataFrame): Crop-specific Lookup Table, Indexed On DVS 8.
+        fungicide_residual (pd.DataFrame, optional): Crop-specific Lookup Table. Defaults to pd.DataFrame().
+    """
+
+    __slots__ = ("ip_t_cof", "p_t_cof", "rc_t_input", "dvs_8_input", "rc_a_input", "fungicide_residual")
+
+    def __init__(
+        self,
+        ip_t_cof: Union[pd.DataFrame, LookupTable],
+        p_t_cof: Union[pd.DataFrame, LookupTable],
+        rc_t_input: Union[pd.DataFrame, LookupTable],
+        dvs_8_input: Union[pd.DataFrame, LookupTable],
+        rc_a_input: Union[pd.DataFrame, LookupTable],
+        fungicide_residual: Union[pd.DataFrame, LookupTable] = pd.DataFrame(),
+    ) -> None:
+
+        tables = dict(
+            ip_t_cof=ip_t_cof,
+            p_t_cof=p_t_cof,
+            rc_t_input=rc_t_input,
+            dvs_8_input=dvs_8_input,
+            rc_a_input=rc_a_input,
+            fungicide_residual=fungicide_residual,
+        )
+
+        for name, table in tables.items():
+            try:
+                compiled = table if isinstance(table, LookupTable) else LookupTable.from_frame(table)
+            except ValueError as e:
+                raise ValueError(f"{name}: {e}") from e
+            object.__setattr__(self, name, compiled)
+
+    def __setattr__(
+        self,
+        name: str,
+        value: object
+    ) -> None:
+
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    @classmethod
+    def from_crop_parameters(
+        cls,
+        crop_parameters: Dict[str, pd.DataFrame]
+    ) -> "CropLookupTables":
+        """Compile The Tables Of One Crop From `CropParameters.crop_parameters_constant()`."""
+
+        return cls(**{name: crop_parameters.get(name, pd.DataFrame()) for name in cls.__slots__})
+
+    def temperature_coefficients(
+        self,
+        temperature: np.ndarray,
+        ip_opt: Union[float, np.ndarray],
+        p_opt: Union[float, np.ndarray],
+    ) -> Dict[str, np.ndarray]:
+        """Temperature-driven Coefficients For A Whole Season In One Call.
+
+        Args:
+            temperature (np.ndarray): Daily Mean Temperature (Degrees C), Any Shape.
+            ip_opt (Union[float, np.ndarray]): Optimal Infectious Period, Broadcast Against `temperature`.
+            p_opt (Union[float, np.ndarray]): Optimal Latent Period, Broadcast Against `temperature`.
+
+        Returns:
+            Dict[str, np.ndarray]: Daily `ip`, `p` And `RcT`.
+        """
+
+        temperature = np.asarray(temperature, dtype=np.float64)
+
+        with np.errstate(divide="ignore"):
+            return {
+                "ip": ip_opt * self.ip_t_cof(temperature),
+                "p": p_opt / self.p_t_cof(temperature),
+                "RcT": self.rc_t_input(temperature),
+            }
+
+
 class CropParameters():
 
     def __init__(
@@ -201,6 +582,14 @@ class CropParameters():
     def crop_parameters_constant(
         self
     ) -> Dict:
+        """Built-in Crop Parameters, Shared And Read-only, See `parameter_registry`."""
+
+        from .parameter_registry import constant_crop_parameters
+
+        return constant_crop_parameters(self._constant_tables)
+
+    @staticmethod
+    def _constant_tables() -> Dict:
 
         parameters = {
             "Corn": {
@@ -315,20 +704,14 @@ class CropParameters():
     def crop_parameters_from_file(
         self
     ) -> Dict:
+        """Crop Parameters From One Workbook Per Crop, Shared And Read-only, See `parameter_registry`."""
+
+        from .parameter_registry import load_crop_parameters
+
+        if (self.crop_parameters_path is None) or (self.crop_name is None):
+            return dict()
+
+        if len(self.crop_name) != len(self.crop_parameters_path):
+            return dict()
 
-        parameters = ["ip_t_cof", "p_t_cof", "rc_t_input", "dvs_8_input", "rc_a_input", "fungicide", "fungicide_residual"]
-
-        crop_parameters = dict()
-
-        if (self.crop_parameters_path is not None) and (self.crop_name is not None):
-            if len(self.crop_name) == len(self.crop_parameters_path):
-                for i in range(len(self.crop_name)):
-                    crop_parameters[self.crop_name[i]] = dict()
-                    for p in parameters:
-                        crop_parameters[self.crop_name[i]][p] = pd.read_excel(
-                            self.crop_parameters_path[i],
-                            engine="openpyxl",
-                            sheet_name=p,
-                            header=None
-                        )
-        return crop_parameters
+        return load_crop_parameters(self.crop_name, self.crop_parameters_path)
@@ -19,9 +19,12 @@ setup(
     license='GPLv3', 
     classifiers=classifiers,
     keywords='Disease', 
-    packages=find_packages(),
+    packages=find_packages(exclude=['benchmarks', 'benchmarks.*']),
     install_requires=[
         'numpy',
         'pandas'
-    ] 
+    ],
+    extras_require={
+        'numba': ['numba']
+    }
 )
\ No newline at end of file
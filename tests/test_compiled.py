@@ -0,0 +1,114 @@
+"""
+    The Compiled Season Loop Kernel Against `simulate_disease_severity`, Day By Day.
+
+    `simulate_disease_severity_compiled` Is A Statement-for-statement Copy Of The Array Engine's Loop;
+    These Tests Run Both On Randomized Weather, Seasons And Fungicide Tables And Require Identical
+    Rows From The Plain Python Build, So The Copies Cannot Drift Apart Unnoticed. With Numba Installed,
+    The Compiled Build Is Checked Too, To `ARRAY_ENGINE_TOLERANCE`: Its `np.power` Can Differ From
+    NumPy's In The Last Bit.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+import eds
+from eds.estimate_disease_severity_array import (
+    ARRAY_ENGINE_TOLERANCE, VARIABLES, _simulation_inputs, simulate_disease_severity
+)
+from eds.estimate_disease_severity_compiled import NUMBA_AVAILABLE, simulate_disease_severity_compiled
+
+
+FUNGICIDE_RESIDUAL = pd.DataFrame([[0.0, 0.8], [50.0, 0.5], [100.0, 0.2]])
+
+KERNELS = [getattr(simulate_disease_severity_compiled, "py_func", simulate_disease_severity_compiled)]
+
+if NUMBA_AVAILABLE:
+    KERNELS.append(simulate_disease_severity_compiled)
+
+
+def _inputs(
+    seed: int,
+    number_applications: int,
+    total_days: int = 160,
+    p_t_cof: pd.DataFrame = None
+):
+
+    rng = np.random.default_rng(seed)
+    precip = np.where(rng.random(total_days) < 0.3, rng.gamma(1.5, 6.0, total_days), 0.0)
+    weather_df = pd.DataFrame({
+        "Temperature": rng.uniform(8.0, 34.0, total_days),
+        "precip": precip,
+        "precip_occur": (precip >= 2).astype(int),
+    })
+    crop = eds.CropParameters().crop_parameters_constant()["Corn"]
+    genetic = eds.genetic_mechanistic_parameters()[["Susceptible", "Moderate", "Resistant"][seed % 3]]
+    sprays = eds.spray_application_parameters()
+
+    inputs = _simulation_inputs(
+        weather_df=weather_df,
+        ip_t_cof=crop["ip_t_cof"],
+        p_t_cof=crop["p_t_cof"] if p_t_cof is None else p_t_cof,
+        rc_t_input=crop["rc_t_input"],
+        dvs_8_input=crop["dvs_8_input"],
+        rc_a_input=crop["rc_a_input"],
+        p_opt=genetic["p_opt"],
+        ip_opt=14,
+        is_fungicide=number_applications > 0,
+        fungicide=sprays[sprays["spray_number"] <= number_applications],
+        fungicide_residual=FUNGICIDE_RESIDUAL,
+    )
+
+    return dict(
+        **inputs,
+        p_opt=float(genetic["p_opt"]),
+        inocp=10.0,
+        rrlex_par=float(genetic["rrlex_par"]),
+        rc_opt_par=float(genetic["rc_opt_par"]),
+        ip_opt=14.0,
+        GDU_treshhold=10.0,
+        is_fungicide=number_applications > 0,
+    )
+
+
+@pytest.mark.parametrize("kernel", KERNELS, ids=["python", "numba"][:len(KERNELS)])
+@pytest.mark.parametrize("number_applications", [0, 1, 3])
+@pytest.mark.parametrize("days_after_planting", [1, 40, 120, 200])
+@pytest.mark.parametrize("seed", range(3))
+def test_kernel_matches_array_loop(kernel, number_applications, days_after_planting, seed):
+
+    inputs = _inputs(seed, number_applications)
+    total_days = len(inputs["temperature"])
+    expected_out, expected_ri = np.empty((total_days, len(VARIABLES))), np.zeros(total_days)
+    out, ri = np.empty((total_days, len(VARIABLES))), np.zeros(total_days)
+
+    expected = simulate_disease_severity(
+        **inputs, days_after_planting=days_after_planting, out=expected_out, ri=expected_ri
+    )
+    result = kernel(**inputs, days_after_planting=days_after_planting, out=out, ri=ri)
+
+    assert tuple(result) == tuple(expected)
+
+    if kernel is simulate_disease_severity_compiled:
+        # Relative to each column's scale: differences like `RG` pass through zero.
+        pairs = [(out[:result[0]], expected_out[:expected[0]]), (ri[:result[0], None], expected_ri[:expected[0], None])]
+        for actual, desired in pairs:
+            scale = np.nanmax(np.abs(desired), axis=0, initial=0.0)
+            close = np.abs(actual - desired) <= ARRAY_ENGINE_TOLERANCE * scale
+            assert np.all(close | (np.isnan(actual) & np.isnan(desired)))
+    else:
+        np.testing.assert_array_equal(out[:result[0]], expected_out[:expected[0]])
+        np.testing.assert_array_equal(ri[:result[0]], expected_ri[:expected[0]])
+
+
+@pytest.mark.parametrize("kernel", KERNELS, ids=["python", "numba"][:len(KERNELS)])
+def test_kernel_raises_like_array_loop_on_infinite_p(kernel):
+
+    # `p_t_cof` Of 0 Below 15 Degrees C Gives An Infinite Latent Period On Cold Days.
+    inputs = _inputs(0, 0, p_t_cof=pd.DataFrame([[15.0, 0.0], [16.0, 0.6], [25.0, 1.0]]))
+    total_days = len(inputs["temperature"])
+
+    for simulate in (simulate_disease_severity, kernel):
+        with pytest.raises(OverflowError):
+            simulate(
+                **inputs, days_after_planting=120, out=np.empty((total_days, len(VARIABLES))), ri=np.zeros(total_days)
+            )
@@ -0,0 +1,71 @@
+"""
+    `estimate_disease_severity_forked` Against `estimate_disease_severity_array`, One Scenario At A Time.
+"""
+
+import os
+import pandas as pd
+import pytest
+import eds
+from eds.estimate_disease_severity_array import estimate_disease_severity_array, estimate_disease_severity_forked
+from eds.field_data_preparation import field_data_preparation
+
+
+GOLDEN_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "golden")
+
+# Residual Efficacy Below 1 Before Any Spray, Unlike The Built-in Crop Tables.
+FUNGICIDE_RESIDUAL = pd.DataFrame([[0.0, 0.8], [50.0, 0.5], [100.0, 0.2]])
+
+
+@pytest.fixture(scope="module")
+def arguments():
+
+    data = field_data_preparation(
+        os.path.join(GOLDEN_DIRECTORY, "weather.csv"), os.path.join(GOLDEN_DIRECTORY, "plantings.csv"), date_format=None
+    )
+    weather_df = data[data["info_id"] == data["info_id"].iloc[0]].reset_index(drop=True)
+    crop = eds.CropParameters().crop_parameters_constant()["Corn"]
+    genetic = eds.genetic_mechanistic_parameters()["Susceptible"]
+
+    return dict(
+        weather_df=weather_df,
+        ip_t_cof=crop["ip_t_cof"],
+        p_t_cof=crop["p_t_cof"],
+        rc_t_input=crop["rc_t_input"],
+        dvs_8_input=crop["dvs_8_input"],
+        rc_a_input=crop["rc_a_input"],
+        p_opt=genetic["p_opt"],
+        rrlex_par=genetic["rrlex_par"],
+        rc_opt_par=genetic["rc_opt_par"],
+        inocp=10,
+        ip_opt=14,
+        GDU_treshhold=10,
+        days_after_planting=99,
+    )
+
+
+@pytest.mark.parametrize("fungicide_residual", [pd.DataFrame(), FUNGICIDE_RESIDUAL], ids=["default", "residual"])
+def test_forked_matches_array_per_scenario(arguments, fungicide_residual):
+
+    sprays = eds.spray_application_parameters()
+    fungicides = [None, sprays[sprays["spray_number"] <= 1], None, sprays[sprays["spray_number"] <= 2]]
+
+    results = estimate_disease_severity_forked(**arguments, fungicides=fungicides, fungicide_residual=fungicide_residual)
+
+    for fungicide, (trajectory, day) in zip(fungicides, results):
+        expected, expected_day = estimate_disease_severity_array(
+            **arguments,
+            is_fungicide=fungicide is not None,
+            fungicide=fungicide if fungicide is not None else pd.DataFrame(),
+            fungicide_residual=fungicide_residual,
+        )
+        assert day == expected_day
+        pd.testing.assert_frame_equal(trajectory, expected, check_exact=True)
+
+
+def test_forked_defaults_match_array(arguments):
+
+    [(trajectory, day)] = estimate_disease_severity_forked(**arguments)
+    expected, expected_day = estimate_disease_severity_array(**arguments)
+
+    assert day == expected_day
+    pd.testing.assert_frame_equal(trajectory, expected, check_exact=True)
@@ -0,0 +1,27 @@
+"""
+    Every Engine Against The Golden Dataset Of The Reference Engine, See `eds.check_golden_dataset`.
+"""
+
+import os
+import pytest
+import eds
+
+
+GOLDEN_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "golden")
+
+ENGINES = ["reference", "array", "compiled", "batch", "scenarios", "forked", "summary"]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_golden_dataset(engine):
+
+    report = eds.check_golden_dataset(
+        GOLDEN_DIRECTORY,
+        eds.CropParameters().crop_parameters_constant(),
+        eds.spray_application_parameters(),
+        eds.genetic_mechanistic_parameters(),
+        engines=[engine],
+    )
+
+    assert len(report) > 0
+    assert report["passed"].all()